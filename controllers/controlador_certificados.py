@@ -174,8 +174,9 @@ class ControladorCertificados(QWidget):
             self.combo_filtro.blockSignals(True)
             self.combo_filtro.clear()
             self.combo_filtro.addItem("Todos los Cursos", None)
-            for c in self.model_curso.search(order_by=text("fecha_inicio desc")):
-                self.combo_filtro.addItem(c.nombre, c.id)
+            for curso_id, nombre in self.model_curso.search_columns(
+                    ("id", "nombre"), order_by=text("fecha_inicio desc")):
+                self.combo_filtro.addItem(nombre, curso_id)
             self.combo_filtro.blockSignals(False)
         except:
             pass
@@ -21,6 +21,9 @@ from database.models import Persona
 from models.tipos_cert_model import TipoCertificadoModel
 from database import config
 
+# Variables del .env que definen la conexión a la base de datos
+_CLAVES_CONEXION = ("DB_TYPE", "DB_HOST", "DB_PORT", "DB_NAME_REMOTE", "DB_USER", "DB_PASS")
+
 
 class ControladorConfiguraciones(QWidget):
     """
@@ -158,11 +161,16 @@ class ControladorConfiguraciones(QWidget):
         - Credenciales de conexión (si aplica).
         - Ruta de la carpeta compartida.
 
-        Notifica al usuario que debe reiniciar para aplicar cambios.
+        Emite ``configuracion_guardada`` con los valores guardados para que la
+        aplicación reconecte sin reiniciarse; quien la atiende informa el
+        resultado con ``resultado_configuracion``.
         """
         tipo_bd = "sqlite" if self.radioBtn_Local.isChecked() else "postgresql"
+        # Valores previos de la conexión, para restaurarlos si la nueva no se aplica
+        self._config_anterior = {clave: os.environ.get(clave) for clave in _CLAVES_CONEXION}
         try:
             config.actualizar_env("DB_TYPE", tipo_bd)
+            nueva_config = {"DB_TYPE": tipo_bd}
 
             if tipo_bd == "postgresql":
                 config.actualizar_env("DB_HOST", self.lineEdit_Url.text().strip())
@@ -170,17 +178,38 @@ class ControladorConfiguraciones(QWidget):
                 config.actualizar_env("DB_NAME_REMOTE", self.lineEdit_NombreBD.text().strip())
                 config.actualizar_env("DB_USER", self.lineEdit_Usuario.text().strip())
                 config.actualizar_env("DB_PASS", self.lineEdit_Password.text())
+                nueva_config["DB_HOST"] = self.lineEdit_Url.text().strip()
 
             # --- NUEVO: Guardar la ruta compartida ---
             ruta_compartida = self.lineEdit_CarpetaCompartida.text().strip()
             if ruta_compartida:
                 config.actualizar_env("SHARED_FOLDER_PATH", ruta_compartida)
+                nueva_config["SHARED_FOLDER_PATH"] = ruta_compartida
 
-            QMessageBox.information(self, "Éxito",
-                                    "Configuración guardada en .env.\nReinicie la aplicación para aplicar los cambios.")
+            self.configuracion_guardada.emit(nueva_config)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"No se pudo guardar: {e}")
 
+    def resultado_configuracion(self, exito: bool, mensaje: str = ""):
+        """Informa si la configuración guardada pudo aplicarse.
+
+        Si falló, la aplicación sigue con la base anterior y los datos de
+        conexión del .env se restauran a sus valores previos.
+
+        Args:
+            exito (bool): True si la aplicación quedó conectada a la nueva base.
+            mensaje (str, optional): Detalle del error.
+        """
+        if exito:
+            QMessageBox.information(self, "Éxito", "Configuración guardada en .env y aplicada.")
+            return
+
+        config.restaurar_env(getattr(self, "_config_anterior", {}))
+        QMessageBox.critical(
+            self, "Error",
+            f"{mensaje}\n\nSe mantiene la conexión anterior y no se guardaron los datos de conexión."
+        )
+
     # --- (Los métodos de certificados e instituciones se mantienen idénticos a tu original) ---
     def cargar_tipos_certificados(self):
         """Carga y lista los tipos de certificados disponibles en la base de datos."""
@@ -226,7 +255,7 @@ class ControladorConfiguraciones(QWidget):
 
         if confirm == QMessageBox.StandardButton.Yes:
             try:
-                if self.tipo_cert_model.delete(cert_id):
+                if self.tipo_cert_model.delete_fast(cert_id):
                     self.cargar_tipos_certificados()
                     QMessageBox.information(self, "Éxito", "Certificado eliminado.")
             except Exception as e:
@@ -393,7 +393,7 @@ class ControladorDetalleCurso(QWidget):
         }
 
         try:
-            exito = self.curso_model.update(self.curso.id, datos_actualizados)
+            exito = self.curso_model.update_fast(self.curso.id, datos_actualizados)
 
             if exito:
                 self.curso = self.curso_model.get_by_id(self.curso.id)
@@ -442,7 +442,7 @@ class ControladorDetalleCurso(QWidget):
             return
 
         try:
-            self.matricula_model.delete(id_matricula)
+            self.matricula_model.delete_fast(id_matricula)
 
             # Actualizamos también el Master porque cambia la cantidad de estudiantes
             self._actualizar_master()
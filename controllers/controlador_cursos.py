@@ -62,6 +62,7 @@ class ControladorCursos(QWidget):
         self.pagina_actual = 1
         self.total_registros = 0
         self.total_paginas = 1
+        self._page_cursors: list[tuple] = []  # Último (nombre, id) de cada página cargada
 
         # 1. Delegado de VER DETALLE (Columna 0)
         self.delegado_detalle = BotonDetalleDelegate(
@@ -115,6 +116,7 @@ class ControladorCursos(QWidget):
         Limpia el campo de búsqueda si existe.
         """
         self.pagina_actual = 1
+        self._page_cursors.clear()
         if hasattr(self, 'input_buscar'):
             self.input_buscar.clear()
         self.cargar_datos_tabla()
@@ -125,6 +127,7 @@ class ControladorCursos(QWidget):
         Reinicia la paginación a la primera página cada vez que cambia el filtro.
         """
         self.pagina_actual = 1
+        self._page_cursors.clear()
         self.cargar_datos_tabla()
 
     # ---------------- FORMATO TABLA ----------------
@@ -222,29 +225,48 @@ class ControladorCursos(QWidget):
             if self.pagina_actual > self.total_paginas:
                 self.pagina_actual = self.total_paginas
 
-            offset = (self.pagina_actual - 1) * self.registros_por_pagina
+            # Keyset: si conocemos el cursor de la página previa saltamos por índice;
+            # si no (salto a una página arbitraria) usamos OFFSET como respaldo.
+            columnas_cursor = ("nombre", "id")
+            paginacion = {}
+            if self.pagina_actual > 1 and len(self._page_cursors) >= self.pagina_actual - 1:
+                paginacion["after"] = self._page_cursors[self.pagina_actual - 2]
+                paginacion["cursor_columns"] = columnas_cursor
+            else:
+                paginacion["offset"] = (self.pagina_actual - 1) * self.registros_por_pagina
 
             # Obtener registros de la página actual
             cursos = self.model_curso.search(
-                order_by="nombre",
+                order_by=columnas_cursor,
                 limit=self.registros_por_pagina,
-                offset=offset,
-                or_fields=or_fields
+                or_fields=or_fields,
+                **paginacion
             )
 
+            # Recordar el cursor de esta página para avanzar a la siguiente
+            del self._page_cursors[self.pagina_actual - 1:]
+            cursor = self.model_curso.cursor_de(cursos[-1] if cursos else None, columnas_cursor)
+            if cursor and len(self._page_cursors) == self.pagina_actual - 1:
+                self._page_cursors.append(cursor)
+
         except Exception as e:
             print(f"Error cargando datos: {e}")
             tabla.setUpdatesEnabled(True)
             return
 
         filas = []
+        # Un conteo por curso de la página, todos sobre la misma conexión
+        with self.model_curso.sesion_lectura() as session:
+            inscritos_por_curso = {
+                curso.id: self.model_curso.estudiantes_inscritos(curso.id, session) for curso in cursos
+            }
+
         for curso in cursos:
             f_inicio = curso.fecha_inicio.strftime("%d/%m/%Y") if curso.fecha_inicio else ""
             f_fin = curso.fecha_final.strftime("%d/%m/%Y") if curso.fecha_final else ""
             duracion = f"{curso.duracion_horas}h" if curso.duracion_horas else ""
             modalidad = getattr(curso, 'modalidad', "")
-            inscritos = str(self.model_curso.estudiantes_inscritos(curso.id)) if hasattr(self.model_curso,
-                                                                                         'estudiantes_inscritos') else "0"
+            inscritos = str(inscritos_por_curso.get(curso.id, 0))
 
             filas.append([
                 curso.id,  # Col 0: ID para botón detalle
@@ -330,7 +352,7 @@ class ControladorCursos(QWidget):
 
         if confirmacion2 == QMessageBox.StandardButton.Yes:
             try:
-                exito = self.model_curso.delete(id_curso)
+                exito = self.model_curso.delete_fast(id_curso)
                 if exito:
                     QMessageBox.information(self, "Eliminado", "El curso ha sido eliminado correctamente.")
                     self.recargar_datos()
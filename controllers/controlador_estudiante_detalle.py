@@ -85,21 +85,24 @@ class ControladorDetalleEstudiante(QWidget):
             print(f"Error cargando UI: {e}")
 
         # 2. Resolución segura de widgets
-        self.tabla = getattr(self, 'tabla_matriculas', None)
-        if not self.tabla:
-            self.tabla = self.findChild(QTableWidget, 'tabla_matriculas')
+        # Un único recorrido del árbol de widgets en lugar de un findChild por campo.
+        by_name = {
+            w.objectName(): w
+            for w in self.findChildren((QLineEdit, QComboBox, QPushButton, QTableWidget, QLabel))
+        }
 
-        self.input_buscar = getattr(self, 'input_buscar', self.findChild(QLineEdit, 'input_buscar'))
+        self.tabla = getattr(self, 'tabla_matriculas', None) or by_name.get('tabla_matriculas')
+        self.input_buscar = getattr(self, 'input_buscar', None) or by_name.get('input_buscar')
 
         # Resolución de campos básicos (QLineEdit)
-        self.input_nombre = getattr(self, 'input_nombre', self.findChild(QLineEdit, 'input_nombre'))
-        self.input_cedula = getattr(self, 'input_cedula', self.findChild(QLineEdit, 'input_cedula'))
-        self.input_correo = getattr(self, 'input_correo', self.findChild(QLineEdit, 'input_correo'))
+        self.input_nombre = getattr(self, 'input_nombre', None) or by_name.get('input_nombre')
+        self.input_cedula = getattr(self, 'input_cedula', None) or by_name.get('input_cedula')
+        self.input_correo = getattr(self, 'input_correo', None) or by_name.get('input_correo')
 
         # Resolución de campos adicionales (QComboBox)
-        self.input_rol = self.findChild(QComboBox, 'input_rol')
-        self.input_centro = self.findChild(QComboBox, 'input_centro')
-        self.input_institucion = self.findChild(QComboBox, 'input_institucion')
+        self.input_rol = by_name.get('input_rol')
+        self.input_centro = by_name.get('input_centro')
+        self.input_institucion = by_name.get('input_institucion')
 
         # 3. Delegado eliminar
         self.delegado_eliminar = BotonDetalleDelegate(
@@ -317,8 +320,9 @@ class ControladorDetalleEstudiante(QWidget):
     def guardar_cambios(self):
         """Valida los datos y actualiza el registro del estudiante.
 
-        Realiza validaciones de campos obligatorios, formato de cédula y correo.
-        Maneja errores de integridad (duplicados).
+        Realiza validaciones de campos obligatorios, formato de cédula y correo,
+        y verifica duplicados con una consulta previa. El IntegrityError se
+        conserva como respaldo.
         """
         # Recolección de datos
         nombre = self.input_nombre.text().strip().upper() if self.input_nombre else ""
@@ -359,10 +363,18 @@ class ControladorDetalleEstudiante(QWidget):
         }
 
         try:
-            exito = self.persona_model.update(self.estudiante.id, datos_actualizados)
+            # 4. Unicidad de cédula/correo (evita el IntegrityError y su rollback)
+            if self.persona_model.exists_other(cedula=cedula, correo=correo, exclude_id=self.estudiante.id):
+                QMessageBox.warning(self, "Error", "La cédula o el correo ya existen en otro registro.")
+                return
+
+            exito = self.persona_model.update_fast(self.estudiante.id, datos_actualizados)
 
             if exito:
-                self.estudiante = self.persona_model.get_by_id(self.estudiante.id)
+                # Refrescamos la copia local sin otra consulta a la BD;
+                # los demás interesados se enteran por signal_actualizado.
+                for campo, valor in datos_actualizados.items():
+                    setattr(self.estudiante, campo, valor)
                 QMessageBox.information(self, "Éxito", "Datos actualizados correctamente.")
                 self.signal_actualizado.emit()
 
@@ -374,6 +386,7 @@ class ControladorDetalleEstudiante(QWidget):
                 QMessageBox.warning(self, "Error", "No se encontró el registro para actualizar.")
 
         except IntegrityError:
+            # Respaldo ante carreras entre la verificación previa y el UPDATE
             QMessageBox.critical(self, "Error", "La cédula o el correo ya existen en otro registro.")
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -452,16 +465,9 @@ class ControladorDetalleEstudiante(QWidget):
 
             filas = []
             for m in matriculas:
-                # FIX: Detached Instance Error en 'm.curso'
-                # La sesión se cerró al terminar .search(), por lo que la relación m.curso
-                # no puede cargarse (Lazy Load). Usamos el curso_id para obtenerlo explícitamente.
-                curso = None
-                curso_id = getattr(m, 'curso_id', None)
-                if curso_id:
-                    try:
-                        curso = self.curso_model.get_by_id(curso_id)
-                    except Exception:
-                        curso = None
+                # MatriculaModel.search carga el curso de forma anticipada (joinedload):
+                # sigue disponible con la sesión cerrada, sin una consulta por fila.
+                curso = m.curso
 
                 centro = "Sin Asignar"
 
@@ -471,14 +477,19 @@ class ControladorDetalleEstudiante(QWidget):
                     except:
                         pass
 
-                filas.append([
-                    m.id,
-                    curso.nombre if curso else "-",
-                    curso.tipo_curso if curso else "-",
-                    curso.modalidad if curso else "-",
-                    f"{curso.duracion_horas} hrs" if curso else "-",
-                    centro
-                ])
+                # Fila inmutable con los textos ya formateados: la tabla solo
+                # muestra los valores, sin conversiones adicionales por celda.
+                if curso:
+                    filas.append((
+                        m.id,
+                        curso.nombre or "-",
+                        curso.tipo_curso or "-",
+                        curso.modalidad or "-",
+                        f"{curso.duracion_horas} hrs",
+                        centro or "Sin Asignar"
+                    ))
+                else:
+                    filas.append((m.id, "-", "-", "-", "-", centro or "Sin Asignar"))
 
             PyQtHelper.cargar_datos_en_tabla(
                 self.tabla,
@@ -506,7 +517,7 @@ class ControladorDetalleEstudiante(QWidget):
             return
 
         try:
-            self.matricula_model.delete(id_matricula)
+            self.matricula_model.delete_fast(id_matricula)
             QMessageBox.information(self, "Éxito", "Matrícula eliminada.")
             self.cargar_datos_tabla()
             self.signal_actualizado.emit()
@@ -1,8 +1,10 @@
 #  Copyright (c) 2026 Fleer
 import os
 from PyQt6 import uic
-from PyQt6.QtWidgets import QWidget, QMessageBox, QTableWidget, QLineEdit, QLabel, QPushButton
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QMessageBox, QTableView, QLineEdit, QLabel, QPushButton
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QTimer, QObject, QRunnable, QThreadPool
+)
 from PyQt6.QtGui import QIcon
 
 # --- IMPORTACIONES DEL PROYECTO ---
@@ -19,6 +21,119 @@ from utilities.delegado import BotonDetalleDelegate
 from utilities.helper import PyQtHelper, actualizar_paginacion_ui
 from utilities.dialogos import DialogoMatricula
 
+# Iconos de los botones de la tabla: se decodifican una sola vez y se comparten
+# entre todas las instancias del controlador y todos los eventos de pintado.
+_ICONS = None
+
+
+def _icons() -> dict[str, QIcon]:
+    """Devuelve (creándolos la primera vez) los iconos de los delegados de la tabla."""
+    global _ICONS
+    if _ICONS is None:
+        _ICONS = {
+            "detalle": QIcon("assets/icons/ver-detalles.png"),
+            "matricular": QIcon("assets/icons/matricular.png"),
+            "borrar": QIcon("assets/icons/delete.png"),
+        }
+    return _ICONS
+
+
+# ---------------- MODELO DE TABLA ----------------
+class EstudiantesTableModel(QAbstractTableModel):
+    """Modelo de solo lectura para el listado paginado de estudiantes.
+
+    Cada fila se guarda como una tupla inmutable de textos ya formateados
+    ``(id, nombre, cedula, correo, centro, institucion)``. Las tres primeras
+    columnas de la vista son botones (delegados) y solo exponen el ID mediante
+    ``UserRole``; el resto se resuelve por posición sin crear ítems por celda.
+    """
+
+    COLUMNAS_BOTON = 3
+    # Columna de la vista -> posición en la tupla de la fila (None = columna de botón)
+    _col_map = (None, None, None, 1, 2, 3, 4, 5)
+    _ALINEACION = Qt.AlignmentFlag.AlignCenter
+
+    def __init__(self, headers: list[str], parent=None):
+        """Inicializa el modelo vacío.
+
+        Args:
+            headers (list[str]): Títulos de las columnas de la vista.
+            parent (QObject, optional): Objeto padre.
+        """
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: list[tuple] = []
+
+    def set_rows(self, rows: list[tuple]):
+        """Reemplaza el contenido del modelo y notifica a la vista.
+
+        Args:
+            rows (list[tuple]): Filas preformateadas de la página actual.
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """Cantidad de filas de la página actual."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Cantidad de columnas (botones + datos)."""
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Devuelve texto, alineación o ID según el rol; None para el resto."""
+        if role == Qt.ItemDataRole.DisplayRole:
+            pos = self._col_map[index.column()]
+            return None if pos is None else self._rows[index.row()][pos]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._ALINEACION
+        if role == Qt.ItemDataRole.UserRole:
+            # Los delegados de botón leen el ID desde aquí
+            return self._rows[index.row()][0]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Devuelve el título de la columna horizontal solicitada."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
+
+# ---------------- CARGA EN SEGUNDO PLANO ----------------
+class _EstudiantesFetchSignals(QObject):
+    """Señales del trabajador de carga (QRunnable no hereda de QObject)."""
+    finished = pyqtSignal(int, object)  # (epoch, resultado)
+    failed = pyqtSignal(int, str)  # (epoch, mensaje)
+
+
+class _EstudiantesFetch(QRunnable):
+    """Ejecuta las consultas de una página de estudiantes fuera del hilo de la UI.
+
+    Cada carga lleva un ``epoch``; el controlador descarta los resultados cuyo
+    epoch ya no es el vigente (búsquedas o páginas superadas por otra petición).
+    """
+
+    def __init__(self, epoch: int, tarea):
+        """Prepara el trabajador.
+
+        Args:
+            epoch (int): Número de la petición que originó la carga.
+            tarea (callable): Función sin argumentos que ejecuta las consultas.
+        """
+        super().__init__()
+        self.epoch = epoch
+        self.tarea = tarea
+        self.signals = _EstudiantesFetchSignals()
+
+    def run(self):
+        """Ejecuta la tarea y emite el resultado o el error."""
+        try:
+            self.signals.finished.emit(self.epoch, self.tarea())
+        except Exception as e:
+            self.signals.failed.emit(self.epoch, str(e))
+
 
 # ---------------- CONTROLADOR PRINCIPAL ----------------
 class ControladorEstudiantes(QWidget):
@@ -56,26 +171,30 @@ class ControladorEstudiantes(QWidget):
         self.pagina_actual = 1
         self.total_registros = 0
         self.total_paginas = 1
+        self._count_cache: dict[str, int] = {}  # {texto_busqueda: total}
+        self._page_cursors: list[tuple] = []  # Último (nombre, id) de cada página cargada
+        self._fetch_epoch = 0  # Identifica la última carga solicitada
+        self._last_fingerprint: tuple | None = None  # (texto, página) de la última carga aplicada
 
         # 5. Delegados
         # A) Ver Detalle (Columna 0)
         self.delegado_detalle = BotonDetalleDelegate(
             callback=self.abrir_detalle_estudiante,
-            icon_path="assets/icons/ver-detalles.png",
+            icon=_icons()["detalle"],
             columna=0
         )
 
         # B) Matricular (Columna 1)
         self.delegado_matricular = BotonDetalleDelegate(
             callback=self.abrir_dialogo_matricula,
-            icon_path="assets/icons/matricular.png",
+            icon=_icons()["matricular"],
             columna=1
         )
 
         # C) Borrar (Columna 2)
         self.delegado_borrar = BotonDetalleDelegate(
             callback=self.borrar_estudiante,
-            icon_path="assets/icons/delete.png",
+            icon=_icons()["borrar"],
             columna=2
         )
 
@@ -93,9 +212,15 @@ class ControladorEstudiantes(QWidget):
         self.btn_before = self.findChild(QPushButton, 'btn_before')
         self.btn_after = self.findChild(QPushButton, 'btn_after')
 
+        # Debounce de búsqueda: una sola consulta 250 ms después de la última tecla
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._do_filtrar)
+
         # Conexiones
         if self.input_buscar:
-            self.input_buscar.textChanged.connect(self.filtrar_tabla)
+            self.input_buscar.textChanged.connect(self._search_timer.start)
 
         if self.btn_recargar:
             self.btn_recargar.clicked.connect(self.recargar_datos)
@@ -108,11 +233,21 @@ class ControladorEstudiantes(QWidget):
     def recargar_datos(self):
         """Resetea la búsqueda y recarga la tabla desde la primera página."""
         self.pagina_actual = 1
+        self.invalidar_cache()
         if self.input_buscar:
             self.input_buscar.clear()
+            self._search_timer.stop()  # La recarga ya incluye el filtro vacío
         self.cargar_datos_tabla()
 
-    def filtrar_tabla(self):
+    def invalidar_cache(self):
+        """Descarta los totales memorizados y la huella de la última carga.
+
+        La próxima llamada a ``cargar_datos_tabla`` volverá a consultar la base de datos.
+        """
+        self._count_cache.clear()
+        self._last_fingerprint = None
+
+    def _do_filtrar(self):
         """Reinicia la paginación y actualiza la tabla al cambiar el texto de búsqueda."""
         self.pagina_actual = 1
         self.cargar_datos_tabla()
@@ -120,16 +255,20 @@ class ControladorEstudiantes(QWidget):
     # ---------------- FORMATO TABLA ----------------
     def cargar_formato_tabla(self):
         """Configura columnas, anchos y delegados para la tabla de estudiantes."""
-        tabla = getattr(self, 'tabla_estudiantes', self.findChild(QTableWidget, 'tabla_estudiantes'))
+        tabla = getattr(self, 'tabla_estudiantes', None) or self.findChild(QTableView, 'tabla_estudiantes')
         if not tabla:
-            tabla = getattr(self, 'tableEstudiantes', self.findChild(QTableWidget, 'tableEstudiantes'))
+            tabla = getattr(self, 'tableEstudiantes', None) or self.findChild(QTableView, 'tableEstudiantes')
 
         self.tabla = tabla
 
         if not self.tabla:
-            print("Error: No se encontró el QTableWidget en estudiantes.ui")
+            print("Error: No se encontró el QTableView en estudiantes.ui")
             return
 
+        # El modelo debe existir antes de configurar los encabezados
+        self.modelo_tabla = EstudiantesTableModel(self.columnas_headers, self)
+        self.tabla.setModel(self.modelo_tabla)
+
         # Ajuste de anchos: 3 botones de 40px + columnas de datos
         anchos = [40, 40, 40, 250, 120, 180, 150, 150]
 
@@ -173,87 +312,150 @@ class ControladorEstudiantes(QWidget):
 
     # ---------------- CARGA DE DATOS ----------------
     def cargar_datos_tabla(self):
-        """Obtiene los datos paginados y filtrados para llenar la tabla.
+        """Solicita en segundo plano los datos paginados y filtrados de la tabla.
 
-        Realiza conteo total para la paginación y recupera el segmento de datos
-        correspondiente.
+        Las consultas se ejecutan en un QRunnable; la tabla solo se actualiza en
+        ``_on_datos_cargados`` y únicamente con el resultado de la última petición.
         """
         if not getattr(self, 'tabla', None): return
 
-        self.tabla.setUpdatesEnabled(False)
-        self.tabla.setRowCount(0)
-
         texto_busqueda = self.input_buscar.text().strip() if self.input_buscar else ""
+        pagina = self.pagina_actual
 
-        try:
-            filtros = {}
-            or_fields = []
-
-            if texto_busqueda:
-                or_fields = [
-                    ('nombre', texto_busqueda),
-                    ('institucion_articulada', texto_busqueda),
-                    ('cedula', texto_busqueda)
-                ]
-
-            # 1. Contar registros
-            self.total_registros = self.model_estudiante.count(
-                filters=filtros if filtros else None,
-                or_fields=or_fields if or_fields else None
-            )
+        # Misma búsqueda y misma página que la última carga: nada que consultar
+        if (texto_busqueda, pagina) == self._last_fingerprint:
+            return
+
+        total_cacheado = self._count_cache.get(texto_busqueda)
+        cursores = list(self._page_cursors)
 
-            # 2. Calcular páginas
-            self.total_paginas = max(1, (
-                        self.total_registros + self.registros_por_pagina - 1) // self.registros_por_pagina)
+        self._fetch_epoch += 1
+        worker = _EstudiantesFetch(
+            self._fetch_epoch,
+            lambda: self._consultar_pagina(texto_busqueda, pagina, total_cacheado, cursores)
+        )
+        worker.signals.finished.connect(self._on_datos_cargados)
+        worker.signals.failed.connect(self._on_error_carga)
+
+        self._set_cargando(True)
+        QThreadPool.globalInstance().start(worker)
 
-            if self.pagina_actual > self.total_paginas:
-                self.pagina_actual = self.total_paginas
+    def _consultar_pagina(self, texto_busqueda: str, pagina: int, total: int | None, cursores: list[tuple]) -> dict:
+        """Ejecuta el conteo y la búsqueda de una página (se llama desde el hilo trabajador).
 
-            offset = (self.pagina_actual - 1) * self.registros_por_pagina
+        No toca widgets ni el estado del controlador; todo lo necesario llega por
+        parámetros y el resultado se devuelve en un diccionario.
 
-            # 3. Buscar registros
-            estudiantes = self.model_estudiante.search(
+        Args:
+            texto_busqueda (str): Texto del buscador.
+            pagina (int): Página solicitada (base 1).
+            total (int | None): Total memorizado para este filtro, o None para contar.
+            cursores (list[tuple]): Copia de los cursores (nombre, id) conocidos.
+
+        Returns:
+            dict: Claves 'texto', 'total', 'pagina', 'filas' y 'cursor'.
+        """
+        filtros = {}
+        or_fields = []
+
+        if texto_busqueda:
+            or_fields = [
+                ('nombre', texto_busqueda),
+                ('institucion_articulada', texto_busqueda),
+                ('cedula', texto_busqueda)
+            ]
+
+        # 1. Contar registros (solo si el filtro cambió)
+        if total is None:
+            total = self.model_estudiante.count(
                 filters=filtros if filtros else None,
-                order_by="nombre",
-                limit=self.registros_por_pagina,
-                offset=offset,
                 or_fields=or_fields if or_fields else None
             )
 
-        except Exception as e:
-            print(f"Error cargando datos de estudiantes: {e}")
-            self.tabla.setUpdatesEnabled(True)
+        # 2. Calcular páginas
+        total_paginas = max(1, (total + self.registros_por_pagina - 1) // self.registros_por_pagina)
+        pagina = min(pagina, total_paginas)
+
+        # 3. Buscar registros
+        # Keyset: si conocemos el cursor de la página previa saltamos por índice;
+        # si no (salto a una página arbitraria) usamos OFFSET como respaldo.
+        paginacion = {}
+        if pagina > 1 and len(cursores) >= pagina - 1:
+            paginacion["after"] = cursores[pagina - 2]
+        else:
+            paginacion["offset"] = (pagina - 1) * self.registros_por_pagina
+
+        estudiantes = self.model_estudiante.search(
+            filters=filtros if filtros else None,
+            order_by=("nombre", "id"),
+            limit=self.registros_por_pagina,
+            or_fields=or_fields if or_fields else None,
+            **paginacion
+        )
+
+        # Resolución de centros en una sola consulta para toda la página
+        try:
+            mapa_centros = self.model_centro.texto_desde_ids(
+                {est.centro_id for est in estudiantes if est.centro_id}
+            )
+        except Exception:
+            mapa_centros = {}
+
+        # Tuplas posicionales con los None ya resueltos: data() solo indexa
+        filas = [
+            (
+                est.id,  # Cols 0-2: Detalle / Matricular / Borrar
+                est.nombre or "",
+                est.cedula or "",
+                est.correo or "",
+                mapa_centros.get(est.centro_id, "Sin Asignar"),
+                est.institucion_articulada or ""
+            )
+            for est in estudiantes
+        ]
+
+        return {
+            "texto": texto_busqueda,
+            "total": total,
+            "pagina": pagina,
+            "filas": filas,
+            "cursor": (estudiantes[-1].nombre, estudiantes[-1].id) if estudiantes else None,
+        }
+
+    def _on_datos_cargados(self, epoch: int, resultado: dict):
+        """Aplica en la UI el resultado de una carga si sigue siendo la vigente."""
+        if epoch != self._fetch_epoch:
             return
+        self._set_cargando(False)
 
-        filas = []
-        for est in estudiantes:
-            txt_centro = "Sin Asignar"
-            if est.centro_id:
-                try:
-                    txt_centro = self.model_centro.texto_desde_id(est.centro_id)
-                except Exception:
-                    pass
-
-            filas.append([
-                est.id,  # Col 0: Detalle
-                est.id,  # Col 1: Matricular
-                est.id,  # Col 2: Borrar
-                est.nombre,
-                est.cedula,
-                est.correo,
-                txt_centro,
-                est.institucion_articulada
-            ])
-
-        PyQtHelper.cargar_datos_en_tabla(
-            self.tabla,
-            filas,
-            id_column=0,
-            alineacion=Qt.AlignmentFlag.AlignCenter
-        )
+        self.total_registros = resultado["total"]
+        self._count_cache[resultado["texto"]] = self.total_registros
+        self.total_paginas = max(1, (
+                    self.total_registros + self.registros_por_pagina - 1) // self.registros_por_pagina)
+        self.pagina_actual = resultado["pagina"]
+
+        del self._page_cursors[self.pagina_actual - 1:]
+        if resultado["cursor"] and len(self._page_cursors) == self.pagina_actual - 1:
+            self._page_cursors.append(resultado["cursor"])
+
+        self.modelo_tabla.set_rows(resultado["filas"])
+        self._last_fingerprint = (resultado["texto"], self.pagina_actual)
 
         self.actualizar_interfaz_paginacion()
 
+    def _on_error_carga(self, epoch: int, mensaje: str):
+        """Registra el error de una carga vigente y libera el indicador de carga."""
+        if epoch != self._fetch_epoch:
+            return
+        self._set_cargando(False)
+        print(f"Error cargando datos de estudiantes: {mensaje}")
+
+    def _set_cargando(self, en_curso: bool):
+        """Indica discretamente en el botón de recarga que hay una consulta en curso."""
+        if self.btn_recargar:
+            self.btn_recargar.setEnabled(not en_curso)
+            self.btn_recargar.setToolTip("Cargando..." if en_curso else "")
+
     # ---------------- ACCIONES DELEGADOS ----------------
 
     def abrir_detalle_estudiante(self, persona_id):
@@ -305,18 +507,12 @@ class ControladorEstudiantes(QWidget):
             datos['centro_id'] = persona.centro_id
 
             try:
-                # Verificar duplicados
-                existe = self.model_matricula.search(filters={
-                    "persona_id": datos['persona_id'],
-                    "curso_id": datos['curso_id']
-                }, first=True)
-
-                if existe:
+                # Crear matrícula (la verificación de duplicados ocurre en el mismo INSERT)
+                if not self.model_matricula.create_if_absent(datos):
                     QMessageBox.warning(self, "Duplicado", "Esta persona ya está matriculada en el curso seleccionado.")
                     return
 
-                # Crear matrícula
-                self.model_matricula.create(datos)
+                self.invalidar_cache()
                 QMessageBox.information(self, "Éxito", f"Matrícula creada correctamente para {persona.nombre}.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"No se pudo crear la matrícula:\n{e}")
@@ -393,7 +589,7 @@ class ControladorEstudiantes(QWidget):
                     session.close()
 
             # Borrar de BD
-            if self.model_estudiante.delete(persona_id):
+            if self.model_estudiante.delete_fast(persona_id):
                 QMessageBox.information(self, "Eliminado", "Registro eliminado correctamente.")
                 self.recargar_datos()
             else:
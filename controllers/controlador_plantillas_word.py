@@ -1,12 +1,14 @@
+import mmap
 import os
 import shutil
 import uuid
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QPushButton, QFileDialog,
     QLineEdit, QMessageBox, QListWidget, QHBoxLayout, QGroupBox, QListWidgetItem,
-    QApplication
+    QApplication, QToolTip
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QCursor
 from models.plantilla_certificado_model import PlantillaCertificadoModel
 
 
@@ -82,10 +84,8 @@ class GestorPlantillasWord(QDialog):
             ("Fecha de Emisión", "{{ fecha_emision }}")
         ]
 
-        for desc, tag in self.etiquetas_info:
-            item = QListWidgetItem(f"{tag}   ---   ({desc})")
-            item.setData(Qt.ItemDataRole.UserRole, tag)
-            self.lista_tags.addItem(item)
+        self.lista_tags.addItems([f"{tag}   ---   ({desc})" for desc, tag in self.etiquetas_info])
+        self._tag_of_row = {i: tag for i, (desc, tag) in enumerate(self.etiquetas_info)}
 
         self.lista_tags.itemDoubleClicked.connect(self.copiar_etiqueta)
         layout_tags.addWidget(self.lista_tags)
@@ -139,10 +139,15 @@ class GestorPlantillasWord(QDialog):
         main_layout.addLayout(right_layout, 4)
 
     def copiar_etiqueta(self, item):
-        """Copia el texto de la etiqueta seleccionada al portapapeles del sistema."""
-        texto = item.data(Qt.ItemDataRole.UserRole)
+        """Copia el texto de la etiqueta seleccionada al portapapeles del sistema.
+
+        Muestra un aviso flotante no bloqueante junto al cursor en lugar de un diálogo modal.
+        """
+        texto = self._tag_of_row.get(self.lista_tags.currentRow())
+        if not texto:
+            return
         QApplication.clipboard().setText(texto)
-        QMessageBox.information(self, "Copiado", f"Código '{texto}' copiado al portapapeles.")
+        QToolTip.showText(QCursor.pos(), f"Copiado: {texto}", self, QRect(), 1500)
 
     def seleccionar_archivo(self):
         """Abre un diálogo para seleccionar un archivo .docx local."""
@@ -160,20 +165,28 @@ class GestorPlantillasWord(QDialog):
             return
 
         try:
-            # 1. LEER EL ARCHIVO EN BYTES
-            with open(self.ruta_docx_seleccionado, 'rb') as f:
-                contenido_bytes = f.read()
-
             # Extraemos el nombre original del archivo para guardarlo como referencia
             nombre_original_archivo = os.path.basename(self.ruta_docx_seleccionado)
 
-            # 2. GUARDAR EN BD (Columna archivo_binario)
-            self.model.create({
-                "nombre": nombre,
-                "archivo_binario": contenido_bytes,     # <-- Aquí viaja el archivo real
-                "configuracion_json": "TYPE_WORD",
-                "ancho_px": 0, "alto_px": 0, "numero_paginas": 1
-            })
+            # 1. MAPEAR EL ARCHIVO EN MEMORIA (sin copia intermedia a bytes)
+            with open(self.ruta_docx_seleccionado, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    QMessageBox.warning(self, "Error", "El archivo seleccionado está vacío.")
+                    return
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contenido:
+                    vista = memoryview(contenido)
+                    try:
+                        # 2. GUARDAR EN BD (Columna archivo_binario)
+                        self.model.create({
+                            "nombre": nombre,
+                            "archivo_binario": vista,     # <-- Aquí viaja el archivo real
+                            "configuracion_json": "TYPE_WORD",
+                            "ancho_px": 0, "alto_px": 0, "numero_paginas": 1
+                        })
+                    finally:
+                        # El mmap no puede cerrarse mientras existan vistas exportadas
+                        vista.release()
 
             QMessageBox.information(self, "Éxito", "Plantilla guardada en la Base de Datos correctamente.")
 
@@ -189,11 +202,10 @@ class GestorPlantillasWord(QDialog):
     def cargar_existentes(self):
         """Actualiza la lista visual con las plantillas Word almacenadas en BD."""
         self.lista_existentes.clear()
-        for p in self.model.get_all():
-            if p.configuracion_json == "TYPE_WORD":
-                item = QListWidgetItem(f"{p.nombre}")
-                item.setData(Qt.ItemDataRole.UserRole, p.id)
-                self.lista_existentes.addItem(item)
+        for plantilla_id, nombre in self.model.list_word_templates():
+            item = QListWidgetItem(f"{nombre}")
+            item.setData(Qt.ItemDataRole.UserRole, plantilla_id)
+            self.lista_existentes.addItem(item)
 
     def eliminar_plantilla(self):
         """Elimina la plantilla seleccionada de la base de datos."""
@@ -217,7 +229,7 @@ class GestorPlantillasWord(QDialog):
                 # Ya no necesitamos buscar rutas locales físicas ni usar os.remove()
                 # porque el archivo está embebido en la base de datos.
                 # Al borrar el registro de la BD, se libera ese espacio.
-                self.model.delete(id_plantilla)
+                self.model.delete_fast(id_plantilla)
 
                 # Actualizar la lista visual
                 self.cargar_existentes()
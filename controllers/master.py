@@ -9,10 +9,14 @@
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
 
+import sys
+from collections import Counter, defaultdict
+from functools import partial
+
 from PyQt6 import uic
 from PyQt6.QtCore import (
     QSize, Qt, QPropertyAnimation, QEasingCurve,
-    QParallelAnimationGroup, QTimer
+    QParallelAnimationGroup, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 )
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont
 from PyQt6.QtWidgets import (
@@ -32,9 +36,8 @@ from controllers.controlador_configuraciones import ControladorConfiguraciones
 from controllers.controlador_certificados import ControladorCertificados as ControladorCertificados
 from controllers.controlador_estudiantes import ControladorEstudiantes
 from controllers.controlador_cursos import ControladorCursos
-from controllers.controlador_estudiante_detalle import ControladorDetalleEstudiante
-from controllers.controlador_curso_detalle import ControladorDetalleCurso
-from controllers.controlador_plantillas_word import GestorPlantillasWord
+# Detalles, importador, diseñador de plantillas y reportes se importan dentro de
+# sus manejadores: no se cargan hasta que el usuario los abre.
 
 # Diálogos
 from utilities.dialogos import DialogoCurso as inputAdiestramiento
@@ -42,12 +45,57 @@ from utilities.dialogos import DialogoNotas as inputNotas
 from utilities.dialogos import DialogoPersona as inputNewEstudiante
 from utilities.dialogos import DialogoGenerarCertificados as inputGenCert
 
-from utilities.importer_window import GestorImportacion
+from database import config, conexion
+from database.setup import inicializar_base_de_datos
 from models.matricula_model import MatriculaModel
 from models.curso_model import CursoModel
+from models.centro_model import CentroModel
 from models.persona_model import PersonaModel
 from models.certificado_model import CertificadoModel  # NUEVO: Importación necesaria para el conteo
-from utilities.dialogos import DialogoReportes
+
+# Estados canónicos de matrícula: una sola instancia compartida por estado
+EN_CURSO = sys.intern("EN CURSO")
+APROBADO = sys.intern("APROBADO")
+REPROBADO = sys.intern("REPROBADO")
+NO_REALIZO = sys.intern("NO REALIZO")
+SIN_ESTADO = sys.intern("SIN ESTADO")
+_ESTADOS_CANONICOS = {e: e for e in (EN_CURSO, APROBADO, REPROBADO, NO_REALIZO)}
+
+# Porciones de la caché global que pueden recargarse por separado
+_SECCIONES_CACHE = ("cursos", "matriculas", "certificados", "estudiantes")
+
+
+class _CacheWorkerSignals(QObject):
+    """Señales del trabajador de la caché global (QRunnable no hereda de QObject)."""
+    finished = pyqtSignal(int, object)  # (epoch, resultado)
+    failed = pyqtSignal(int, str)  # (epoch, mensaje)
+
+
+class _CacheWorker(QRunnable):
+    """Ejecuta las consultas de `actualizar_cache_global` fuera del hilo de la UI.
+
+    Cada recarga lleva un ``epoch``; el controlador descarta los resultados cuyo
+    epoch ya fue superado por otra recarga.
+    """
+
+    def __init__(self, epoch: int, tarea):
+        """Prepara el trabajador.
+
+        Args:
+            epoch (int): Número de la recarga que originó la consulta.
+            tarea (callable): Función sin argumentos que ejecuta las consultas.
+        """
+        super().__init__()
+        self.epoch = epoch
+        self.tarea = tarea
+        self.signals = _CacheWorkerSignals()
+
+    def run(self):
+        """Ejecuta la tarea y emite el resultado o el error."""
+        try:
+            self.signals.finished.emit(self.epoch, self.tarea())
+        except Exception as e:
+            self.signals.failed.emit(self.epoch, str(e))
 
 
 class MasterController(QMainWindow):
@@ -94,6 +142,32 @@ class MasterController(QMainWindow):
     lbl_titulo: QLabel
     frame_2: QWidget
 
+    # Textos del sidebar expandido (atributo del botón, texto) y estilos de cada estado
+    _SIDEBAR_BTN_TEXTS: tuple[tuple[str, str], ...] = (
+        ("btn_inicio", "   Inicio"),
+        ("btn_estudiantes", "   Estudiantes"),
+        ("btn_adiestramientos", "   Cursos"),
+        ("btn_certificados", "   Certificados"),
+        ("btn_config", "   Configuración"),
+        ("btn_new_student", "   Nuevo Estudiante"),
+        ("btn_new_course", "   Nuevo Curso"),
+        ("btn_change_note", "   Cambiar Notas"),
+        ("btn_import", "   Importar Excel/ODS"),
+        ("btn_gen_cert", "   Generar Certificados"),
+        ("btn_report", "   Reportes"),
+        ("btn_disenador", "   Diseñador de Plantillas"),
+    )
+    _STYLE_BTN_EXPANDED = "margin-bottom: 2px; text-align: left; padding-left: 15px;"
+    _STYLE_BTN_COLLAPSED = "margin-bottom: 2px; text-align: center; padding-left: 7px;"
+    _STYLE_SIDEBAR_EXPANDED = "padding-left: 7px; padding-right: 7px;"
+    _STYLE_SIDEBAR_COLLAPSED = "padding-left: 5px; padding-right: 7px;"
+    _STYLE_TOGGLE_EXPANDED = "padding: 0px; "
+    _STYLE_TOGGLE_COLLAPSED = "padding-top: 55px; padding-bottom: 55px; padding-left: 0px; padding-right: 0px;"
+
+    # Recursos gráficos compartidos entre instancias: cada PNG se decodifica una sola vez
+    _ICON_CACHE: dict[str, QIcon] = {}
+    _PIXMAP_CACHE: dict[tuple, QPixmap] = {}
+
     # ----------------------------
     # --- MÉTODO __INIT__ ---
     # ----------------------------
@@ -107,16 +181,26 @@ class MasterController(QMainWindow):
         self._init_sidebar_animation()
         self._init_navigation()
 
-        # 3. Timer Debounce (Para optimizar búsqueda en gráficos)
+        # 3. Timer de Throttle (Para optimizar búsqueda en gráficos)
+        # Primer cambio: render inmediato; ráfagas posteriores: un render al cerrar la ventana
         self.debounce_timer = QTimer()
         self.debounce_timer.setSingleShot(True)
-        self.debounce_timer.setInterval(300)
-        self.debounce_timer.timeout.connect(self._renderizar_grafico_nativo)
+        self.debounce_timer.setInterval(150)
+        self.debounce_timer.timeout.connect(self._on_throttle_timeout)
+        self._render_pendiente = False
 
         # 4. Inicialización de Variables de Caché
         self.cache_cursos = []
-        self.cache_matriculas = {}  # Diccionario {curso_id: [lista_estados]}
+        self._curso_nombre_lower = {}  # Diccionario {curso_id: nombre en minúsculas} para el filtro
+        self.cache_matriculas = {}  # Diccionario {curso_id: Counter({estado: cantidad})}
+        self.cache_stats = {}  # Diccionario {curso_id: (total, en_curso, aprobado, reprobado, no_realizo)}
         self.data_loaded = False
+        self._chart_dirty = False  # El gráfico quedó desactualizado mientras no era visible
+        self._cache_version = 0  # Se incrementa cada vez que cambian los datos del gráfico
+        self._last_render_key = None  # Entradas del último render (filtros + versión)
+        self._dirty = dict.fromkeys(_SECCIONES_CACHE, True)  # Porciones pendientes de recarga
+        self._secciones_en_vuelo = set()  # Porciones que consulta la carga en curso
+        self._cache_epoch = 0  # Identifica la última recarga solicitada
 
         # 5. Modelos
         self.curso_model = CursoModel()
@@ -166,6 +250,16 @@ class MasterController(QMainWindow):
         self._configurar_botones_sidebar()
         self._configurar_icons_dashboard()
 
+        # Logo ya escalado una sola vez: al expandir el sidebar solo se reasigna
+        self._logo_pix = self._pixmap("ECU911.png", 150, 125, Qt.AspectRatioMode.IgnoreAspectRatio)
+
+        # Referencias resueltas una sola vez: (botón, texto, tooltip al colapsar)
+        self._sidebar_botones = tuple(
+            (btn, texto, texto.strip())
+            for nombre, texto in self._SIDEBAR_BTN_TEXTS
+            if (btn := getattr(self, nombre, None))
+        )
+
     def _init_navigation(self):
         """Inicializa los controladores de las vistas secundarias y los añade al Stack."""
         self.vista_estudiantes = ControladorEstudiantes()
@@ -178,6 +272,11 @@ class MasterController(QMainWindow):
         self.stackedWidget.insertWidget(3, self.vista_certificados)
         self.stackedWidget.insertWidget(4, self.vista_configuraciones)
 
+        # Posición fija reservada para la vista de detalle (estudiante o curso): se
+        # reutiliza en cada navegación en lugar de apilar una página nueva cada vez.
+        # Va después de las páginas del .ui, por lo que no es un índice constante.
+        self.detail_index = self.stackedWidget.count()
+
         self.vista_estudiantes.signal_abrir_detalle.connect(self.mostrar_detalle_estudiante)
         self.vista_cursos.signal_abrir_detalle.connect(self.mostrar_detalle_curso)
         self.stackedWidget.currentChanged.connect(self._on_tab_changed)
@@ -199,42 +298,42 @@ class MasterController(QMainWindow):
         ALTURA_BOTON = 45
 
         # --- Conexiones e Iconos ---
-        self.btn_inicio.clicked.connect(lambda: self.cambiar_pagina(0))
-        self.btn_inicio.setIcon(QIcon("assets/icons/home.png"))
+        self.btn_inicio.clicked.connect(partial(self.cambiar_pagina, 0))
+        self.btn_inicio.setIcon(self._icon("home.png"))
 
-        self.btn_estudiantes.clicked.connect(lambda: self.cambiar_pagina(1))
-        self.btn_estudiantes.setIcon(QIcon("assets/icons/button_estudiantes.png"))
+        self.btn_estudiantes.clicked.connect(partial(self.cambiar_pagina, 1))
+        self.btn_estudiantes.setIcon(self._icon("button_estudiantes.png"))
 
-        self.btn_adiestramientos.clicked.connect(lambda: self.cambiar_pagina(2))
-        self.btn_adiestramientos.setIcon(QIcon("assets/icons/button_adiestramiento.png"))
+        self.btn_adiestramientos.clicked.connect(partial(self.cambiar_pagina, 2))
+        self.btn_adiestramientos.setIcon(self._icon("button_adiestramiento.png"))
 
-        self.btn_certificados.clicked.connect(lambda: self.cambiar_pagina(3))
-        self.btn_certificados.setIcon(QIcon("assets/icons/certificado.png"))
+        self.btn_certificados.clicked.connect(partial(self.cambiar_pagina, 3))
+        self.btn_certificados.setIcon(self._icon("certificado.png"))
 
         # NUEVO: Conectar el botón de configuración a la página 4
-        self.btn_config.clicked.connect(lambda: self.cambiar_pagina(4))
-        self.btn_config.setIcon(QIcon("assets/icons/config.png"))
+        self.btn_config.clicked.connect(partial(self.cambiar_pagina, 4))
+        self.btn_config.setIcon(self._icon("config.png"))
 
         self.btn_new_course.clicked.connect(self.nuevo_adiestramiento)
-        self.btn_new_course.setIcon(QIcon("assets/icons/agregar.png"))
+        self.btn_new_course.setIcon(self._icon("agregar.png"))
 
         self.btn_change_note.clicked.connect(self.cambiar_notas)
-        self.btn_change_note.setIcon(QIcon("assets/icons/calificaciones.png"))
+        self.btn_change_note.setIcon(self._icon("calificaciones.png"))
 
         self.btn_new_student.clicked.connect(self.nuevo_estudiante)
-        self.btn_new_student.setIcon(QIcon("assets/icons/agregar_estudiante.png"))
+        self.btn_new_student.setIcon(self._icon("agregar_estudiante.png"))
 
         self.btn_import.clicked.connect(self.importar_archivo)
-        self.btn_import.setIcon(QIcon("assets/icons/button_new_importation.png"))
+        self.btn_import.setIcon(self._icon("button_new_importation.png"))
 
         self.btn_gen_cert.clicked.connect(self.generar_certificados)
-        self.btn_gen_cert.setIcon(QIcon("assets/icons/gen_cert.png"))
+        self.btn_gen_cert.setIcon(self._icon("gen_cert.png"))
 
         self.btn_report.clicked.connect(self.abrir_reportes)
-        self.btn_report.setIcon(QIcon("assets/icons/gen_report.png"))
+        self.btn_report.setIcon(self._icon("gen_report.png"))
 
         self.btn_disenador.clicked.connect(self.abrir_disenador)
-        self.btn_disenador.setIcon(QIcon("assets/icons/design.png"))
+        self.btn_disenador.setIcon(self._icon("design.png"))
 
         for btn in botones:
             if btn:
@@ -247,18 +346,31 @@ class MasterController(QMainWindow):
     def _configurar_icons_dashboard(self):
         """Carga y escala los iconos de las tarjetas del dashboard principal."""
         try:
-            self.card_1_icon.setPixmap(
-                QPixmap("assets/icons/students_dashboard.png").scaled(40, 40, Qt.AspectRatioMode.KeepAspectRatio,
-                                                                      Qt.TransformationMode.SmoothTransformation))
-            self.card_2_icon.setPixmap(
-                QPixmap("assets/icons/dashboard_cursos.png").scaled(40, 40, Qt.AspectRatioMode.KeepAspectRatio,
-                                                                    Qt.TransformationMode.SmoothTransformation))
-            self.card_3_icon.setPixmap(
-                QPixmap("assets/icons/cert_dashboard.png").scaled(40, 40, Qt.AspectRatioMode.KeepAspectRatio,
-                                                                  Qt.TransformationMode.SmoothTransformation))
+            self.card_1_icon.setPixmap(self._pixmap("students_dashboard.png", 40, 40))
+            self.card_2_icon.setPixmap(self._pixmap("dashboard_cursos.png", 40, 40))
+            self.card_3_icon.setPixmap(self._pixmap("cert_dashboard.png", 40, 40))
         except:
             pass
 
+    @classmethod
+    def _icon(cls, nombre: str) -> QIcon:
+        """Devuelve el QIcon de `assets/icons/<nombre>`, cargándolo solo la primera vez."""
+        icono = cls._ICON_CACHE.get(nombre)
+        if icono is None:
+            icono = cls._ICON_CACHE[nombre] = QIcon(f"assets/icons/{nombre}")
+        return icono
+
+    @classmethod
+    def _pixmap(cls, nombre: str, ancho: int, alto: int,
+                aspecto: Qt.AspectRatioMode = Qt.AspectRatioMode.KeepAspectRatio) -> QPixmap:
+        """Devuelve `assets/icons/<nombre>` ya escalado, calculándolo solo la primera vez."""
+        clave = (nombre, ancho, alto, aspecto)
+        pixmap = cls._PIXMAP_CACHE.get(clave)
+        if pixmap is None:
+            pixmap = cls._PIXMAP_CACHE[clave] = QPixmap(f"assets/icons/{nombre}").scaled(
+                ancho, alto, aspecto, Qt.TransformationMode.SmoothTransformation)
+        return pixmap
+
     # ----------------------------
     # --- LÓGICA DE ANIMACIÓN (TOGGLE) ---
     # ----------------------------
@@ -301,18 +413,14 @@ class MasterController(QMainWindow):
             self.animacion_max.setEndValue(self.width_expandido)
             self.animacion_max.setEasingCurve(curve)
 
-            self.grupo_animacion.finished.connect(lambda: self._set_elementos_visibles(True))
+            self.grupo_animacion.finished.connect(partial(self._set_elementos_visibles, True))
             self.grupo_animacion.start()
 
     def _set_elementos_visibles(self, visible: bool):
         """Muestra u oculta textos e iconos del sidebar según su estado (expandido/colapsado)."""
-        base_style = "margin-bottom: 2px;"
-
         if hasattr(self, 'lbl_logo'):
             if visible:
-                self.lbl_logo.setPixmap(
-                    QPixmap("assets/icons/ECU911.png").scaled(150, 125, Qt.AspectRatioMode.IgnoreAspectRatio,
-                                                              Qt.TransformationMode.SmoothTransformation))
+                self.lbl_logo.setPixmap(self._logo_pix)
                 self.lbl_logo.setVisible(True)
                 self.lbl_logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 self.lbl_logo.setStyleSheet("padding-top: 0px; padding-bottom: 0px;")
@@ -320,141 +428,222 @@ class MasterController(QMainWindow):
                 self.lbl_logo.setVisible(False)
 
         if visible:
-            self.sidebar.setStyleSheet("padding-left: 7px; padding-right: 7px;")
-            self.btn_toggle_sidebar.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            self.btn_toggle_sidebar.setStyleSheet("padding: 0px; ")
-            style_btn = f"{base_style} text-align: left; padding-left: 15px;"
-            if hasattr(self, 'frame_2') and self.frame_2.layout():
-                self.frame_2.layout().setContentsMargins(9, 9, 9, 9)
+            self.sidebar.setStyleSheet(self._STYLE_SIDEBAR_EXPANDED)
+            self.btn_toggle_sidebar.setStyleSheet(self._STYLE_TOGGLE_EXPANDED)
+            style_btn = self._STYLE_BTN_EXPANDED
         else:
-            self.sidebar.setStyleSheet("padding-left: 5px; padding-right: 7px;")
-            self.btn_toggle_sidebar.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            self.btn_toggle_sidebar.setStyleSheet(
-                "padding-top: 55px; padding-bottom: 55px; padding-left: 0px; padding-right: 0px;")
-            style_btn = f"{base_style} text-align: center; padding-left: 7px;"
-            if hasattr(self, 'frame_2') and self.frame_2.layout():
-                self.frame_2.layout().setContentsMargins(9, 9, 9, 9)
+            self.sidebar.setStyleSheet(self._STYLE_SIDEBAR_COLLAPSED)
+            self.btn_toggle_sidebar.setStyleSheet(self._STYLE_TOGGLE_COLLAPSED)
+            style_btn = self._STYLE_BTN_COLLAPSED
+        self.btn_toggle_sidebar.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        if hasattr(self, 'frame_2') and self.frame_2.layout():
+            self.frame_2.layout().setContentsMargins(9, 9, 9, 9)
 
         if hasattr(self, 'lbl_separator'):
             self.lbl_separator.setHidden(not visible)
 
-        botones = [
-            (self.btn_inicio, "   Inicio"),
-            (self.btn_estudiantes, "   Estudiantes"),
-            (self.btn_adiestramientos, "   Cursos"),
-            (self.btn_certificados, "   Certificados"),
-            (self.btn_config, "   Configuración"),
-            (self.btn_new_student, "   Nuevo Estudiante"),
-            (self.btn_new_course, "   Nuevo Curso"),
-            (self.btn_change_note, "   Cambiar Notas"),
-            (self.btn_import, "   Importar Excel/ODS"),
-            (self.btn_gen_cert, "   Generar Certificados"),
-            (self.btn_report, "   Reportes"),
-            (self.btn_disenador, "   Diseñador de Plantillas")
-        ]
-
-        for btn, texto_original in botones:
-            if not btn: continue
+        for btn, texto_original, tooltip in self._sidebar_botones:
+            btn.setStyleSheet(style_btn)
             if visible:
                 btn.setText(texto_original)
-                btn.setStyleSheet(style_btn)
                 btn.setToolTip("")
             else:
                 btn.setText("")
-                btn.setStyleSheet(style_btn)
-                btn.setToolTip(texto_original.strip())
+                btn.setToolTip(tooltip)
 
     # ----------------------------
     # --- LÓGICA DE DATOS Y CACHÉ ---
     # ----------------------------
-    def actualizar_cache_global(self):
+    def actualizar_cache_global(self, *secciones: str):
         """Sincroniza el estado de la aplicación con la base de datos.
 
         Recarga los modelos, actualiza las estadísticas del Dashboard, regenera
         los gráficos y notifica a los controladores hijos para que refresquen
         sus tablas. Debe llamarse tras cualquier operación de escritura (CRUD).
+
+        Las consultas se ejecutan en un `_CacheWorker` del QThreadPool; la UI se
+        actualiza en `_on_cache_cargada` cuando llega el resultado.
+
+        Args:
+            *secciones (str): Porciones modificadas ('cursos', 'matriculas',
+                'certificados', 'estudiantes'). Sin argumentos se recarga todo.
         """
+        for seccion in secciones or _SECCIONES_CACHE:
+            self._dirty[seccion] = True
+
+        # Si hay una carga en curso su resultado se descartará: sus porciones se suman a esta
+        pendientes = {s for s, sucio in self._dirty.items() if sucio} | self._secciones_en_vuelo
+        for seccion in _SECCIONES_CACHE:
+            self._dirty[seccion] = False
+        self._secciones_en_vuelo = pendientes
+
+        self._cache_epoch += 1
+        worker = _CacheWorker(self._cache_epoch, partial(self._consultar_cache, frozenset(pendientes)))
+        worker.signals.finished.connect(self._on_cache_cargada)
+        worker.signals.failed.connect(self._on_error_cache)
+        QThreadPool.globalInstance().start(worker)
+
+    def iniciar_mantenimiento_estados(self):
+        """Actualiza en segundo plano los estados de las matrículas vencidas.
+
+        `MatriculaModel.actualizar_estados_matriculas` recorre las matrículas
+        'EN CURSO' de cursos cerrados; se ejecuta en el QThreadPool para que la
+        ventana se pinte sin esperar. Si algún estado cambió, se recargan las
+        matrículas de la caché global.
         """
-        FUNCIÓN PRINCIPAL DE ACTUALIZACIÓN.
-        Debe ser llamada cada vez que se realice un cambio en la Base de Datos
-        (Insert, Update, Delete) para mantener la UI sincronizada.
+        worker = _CacheWorker(0, self.matricula_model.actualizar_estados_matriculas)
+        worker.signals.finished.connect(self._on_estados_actualizados)
+        worker.signals.failed.connect(self._on_error_mantenimiento)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_estados_actualizados(self, _epoch: int, actualizados: int):
+        """Refresca la caché si el mantenimiento de estados modificó registros."""
+        if actualizados:
+            self.actualizar_cache_global("matriculas")
+
+    def _on_error_mantenimiento(self, _epoch: int, mensaje: str):
+        """Registra el error del mantenimiento de estados (no bloquea la aplicación)."""
+        print(f"Error en mantenimiento de estados: {mensaje}")
+
+    def _consultar_cache(self, secciones: frozenset) -> dict:
+        """Ejecuta las consultas de las porciones indicadas (se llama desde el hilo trabajador).
+
+        Args:
+            secciones (frozenset): Porciones a recargar.
+
+        Returns:
+            dict: Datos listos para aplicar en la UI; solo contiene las claves de
+                las porciones consultadas.
         """
+        resultado = {"secciones": secciones}
+        if "cursos" in secciones:
+            cursos = self.curso_model.search() or []
+            resultado["cursos"] = cursos
+            resultado["nombres_lower"] = {c.id: c.nombre.lower() for c in cursos}
+        if "matriculas" in secciones:
+            resultado["matriculas"], resultado["stats"] = self._contar_matriculas(
+                self.matricula_model.group_counts_by_curso_estado()
+            )
+        # Los conteos de las tarjetas comparten una sola conexión
+        with self.estudiante_model.sesion_lectura() as session:
+            if "estudiantes" in secciones:
+                resultado["total_estudiantes"] = self.estudiante_model.count(session=session)
+            if "certificados" in secciones or "matriculas" in secciones:
+                resultado["pendientes_firma"] = self.certificado_model.count_pendientes_firma(session)
+        return resultado
+
+    @staticmethod
+    def _contar_matriculas(grupos) -> tuple[dict, dict]:
+        """Construye los conteos por curso y estado que alimentan el gráfico.
+
+        Args:
+            grupos (list): Tuplas (curso_id, estado, cantidad) agregadas en SQL.
+
+        Returns:
+            tuple[dict, dict]: ({curso_id: Counter}, {curso_id: (total, en, apr, rep, no)})
+        """
+        # Los conteos llegan agregados; solo se normaliza el estado de cada grupo
+        conteos = defaultdict(Counter)
+        for curso_id, estado, cantidad in grupos:
+            # Normalización de estado (los valores canónicos no pasan por upper())
+            estado_str = _ESTADOS_CANONICOS.get(estado)
+            if estado_str is None:
+                if estado:
+                    upper = str(estado).upper()
+                    estado_str = _ESTADOS_CANONICOS.get(upper) or sys.intern(upper)
+                else:
+                    estado_str = SIN_ESTADO
+            conteos[curso_id][estado_str] += cantidad
+
+        # Totales por curso ya listos para el gráfico (sin recorrer nada al filtrar)
+        stats = {
+            curso_id: (
+                sum(conteo.values()),
+                conteo[EN_CURSO], conteo[APROBADO], conteo[REPROBADO], conteo[NO_REALIZO]
+            )
+            for curso_id, conteo in conteos.items()
+        }
+        return dict(conteos), stats
+
+    def _on_cache_cargada(self, epoch: int, resultado: dict):
+        """Aplica en la UI el resultado de una recarga si sigue siendo la vigente."""
+        if epoch != self._cache_epoch:
+            return
+        self._secciones_en_vuelo = set()
+        secciones = resultado["secciones"]
+
         try:
-            # 1. Recargar datos crudos desde Modelos
-            self.cache_cursos = self.curso_model.search() or []
-            raw_matriculas = self.matricula_model.search() or []
-
-            # 2. Reconstruir Caché de Matrículas (Optimizado para Gráficos)
-            self.cache_matriculas = {}
-            for m in raw_matriculas:
-                if m.curso_id not in self.cache_matriculas:
-                    self.cache_matriculas[m.curso_id] = []
-                # Normalización de estado
-                estado_str = str(m.estado).upper() if m.estado else "SIN ESTADO"
-                self.cache_matriculas[m.curso_id].append(estado_str)
+            # 1. Reemplazar las porciones recargadas
+            if "cursos" in resultado:
+                self.cache_cursos = resultado["cursos"]
+                self._curso_nombre_lower = resultado["nombres_lower"]
+            if "matriculas" in resultado:
+                self.cache_matriculas = resultado["matriculas"]
+                self.cache_stats = resultado["stats"]
 
             self.data_loaded = True
 
-            # 3. Actualizar Dashboard
-            self._actualizar_dashboard_cards()
+            # 2. Actualizar Dashboard
+            self._pintar_tarjetas(resultado.get("total_estudiantes"), resultado.get("pendientes_firma"))
 
-            # 4. Actualizar Gráfico Nativo
-            self._renderizar_grafico_nativo()
+            # 3. Actualizar Gráfico Nativo (solo si el Dashboard está visible)
+            datos_grafico = "cursos" in secciones or "matriculas" in secciones
+            if datos_grafico:
+                self._cache_version += 1
+                self._chart_dirty = True
+                if self.stackedWidget.currentIndex() == 0:
+                    self._renderizar_grafico_nativo()
+                    self._chart_dirty = False
 
-            # 5. Notificar a las Vistas Hijas (Tablas)
-            if hasattr(self.vista_cursos, 'recargar_datos'):
+            # 4. Notificar a las Vistas Hijas (Tablas)
+            if datos_grafico and hasattr(self.vista_cursos, 'recargar_datos'):
                 self.vista_cursos.recargar_datos()
 
-            if hasattr(self.vista_estudiantes, 'recargar_datos'):
+            if ("estudiantes" in secciones or "matriculas" in secciones) \
+                    and hasattr(self.vista_estudiantes, 'recargar_datos'):
                 self.vista_estudiantes.recargar_datos()
 
         except Exception as e:
             print(f"Error crítico actualizando caché: {e}")
             # Aquí podrías poner un QMessageBox si deseas alertar al usuario
 
+    def _on_error_cache(self, epoch: int, mensaje: str):
+        """Registra el error de una recarga vigente y deja sus porciones pendientes."""
+        if epoch != self._cache_epoch:
+            return
+        for seccion in self._secciones_en_vuelo:
+            self._dirty[seccion] = True
+        self._secciones_en_vuelo = set()
+        print(f"Error crítico actualizando caché: {mensaje}")
+
     def _actualizar_dashboard_cards(self):
-        """Actualiza solo los números de las tarjetas"""
+        """Actualiza solo los números de las tarjetas (consulta en el hilo de la UI)."""
         try:
-            total_estudiantes = self.estudiante_model.count()
-            self.lbl_card_1_value.setText(str(total_estudiantes))
-            self.lbl_card_2_value.setText(str(len(self.cache_cursos)))
-
-            # --- ACTUALIZACIÓN DE TARJETA 3: CERTIFICADOS PENDIENTES DE FIRMA ---
-            # Lógica sincronizada estrictamente con ControladorCertificados:
-            # 1. Obtenemos TODOS los certificados generados (Tabla Certificado).
-            # 2. Obtenemos TODAS las matrículas para verificar firma.
-            # 3. Cruzamos: Si existe Certificado pero Matrícula NO tiene 'ruta_pdf_firmado' -> PENDIENTE.
-
-            todos_certificados = self.certificado_model.search() or []
-            todas_matriculas = self.matricula_model.search() or []
-
-            # Mapa para búsqueda rápida: (persona_id, curso_id) -> Objeto Matricula
-            mapa_matriculas = {
-                (m.persona_id, m.curso_id): m
-                for m in todas_matriculas
-            }
-
-            cont_faltan_firmar = 0
-
-            for cert in todos_certificados:
-                # Buscamos la matrícula correspondiente
-                mat = mapa_matriculas.get((cert.persona_id, cert.curso_id))
-
-                tiene_firma = False
-                # La única fuente de verdad para "FIRMADO" es la ruta en la matrícula
-                if mat and mat.ruta_pdf_firmado:
-                    tiene_firma = True
-
-                if not tiene_firma:
-                    cont_faltan_firmar += 1
-
-            # Actualizar el Label de la tarjeta
-            self.lbl_card_3_value.setText(str(cont_faltan_firmar))
-
+            # --- TARJETA 3: CERTIFICADOS PENDIENTES DE FIRMA ---
+            # Lógica sincronizada estrictamente con ControladorCertificados: un certificado
+            # está PENDIENTE si su matrícula NO tiene 'ruta_pdf_firmado' (conteo en SQL).
+            with self.estudiante_model.sesion_lectura() as session:
+                self._pintar_tarjetas(
+                    self.estudiante_model.count(session=session),
+                    self.certificado_model.count_pendientes_firma(session)
+                )
         except Exception as e:
             print(f"Error actualizando dashboard: {e}")
             self.lbl_card_3_value.setText("0")
 
+    def _pintar_tarjetas(self, total_estudiantes: int | None = None, pendientes_firma: int | None = None):
+        """Escribe los valores en las tarjetas del Dashboard.
+
+        Args:
+            total_estudiantes (int, optional): Total de estudiantes; None conserva el valor mostrado.
+            pendientes_firma (int, optional): Certificados sin firmar; None conserva el valor mostrado.
+        """
+        if total_estudiantes is not None:
+            self.lbl_card_1_value.setText(str(total_estudiantes))
+        self.lbl_card_2_value.setText(str(len(self.cache_cursos)))
+        if pendientes_firma is not None:
+            self.lbl_card_3_value.setText(str(pendientes_firma))
+
     # ------------------------------------------------------
     # --- GRÁFICO NATIVO ---
     # ------------------------------------------------------
@@ -499,12 +688,40 @@ class MasterController(QMainWindow):
         filter_layout.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
 
         self.chart = QChart()
-        self.chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+        # Sin animaciones: cada cambio de filtro redibuja todas las barras
+        self.chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
         self.chart.setBackgroundRoundness(0)
         self.chart.setMargins(self.chart.margins())
         self.chart.legend().setAlignment(Qt.AlignmentFlag.AlignTop)
         self.chart.legend().setFont(QFont("Arial", 9, QFont.Weight.Bold))
 
+        # Serie, conjuntos y ejes persistentes: cada render solo reemplaza sus valores
+        self.set_en_curso = QBarSet("En curso")
+        self.set_aprobo = QBarSet("Aprobado")
+        self.set_reprobo = QBarSet("Reprobado")
+        self.set_no_realizo = QBarSet("No realizó")
+
+        self.set_en_curso.setColor(QColor("#3498db"))
+        self.set_aprobo.setColor(QColor("#2ecc71"))
+        self.set_reprobo.setColor(QColor("#e74c3c"))
+        self.set_no_realizo.setColor(QColor("#95a5a6"))
+
+        self.chart_series = QHorizontalStackedBarSeries()
+        for bar_set in (self.set_en_curso, self.set_aprobo, self.set_reprobo, self.set_no_realizo):
+            self.chart_series.append(bar_set)
+        self.chart_series.setLabelsVisible(True)
+        self.chart_series.setLabelsFormat("@value")
+        self.chart.addSeries(self.chart_series)
+
+        self.axis_y = QBarCategoryAxis()
+        self.chart.addAxis(self.axis_y, Qt.AlignmentFlag.AlignLeft)
+        self.chart_series.attachAxis(self.axis_y)
+
+        self.axis_x = QValueAxis()
+        self.axis_x.setLabelFormat("%d")
+        self.chart.addAxis(self.axis_x, Qt.AlignmentFlag.AlignBottom)
+        self.chart_series.attachAxis(self.axis_x)
+
         self.chart_view = QChartView(self.chart)
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
 
@@ -518,9 +735,25 @@ class MasterController(QMainWindow):
         main_layout.addWidget(self.scroll_chart)
 
     def on_filter_interaction(self):
-        """Inicia el temporizador de debounce al modificar filtros del gráfico."""
+        """Redibuja el gráfico al modificar filtros, agrupando las ráfagas de cambios.
+
+        Si no hay un render reciente se dibuja de inmediato (flanco de subida); los
+        cambios que llegan durante la ventana del temporizador se agrupan en un
+        único render al final de la misma.
+        """
+        if self.debounce_timer.isActive():
+            self._render_pendiente = True
+            return
+        self._renderizar_grafico_nativo()
         self.debounce_timer.start()
 
+    def _on_throttle_timeout(self):
+        """Ejecuta el render pendiente de la ráfaga y abre una nueva ventana si hubo uno."""
+        if self._render_pendiente:
+            self._render_pendiente = False
+            self._renderizar_grafico_nativo()
+            self.debounce_timer.start()
+
     def _renderizar_grafico_nativo(self):
         """Genera y muestra el gráfico de barras apiladas con los datos actuales.
 
@@ -530,81 +763,84 @@ class MasterController(QMainWindow):
         if not self.data_loaded: return
 
         texto = self.txt_chart_search.text().lower().strip()
-        cursos_filtrados = [c for c in self.cache_cursos if texto in c.nombre.lower()]
+
+        # Estado de los filtros leído una sola vez (no por curso)
+        en_on = self.chk_en_curso.isChecked()
+        apr_on = self.chk_aprobo.isChecked()
+        rep_on = self.chk_reprobo.isChecked()
+        no_on = self.chk_no_realizo.isChecked()
+
+        # Mismos filtros y mismos datos que el último render: no hay nada que redibujar
+        render_key = (texto, en_on, apr_on, rep_on, no_on, self._cache_version)
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
+        # Un único repintado al final, no uno por cada cambio de conjuntos y ejes
+        self.chart_view.setUpdatesEnabled(False)
+        self.chart_view.blockSignals(True)
+        try:
+            self._poblar_grafico(texto, en_on, apr_on, rep_on, no_on)
+        finally:
+            self.chart_view.blockSignals(False)
+            self.chart_view.setUpdatesEnabled(True)
+            self.chart_view.update()
+
+    def _poblar_grafico(self, texto: str, en_on: bool, apr_on: bool, rep_on: bool, no_on: bool):
+        """Reemplaza los valores de los conjuntos, las categorías y el rango del gráfico.
+
+        Args:
+            texto (str): Filtro de nombre de curso, ya en minúsculas.
+            en_on (bool): Mostrar "En curso".
+            apr_on (bool): Mostrar "Aprobado".
+            rep_on (bool): Mostrar "Reprobado".
+            no_on (bool): Mostrar "No realizó".
+        """
+        nombres_lower = self._curso_nombre_lower
+        cursos_filtrados = [c for c in self.cache_cursos if texto in nombres_lower[c.id]]
+
+        bar_sets = (self.set_en_curso, self.set_aprobo, self.set_reprobo, self.set_no_realizo)
+        for bar_set in bar_sets:
+            if bar_set.count():
+                bar_set.remove(0, bar_set.count())
+        self.axis_y.clear()
 
         if not cursos_filtrados:
-            self.chart.removeAllSeries()
-            for axis in self.chart.axes(): self.chart.removeAxis(axis)
             self.chart.setTitle("No se encontraron resultados")
             return
 
+        sin_datos = (0, 0, 0, 0, 0)
+        stats = self.cache_stats
+
         def obtener_cantidad_total(curso):
-            return len(self.cache_matriculas.get(curso.id, []))
+            return stats.get(curso.id, sin_datos)[0]
 
         cursos_filtrados.sort(key=obtener_cantidad_total)
         # Limitamos a los últimos 100 para rendimiento si hay demasiados
         cursos_filtrados = cursos_filtrados[-100:]
 
-        set_en_curso = QBarSet("En curso")
-        set_aprobo = QBarSet("Aprobado")
-        set_reprobo = QBarSet("Reprobado")
-        set_no_realizo = QBarSet("No realizó")
-
-        set_en_curso.setColor(QColor("#3498db"))
-        set_aprobo.setColor(QColor("#2ecc71"))
-        set_reprobo.setColor(QColor("#e74c3c"))
-        set_no_realizo.setColor(QColor("#95a5a6"))
-
-        nombres_cursos = []
-        max_valor_x = 0
-
-        for curso in cursos_filtrados:
-            estados = self.cache_matriculas.get(curso.id, [])
-
-            c_en = estados.count("EN CURSO")
-            c_apr = estados.count("APROBADO")
-            c_rep = estados.count("REPROBADO")
-            c_no = estados.count("NO REALIZO")
-
-            total_vis = 0
-            if self.chk_en_curso.isChecked(): total_vis += c_en
-            if self.chk_aprobo.isChecked(): total_vis += c_apr
-            if self.chk_reprobo.isChecked(): total_vis += c_rep
-            if self.chk_no_realizo.isChecked(): total_vis += c_no
-
-            nombres_cursos.append(f"{curso.nombre} (Total: {total_vis})")
-
-            set_en_curso.append(c_en if self.chk_en_curso.isChecked() else 0)
-            set_aprobo.append(c_apr if self.chk_aprobo.isChecked() else 0)
-            set_reprobo.append(c_rep if self.chk_reprobo.isChecked() else 0)
-            set_no_realizo.append(c_no if self.chk_no_realizo.isChecked() else 0)
-
-            if total_vis > max_valor_x: max_valor_x = total_vis
+        # Valores visibles por estado, armados en Python y entregados a Qt en una sola
+        # llamada por conjunto (no una por curso)
+        filas = [stats.get(curso.id, sin_datos) for curso in cursos_filtrados]
+        valores_en = [f[1] * en_on for f in filas]
+        valores_apr = [f[2] * apr_on for f in filas]
+        valores_rep = [f[3] * rep_on for f in filas]
+        valores_no = [f[4] * no_on for f in filas]
+
+        totales = [sum(v) for v in zip(valores_en, valores_apr, valores_rep, valores_no)]
+        nombres_cursos = [
+            f"{curso.nombre} (Total: {total_vis})"
+            for curso, total_vis in zip(cursos_filtrados, totales)
+        ]
 
-        series = QHorizontalStackedBarSeries()
-        series.append(set_en_curso)
-        series.append(set_aprobo)
-        series.append(set_reprobo)
-        series.append(set_no_realizo)
-        series.setLabelsVisible(True)
-        series.setLabelsFormat("@value")
+        for bar_set, valores in zip(bar_sets, (valores_en, valores_apr, valores_rep, valores_no)):
+            bar_set.append(valores)
 
-        self.chart.removeAllSeries()
-        for axis in self.chart.axes(): self.chart.removeAxis(axis)
+        max_valor_x = max(totales) if totales else 0
 
-        self.chart.addSeries(series)
         self.chart.setTitle(f"Resumen de Cursos ({len(cursos_filtrados)} mostrados)")
-
-        axis_y = QBarCategoryAxis()
-        axis_y.append(nombres_cursos)
-        self.chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
-        series.attachAxis(axis_y)
-
-        axis_x = QValueAxis()
-        axis_x.setRange(0, max(5, max_valor_x + 1))
-        axis_x.setLabelFormat("%d")
-        self.chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
-        series.attachAxis(axis_x)
+        self.axis_y.append(nombres_cursos)
+        self.axis_x.setRange(0, max(5, max_valor_x + 1))
 
         altura_necesaria = max(400, (len(cursos_filtrados) * 40) + 100)
         self.chart_view.setMinimumHeight(altura_necesaria)
@@ -616,7 +852,7 @@ class MasterController(QMainWindow):
         """Abre el diálogo para crear un nuevo curso."""
         inputAdiestramiento().exec()
         # Llamada centralizada post-edición
-        self.actualizar_cache_global()
+        self.actualizar_cache_global("cursos")
         # NUEVO: Refrescar la lista de cursos en el controlador de certificados
         if hasattr(self.vista_certificados, 'actualizar_listado_cursos'):
             self.vista_certificados.actualizar_listado_cursos()
@@ -624,15 +860,17 @@ class MasterController(QMainWindow):
     def cambiar_notas(self):
         """Abre el diálogo de gestión de calificaciones."""
         inputNotas().exec()
-        self.actualizar_cache_global()
+        self.actualizar_cache_global("matriculas")
 
     def nuevo_estudiante(self):
         """Abre el diálogo para registrar un nuevo estudiante."""
         inputNewEstudiante().exec()
-        self.actualizar_cache_global()
+        self.actualizar_cache_global("estudiantes")
 
     def importar_archivo(self):
         """Inicia el asistente de importación desde Excel/ODS."""
+        # Importación diferida: la ventana del importador y sus controladores no se cargan al arrancar
+        from utilities.importer_window import GestorImportacion
         GestorImportacion(self).ejecutar()
         # La función actualizar_cache_global ya se encarga de refrescar las sub-vistas
         self.actualizar_cache_global()
@@ -642,22 +880,33 @@ class MasterController(QMainWindow):
     def generar_certificados(self):
         """Abre el diálogo de generación masiva de certificados."""
         inputGenCert().exec()
-        self.actualizar_cache_global()
+        self.actualizar_cache_global("certificados")
 
     def abrir_disenador(self):
         """Abre el gestor de plantillas Word."""
+        from controllers.controlador_plantillas_word import GestorPlantillasWord
         dlg = GestorPlantillasWord(parent=self)
         dlg.exec()
 
-    def cambiar_pagina(self, index):
-        """Cambia la vista actual en el StackedWidget."""
+    def cambiar_pagina(self, index, _checked=False):
+        """Cambia la vista actual en el StackedWidget.
+
+        Args:
+            index (int): Índice de la página destino.
+            _checked (bool): Argumento de `clicked` que llega al conectar con `partial`; se ignora.
+        """
         self.stackedWidget.setCurrentIndex(index)
 
     def _on_tab_changed(self, index):
         """Evento disparado al cambiar de pestaña; refresca datos específicos."""
         if index == 0:
             self._actualizar_dashboard_cards()
+            if self._chart_dirty:
+                self._renderizar_grafico_nativo()
+                self._chart_dirty = False
         elif index == 1 and hasattr(self.vista_estudiantes, 'cargar_datos_tabla'):
+            # Otras vistas (importación, detalle) pudieron alterar el total de registros
+            self.vista_estudiantes.invalidar_cache()
             self.vista_estudiantes.cargar_datos_tabla()
         elif index == 2 and hasattr(self.vista_cursos, 'cargar_datos_tabla'):
             self.vista_cursos.cargar_datos_tabla()
@@ -667,6 +916,7 @@ class MasterController(QMainWindow):
 
     def mostrar_detalle_estudiante(self, estudiante):
         """Navega a la vista de detalle del estudiante."""
+        from controllers.controlador_estudiante_detalle import ControladorDetalleEstudiante
         self.vista_detalle_est = ControladorDetalleEstudiante(estudiante)
 
         # Función interna para manejar el retorno y actualización
@@ -675,11 +925,11 @@ class MasterController(QMainWindow):
             self.actualizar_cache_global()
 
         self.vista_detalle_est.signal_volver.connect(on_volver_estudiante)
-        self.stackedWidget.addWidget(self.vista_detalle_est)
-        self.stackedWidget.setCurrentIndex(self.stackedWidget.count() - 1)
+        self._mostrar_detalle(self.vista_detalle_est)
 
     def mostrar_detalle_curso(self, curso):
         """Navega a la vista de detalle del curso."""
+        from controllers.controlador_curso_detalle import ControladorDetalleCurso
         self.vista_detalle_curso = ControladorDetalleCurso(curso)
 
         # Función interna para manejar el retorno y actualización
@@ -688,11 +938,27 @@ class MasterController(QMainWindow):
             self.actualizar_cache_global()
 
         self.vista_detalle_curso.signal_volver.connect(on_volver_curso)
-        self.stackedWidget.addWidget(self.vista_detalle_curso)
-        self.stackedWidget.setCurrentIndex(self.stackedWidget.count() - 1)
+        self._mostrar_detalle(self.vista_detalle_curso)
+
+    def _mostrar_detalle(self, vista: QWidget):
+        """Coloca una vista de detalle en la posición reservada y la muestra.
+
+        La vista de detalle anterior (si existe) se retira del StackedWidget y se
+        libera con deleteLater(), de modo que el número de páginas no crece.
+
+        Args:
+            vista (QWidget): Controlador de detalle recién creado.
+        """
+        if self.stackedWidget.count() > self.detail_index:
+            anterior = self.stackedWidget.widget(self.detail_index)
+            self.stackedWidget.removeWidget(anterior)
+            anterior.deleteLater()
+        self.stackedWidget.insertWidget(self.detail_index, vista)
+        self.stackedWidget.setCurrentIndex(self.detail_index)
 
     def abrir_reportes(self):
         """Abre el diálogo de generación de reportes avanzados."""
+        from utilities.dialogos import DialogoReportes
         dlg = DialogoReportes(self)
         dlg.exec()
 
@@ -700,7 +966,44 @@ class MasterController(QMainWindow):
         """
         Callback que se ejecuta cuando el ControladorConfiguraciones emite
         la señal de guardado.
+
+        Reemplaza el Engine y su pool con la nueva URL (``rebuild_engine``, que
+        antes prueba la conexión), verifica la estructura de la nueva base y
+        recarga todas las vistas, sin reiniciar la aplicación. Si algo falla se
+        mantiene la base anterior. El resultado se informa a la vista de
+        configuraciones (``resultado_configuracion``).
+
+        Args:
+            nueva_config (dict): Valores guardados en el .env.
         """
-        print("MasterController recibió la nueva configuración:", nueva_config)
-        # Aquí puedes agregar la lógica para reiniciar la conexión a la base de datos,
-        # recargar variables globales, etc., basándote en los nuevos datos.
\ No newline at end of file
+        if "SHARED_FOLDER_PATH" in nueva_config:
+            config.SHARED_FOLDER_PATH = nueva_config["SHARED_FOLDER_PATH"]
+
+        url_anterior = conexion.engine.url.render_as_string(hide_password=False)
+        nueva_url = config.construir_database_url()
+        if nueva_url == url_anterior:
+            self.vista_configuraciones.resultado_configuracion(True)
+            return
+
+        try:
+            conexion.rebuild_engine(nueva_url)
+        except Exception as e:
+            self.vista_configuraciones.resultado_configuracion(
+                False, f"No se pudo conectar con la nueva base de datos:\n{e}"
+            )
+            return
+
+        if not inicializar_base_de_datos():
+            # La base responde pero no se pudo preparar: se vuelve a la anterior
+            try:
+                conexion.rebuild_engine(url_anterior)
+            except Exception as e:
+                print(f"No se pudo volver a la base de datos anterior: {e}")
+            self.vista_configuraciones.resultado_configuracion(
+                False, "La nueva base de datos no pudo inicializarse (ver consola)."
+            )
+            return
+
+        CentroModel.invalidate_cache()
+        self.actualizar_cache_global()
+        self.vista_configuraciones.resultado_configuracion(True)
\ No newline at end of file
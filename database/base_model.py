@@ -10,8 +10,14 @@
 #  copies or substantial portions of the Software.
 
 from sqlalchemy.exc import IntegrityError
-from database.conexion import SessionLocal
-from sqlalchemy import or_
+from sqlalchemy.orm import selectinload
+from database.conexion import SessionLocal, ReadSession
+from collections.abc import Iterator
+from contextlib import contextmanager
+from sqlalchemy import (
+    and_, func, insert, inspect, lambda_stmt, or_, select, text, tuple_, table, column, literal_column,
+    update as sa_update, delete as sa_delete
+)
 
 
 class BaseCRUDModel:
@@ -24,9 +30,27 @@ class BaseCRUDModel:
 
     model = None  # se define en la subclase
 
+    # Índice de texto completo (FTS5, solo SQLite) que acelera los filtros parciales.
+    # Lo declara la subclase; la tabla virtual se crea en database.setup.
+    fts_table: str | None = None
+    fts_columns: frozenset[str] = frozenset()
+
     # ----------------------------
     # MÉTODOS BÁSICOS CRUD
     # ----------------------------
+    @classmethod
+    def _cols(cls) -> frozenset[str]:
+        """Devuelve los nombres de columna del modelo, calculados una sola vez por subclase.
+
+        Returns:
+            frozenset[str]: Nombres (keys) de las columnas de la tabla del modelo.
+        """
+        cols = cls.__dict__.get("_cols_cache")
+        if cols is None:
+            cols = frozenset(c.key for c in cls.model.__table__.columns)
+            cls._cols_cache = cols
+        return cols
+
     @staticmethod
     def _get_session():
         """Crea y devuelve una nueva sesión de base de datos local.
@@ -36,14 +60,85 @@ class BaseCRUDModel:
         """
         return SessionLocal()
 
-    def get_all(self):
+    @staticmethod
+    def _get_read_session():
+        """Crea una sesión para consultas de solo lectura.
+
+        Sin autoflush y con ``expire_on_commit=False``: los métodos de consulta no
+        pagan el vaciado de cambios pendientes y las instancias devueltas pueden
+        leerse sin volver a consultar la base de datos. Las escrituras siguen
+        usando ``_get_session``.
+
+        Returns:
+            Session: Una instancia de sqlalchemy.orm.Session.
+        """
+        return ReadSession()
+
+    @contextmanager
+    def sesion_lectura(self, session=None):
+        """Entrega una sesión de lectura, reutilizando la recibida si la hay.
+
+        Permite que varias consultas (p. ej. los conteos del Dashboard) compartan
+        una sola conexión del pool: quien abre la sesión la cierra.
+
+        Args:
+            session (Session, optional): Sesión existente a reutilizar.
+
+        Yields:
+            Session: La sesión recibida o una nueva de solo lectura.
+        """
+        if session is not None:
+            yield session
+            return
+        with self._get_read_session() as nueva:
+            yield nueva
+
+    def _eager_options(self, eager: list[str] | None) -> list:
+        """Construye las opciones ``selectinload`` para las relaciones indicadas.
+
+        Cada relación se carga con una consulta ``SELECT ... WHERE id IN (...)``
+        adicional para todo el resultado, en lugar de una consulta por fila al
+        acceder a ella (N+1). Además quedan disponibles tras cerrar la sesión.
+
+        Args:
+            eager (list[str], optional): Nombres de relaciones del modelo.
+
+        Returns:
+            list: Opciones de carga para ``query.options``.
+        """
+        if not eager:
+            return []
+        return [selectinload(getattr(self.model, nombre)) for nombre in eager]
+
+    def get_all(self, eager: list[str] | None = None):
         """Recupera todos los registros existentes del modelo.
 
+        Args:
+            eager (list[str], optional): Relaciones a cargar anticipadamente.
+
         Returns:
             list: Lista de todas las instancias del modelo en la base de datos.
         """
-        with self._get_session() as session:
-            return session.query(self.model).all()
+        with self._get_read_session() as session:
+            return session.query(self.model).options(*self._eager_options(eager)).all()
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator:
+        """Recorre todos los registros del modelo por lotes, sin materializarlos a la vez.
+
+        Usa ``yield_per`` para traer ``batch_size`` filas por cada viaje al cursor.
+        La sesión permanece abierta mientras se itera y se cierra al agotar (o
+        descartar) el generador. Para catálogos pequeños (centros, tipos de
+        certificado) ``get_all`` sigue siendo suficiente.
+
+        Args:
+            batch_size (int, optional): Filas a construir por lote. Por defecto 1000.
+
+        Yields:
+            object: Instancias del modelo, una a la vez.
+        """
+        stmt = select(self.model).execution_options(yield_per=batch_size)
+        with self._get_read_session() as session:
+            yield from session.execute(stmt).scalars()
 
     def get_by_id(self, obj_id: int):
         """Busca un registro por su clave primaria (ID).
@@ -54,7 +149,7 @@ class BaseCRUDModel:
         Returns:
             object: La instancia del modelo si existe, None en caso contrario.
         """
-        with self._get_session() as session:
+        with self._get_read_session() as session:
             return session.query(self.model).filter_by(id=obj_id).first()
 
     def create(self, data: dict):
@@ -98,8 +193,9 @@ class BaseCRUDModel:
                 obj = session.query(self.model).filter_by(id=obj_id).first()
                 if not obj:
                     return None
+                cols = self._cols()
                 for key, value in data.items():
-                    if hasattr(obj, key):
+                    if key in cols:
                         setattr(obj, key, value)
                 session.commit()
                 session.refresh(obj)
@@ -108,6 +204,39 @@ class BaseCRUDModel:
                 session.rollback()
                 raise
 
+    def update_fast(self, obj_id: str, data: dict) -> int:
+        """Actualiza un registro con un único ``UPDATE ... WHERE id = :id``.
+
+        A diferencia de ``update`` no carga ni refresca la instancia ORM (sin SELECT
+        previo ni seguimiento de cambios). Usar cuando el llamador no necesita el
+        objeto actualizado.
+
+        Args:
+            obj_id (str): ID del registro a actualizar.
+            data (dict): Diccionario clave-valor con los campos a modificar; las
+                claves que no son columnas del modelo se ignoran.
+
+        Returns:
+            int: Cantidad de filas afectadas (0 si el registro no existe).
+
+        Raises:
+            IntegrityError: Si la actualización viola restricciones de integridad.
+        """
+        cols = self._cols()
+        valores = {k: v for k, v in data.items() if k in cols}
+        if not valores:
+            return 0
+
+        stmt = sa_update(self.model).where(self.model.id == obj_id).values(**valores)
+        with self._get_session() as session:
+            try:
+                result = session.execute(stmt)
+                session.commit()
+                return result.rowcount
+            except IntegrityError:
+                session.rollback()
+                raise
+
     def delete(self, obj_id: int):
         """Elimina un registro de la base de datos por su ID.
 
@@ -125,6 +254,83 @@ class BaseCRUDModel:
             session.commit()
             return True
 
+    def bulk_create(self, rows: list[dict]) -> int:
+        """Inserta varios registros en una sola transacción (INSERT ``executemany``).
+
+        Los valores por defecto de Python (p. ej. el ID con ``generar_uid``) se
+        aplican a cada fila que no los trae.
+
+        Args:
+            rows (list[dict]): Columnas de cada registro; las claves que no son
+                columnas del modelo se ignoran.
+
+        Returns:
+            int: Cantidad de filas enviadas a insertar.
+
+        Raises:
+            IntegrityError: Si alguna fila viola restricciones; no se inserta ninguna.
+        """
+        cols = self._cols()
+        filas = [{k: v for k, v in row.items() if k in cols} for row in rows]
+        if not filas:
+            return 0
+
+        with self._get_session() as session, session.begin():
+            session.execute(insert(self.model), filas)
+        return len(filas)
+
+    def bulk_update(self, rows: list[tuple[str, dict]]) -> int:
+        """Actualiza varios registros por ID en una sola transacción.
+
+        Usa el UPDATE masivo por clave primaria del ORM (``update(model)`` con una
+        lista de diccionarios), que se ejecuta como un ``executemany``.
+
+        Args:
+            rows (list[tuple[str, dict]]): Pares (ID, campos a modificar); las
+                claves que no son columnas del modelo se ignoran.
+
+        Returns:
+            int: Cantidad de filas enviadas a actualizar.
+
+        Raises:
+            IntegrityError: Si alguna actualización viola restricciones; no se aplica ninguna.
+        """
+        cols = self._cols()
+        filas = [
+            {"id": obj_id, **{k: v for k, v in data.items() if k in cols and k != "id"}}
+            for obj_id, data in rows
+        ]
+        if not filas:
+            return 0
+
+        with self._get_session() as session, session.begin():
+            session.execute(sa_update(self.model), filas)
+        return len(filas)
+
+    def delete_fast(self, obj_id: str) -> bool:
+        """Elimina un registro con un único ``DELETE ... WHERE id = :id``.
+
+        No carga el objeto ni sus hijos: las filas dependientes se eliminan en la
+        base de datos mediante los ``ondelete="CASCADE"`` declarados en las claves
+        foráneas (en SQLite requiere ``PRAGMA foreign_keys=ON``, activado al
+        conectar), en lugar de un DELETE por cada hijo emitido desde el ORM.
+
+        Args:
+            obj_id (str): ID del registro a eliminar.
+
+        Returns:
+            bool: True si se eliminó correctamente, False si el registro no existía.
+        """
+        stmt = sa_delete(self.model).where(self.model.id == obj_id)
+        with self._get_session() as session:
+            try:
+                result = session.execute(stmt)
+                session.commit()
+                return result.rowcount > 0
+            except Exception:
+                session.rollback()
+                raise
+
     # ----------------------------
     # MÉTODO AUXILIAR DE FILTRADO
     # ----------------------------
@@ -132,48 +338,246 @@ class BaseCRUDModel:
         """Aplica filtros dinámicos (AND) y de búsqueda parcial (OR) a una consulta.
 
         Args:
-            query (Query): Objeto Query base de SQLAlchemy.
+            query (Query | Select): Consulta base (Query del ORM o ``select()`` de Core).
             filters (dict, optional): Filtros de igualdad exacta (AND). {campo: valor}.
             or_fields (list[tuple], optional): Filtros de búsqueda parcial (OR). [(campo, valor)].
 
         Returns:
-            Query: El objeto Query modificado con los filtros aplicados.
+            Query | Select: La consulta modificada con los filtros aplicados.
         """
+        cols = self._cols()
+
         # Filtros exactos (AND)
         if filters:
             for field, value in filters.items():
-                if hasattr(self.model, field) and value is not None:
+                if field in cols and value is not None:
                     query = query.filter(getattr(self.model, field) == value)
 
         # Filtros parciales (OR)
         if or_fields:
-            or_conditions = []
-            for field, value in or_fields:
-                if hasattr(self.model, field):
-                    column = getattr(self.model, field)
-                    or_conditions.append(column.ilike(f"%{value}%"))
-            if or_conditions:
-                query = query.filter(or_(*or_conditions))
+            condicion = self._condicion_parcial(or_fields)
+            if condicion is not None:
+                query = query.filter(condicion)
 
         return query
 
+    @classmethod
+    def _fts_disponible(cls) -> bool:
+        """Indica si la tabla FTS5 del modelo existe en la base de datos actual.
+
+        Se consulta una sola vez por subclase; en motores distintos de SQLite (o
+        si SQLite no soporta el tokenizador trigram) siempre es False.
+
+        Returns:
+            bool: True si los filtros parciales pueden resolverse con ``MATCH``.
+        """
+        if not cls.fts_table:
+            return False
+        # Se guarda junto al motor consultado: tras rebuild_engine se vuelve a verificar
+        motor = ReadSession.kw.get("bind")
+        cache = cls.__dict__.get("_fts_cache")
+        if cache is not None and cache[0] is motor:
+            return cache[1]
+
+        disponible = False
+        try:
+            with cls._get_read_session() as session:
+                if session.get_bind().dialect.name == "sqlite":
+                    disponible = session.execute(
+                        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :n"),
+                        {"n": cls.fts_table}
+                    ).first() is not None
+        except Exception:
+            disponible = False
+        cls._fts_cache = (motor, disponible)
+        return disponible
+
+    @classmethod
+    def _indice_disponible(cls, nombre: str) -> bool:
+        """Indica si la tabla del modelo tiene el índice o la restricción única ``nombre``.
+
+        Las bases creadas con versiones anteriores pueden carecer de índices que
+        ``inicializar_base_de_datos`` no logró crear (p. ej. por filas duplicadas);
+        quien dependa de uno como destino de ``ON CONFLICT`` debe verificarlo.
+        El resultado se guarda por subclase junto al motor consultado.
+
+        Args:
+            nombre (str): Nombre del índice o de la restricción única.
+
+        Returns:
+            bool: True si existe en la base de datos actual.
+        """
+        motor = ReadSession.kw.get("bind")
+        cache = cls.__dict__.get("_indices_cache")
+        if cache is None or cache[0] is not motor:
+            cache = (motor, {})
+            cls._indices_cache = cache
+
+        if nombre not in cache[1]:
+            try:
+                inspector = inspect(motor)
+                tabla = cls.model.__tablename__
+                nombres = {i["name"] for i in inspector.get_indexes(tabla)}
+                nombres |= {u["name"] for u in inspector.get_unique_constraints(tabla)}
+                cache[1][nombre] = nombre in nombres
+            except Exception:
+                cache[1][nombre] = False
+        return cache[1][nombre]
+
+    def _condicion_parcial(self, or_fields: list[tuple[str, str]]):
+        """Construye la condición OR de búsqueda parcial.
+
+        Si todos los campos buscan el mismo texto (de al menos 3 caracteres, el
+        mínimo del tokenizador trigram) y están indexados en la tabla FTS5 del
+        modelo, filtra con ``rowid IN (SELECT rowid ... MATCH)`` usando el
+        índice. En otro caso usa ``ilike('%texto%')`` sobre cada columna, que en
+        PostgreSQL aprovecha los índices GIN de pg_trgm.
+
+        Args:
+            or_fields (list[tuple]): Filtros parciales. [(campo, valor)].
+
+        Returns:
+            ColumnElement | None: Condición a aplicar, o None si no hay campos válidos.
+        """
+        cols = self._cols()
+        campos = [(field, value) for field, value in or_fields if field in cols]
+        if not campos:
+            return None
+
+        valores = {value for _, value in campos}
+        nombres = [field for field, _ in campos]
+        if len(valores) == 1 and set(nombres) <= self.fts_columns and self._fts_disponible():
+            valor = next(iter(valores))
+            if len(valor) >= 3:
+                frase = valor.replace('"', '""')
+                consulta = f'{{{" ".join(nombres)}}}: "{frase}"'
+                fts = table(self.fts_table, column("rowid"))
+                return literal_column(f"{self.model.__tablename__}.rowid").in_(
+                    select(fts.c.rowid).where(literal_column(self.fts_table).op("MATCH")(consulta))
+                )
+
+        return or_(*(getattr(self.model, field).ilike(f"%{value}%") for field, value in campos))
+
+    def _lambda_filtros(self, stmt, filters: dict | None = None, or_fields: list[tuple[str, str]] | None = None):
+        """Equivalente de ``_apply_filters`` para sentencias ``lambda_stmt``.
+
+        Cada grupo de criterios se agrega como una lambda: SQLAlchemy cachea el SQL
+        compilado por la forma de la sentencia (ubicación de cada lambda y columnas
+        usadas) y los valores de la búsqueda viajan como parámetros, de modo que las
+        consultas repetidas de la UI no reconstruyen ni recompilan la expresión.
+
+        Las igualdades se combinan en un solo ``and_`` fuera de la lambda: una
+        lambda creada dentro del bucle leería sus variables de cierre al compilar,
+        cuando ya contienen el último valor.
+
+        Args:
+            stmt (StatementLambdaElement): Sentencia construida con ``lambda_stmt``.
+            filters (dict, optional): Filtros de igualdad exacta (AND). {campo: valor}.
+            or_fields (list[tuple], optional): Filtros de búsqueda parcial (OR). [(campo, valor)].
+
+        Returns:
+            StatementLambdaElement: La sentencia con los criterios agregados.
+        """
+        cols = self._cols()
+
+        if filters:
+            igualdades = [
+                getattr(self.model, field) == value
+                for field, value in filters.items()
+                if field in cols and value is not None
+            ]
+            if igualdades:
+                criterio_and = and_(*igualdades)
+                stmt += lambda s: s.where(criterio_and)
+
+        if or_fields:
+            criterio = self._condicion_parcial(or_fields)
+            if criterio is not None:
+                stmt += lambda s: s.where(criterio)
+
+        return stmt
+
+    def _ordenes(self, order_by) -> list:
+        """Normaliza ``order_by`` a una lista de expresiones SQL.
+
+        Los nombres de columna (str) se resuelven contra el modelo; cualquier otra
+        cadena se trata como SQL literal (``text``).
+
+        Args:
+            order_by (Column | str | list | tuple, optional): Criterio de ordenamiento.
+
+        Returns:
+            list: Expresiones de ordenamiento, en orden.
+        """
+        if order_by is None:
+            return []
+        ordenes = order_by if isinstance(order_by, (list, tuple)) else (order_by,)
+        cols = self._cols()
+        return [
+            (getattr(self.model, o) if o in cols else text(o)) if isinstance(o, str) else o
+            for o in ordenes
+        ]
+
     # ----------------------------
     # MÉTODOS DE CONSULTA AVANZADA
     # ----------------------------
-    def count(self, filters: dict | None = None, or_fields: list[tuple[str, str]] | None = None):
+    def count(self, filters: dict | None = None, or_fields: list[tuple[str, str]] | None = None, session=None):
         """Cuenta el número de registros que coinciden con los criterios dados.
 
         Args:
             filters (dict, optional): Filtros exactos (AND).
             or_fields (list[tuple], optional): Filtros parciales (OR).
+            session (Session, optional): Sesión a reutilizar; por defecto se abre una.
 
         Returns:
             int: Cantidad de registros encontrados.
         """
-        with self._get_session() as session:
-            query = session.query(self.model)
-            query = self._apply_filters(query, filters, or_fields)
-            return query.count()
+        # SELECT count(*) directo sobre la tabla, sin subconsulta con todas las columnas
+        model = self.model
+        stmt = lambda_stmt(lambda: select(func.count()).select_from(model))
+        stmt = self._lambda_filtros(stmt, filters, or_fields)
+        with self.sesion_lectura(session) as sesion:
+            return sesion.execute(stmt).scalar_one()
+
+    def search_columns(
+        self,
+        columns: list[str] | tuple[str, ...],
+        filters: dict | None = None,
+        order_by=None,
+        limit: int | None = None,
+        offset: int | None = None,
+        or_fields: list[tuple[str, str]] | None = None
+    ) -> list[tuple]:
+        """Como ``search``, pero proyecta solo las columnas indicadas.
+
+        No construye instancias ORM: devuelve tuplas con los valores, útil para
+        listas y combos que solo muestran, por ejemplo, ``id`` y ``nombre``.
+
+        Args:
+            columns (list[str] | tuple[str, ...]): Nombres de las columnas a devolver, en orden.
+            filters (dict, optional): Filtros exactos (AND).
+            order_by (Column | list | tuple, optional): Criterio de ordenamiento SQLAlchemy.
+            limit (int, optional): Límite de registros a devolver.
+            offset (int, optional): Número de registros a saltar.
+            or_fields (list[tuple], optional): Filtros parciales (OR).
+
+        Returns:
+            list[tuple]: Una tupla por registro con los valores de ``columns``.
+        """
+        stmt = select(*(getattr(self.model, c) for c in columns))
+        stmt = self._apply_filters(stmt, filters, or_fields)
+
+        if isinstance(order_by, (list, tuple)):
+            stmt = stmt.order_by(*order_by)
+        elif order_by is not None:
+            stmt = stmt.order_by(order_by)
+        if offset is not None:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        with self._get_read_session() as session:
+            return [tuple(fila) for fila in session.execute(stmt)]
 
     def search(
         self,
@@ -182,30 +586,110 @@ class BaseCRUDModel:
         limit: int | None = None,
         offset: int | None = None,
         first: bool = False,
-        or_fields: list[tuple[str, str]] | None = None
+        or_fields: list[tuple[str, str]] | None = None,
+        after: tuple | None = None,
+        cursor_columns: tuple[str, ...] | None = None,
+        eager: list[str] | None = None
     ):
         """Realiza una búsqueda avanzada con filtros, ordenamiento y paginación.
 
+        Admite dos modos de paginación:
+
+        - OFFSET (``offset``): salta ``offset`` filas; útil para saltos a una
+          página arbitraria, pero su costo crece con la profundidad.
+        - Cursor/keyset (``after`` + ``cursor_columns``): devuelve las filas
+          posteriores a ``after`` ordenadas por ``cursor_columns``, de modo que
+          cada página es un salto por índice. En este modo ``order_by`` y
+          ``offset`` se ignoran; las columnas deben identificar cada fila de forma
+          única (terminar en ``id``). El cursor de la página siguiente se obtiene
+          con ``cursor_de`` sobre el último resultado.
+
         Args:
             filters (dict, optional): Filtros exactos (AND).
-            order_by (Column, optional): Criterio de ordenamiento SQLAlchemy.
+            order_by (Column | list | tuple, optional): Criterio de ordenamiento SQLAlchemy.
+                Una lista o tupla ordena por varias columnas en ese orden.
             limit (int, optional): Límite de registros a devolver.
             offset (int, optional): Número de registros a saltar.
             first (bool, optional): Si True, devuelve solo el primer resultado.
             or_fields (list[tuple], optional): Filtros parciales (OR).
+            after (tuple, optional): Valores de ``cursor_columns`` de la última fila
+                de la página anterior.
+            cursor_columns (tuple[str, ...], optional): Columnas del cursor, en orden.
+            eager (list[str], optional): Relaciones a cargar anticipadamente
+                (``selectinload``), p. ej. ``["matriculas"]``.
 
         Returns:
             list | object: Lista de resultados o una instancia única si first=True.
         """
-        with self._get_session() as session:
-            query = session.query(self.model)
+        keyset = after is not None and cursor_columns
+        if not keyset and not eager:
+            return self._search_lambda(filters, order_by, limit, offset, first, or_fields)
+
+        with self._get_read_session() as session:
+            query = session.query(self.model).options(*self._eager_options(eager))
             query = self._apply_filters(query, filters, or_fields)
 
-            if order_by is not None:
-                query = query.order_by(order_by)
-            if offset is not None:
-                query = query.offset(offset)
+            if keyset:
+                columnas = [getattr(self.model, c) for c in cursor_columns]
+                query = (
+                    query
+                    .filter(tuple_(*columnas) > tuple_(*after))
+                    .order_by(*columnas)
+                )
+            else:
+                if isinstance(order_by, (list, tuple)):
+                    query = query.order_by(*order_by)
+                elif order_by is not None:
+                    query = query.order_by(order_by)
+                if offset is not None:
+                    query = query.offset(offset)
             if limit is not None:
                 query = query.limit(limit)
 
-            return query.first() if first else query.all()
\ No newline at end of file
+            return query.first() if first else query.all()
+
+    def _search_lambda(self, filters, order_by, limit, offset, first, or_fields):
+        """Ruta común de ``search`` (sin cursor ni carga anticipada) con ``lambda_stmt``.
+
+        Args:
+            filters (dict, optional): Filtros exactos (AND).
+            order_by (Column | str | list | tuple, optional): Criterio de ordenamiento.
+            limit (int, optional): Límite de registros a devolver.
+            offset (int, optional): Número de registros a saltar.
+            first (bool): Si True, devuelve solo el primer resultado.
+            or_fields (list[tuple], optional): Filtros parciales (OR).
+
+        Returns:
+            list | object: Lista de resultados o una instancia única si first=True.
+        """
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model))
+        stmt = self._lambda_filtros(stmt, filters, or_fields)
+
+        for orden in self._ordenes(order_by):
+            stmt += lambda s: s.order_by(orden)
+        if offset is not None:
+            stmt += lambda s: s.offset(offset)
+        if first:
+            limit = 1
+        if limit is not None:
+            stmt += lambda s: s.limit(limit)
+
+        with self._get_read_session() as session:
+            resultado = session.execute(stmt).scalars()
+            return resultado.first() if first else resultado.all()
+
+    @staticmethod
+    def cursor_de(obj, cursor_columns: tuple[str, ...]) -> tuple | None:
+        """Construye el cursor (keyset) de un registro para pedir la página siguiente.
+
+        Args:
+            obj (object | None): Última instancia de la página actual.
+            cursor_columns (tuple[str, ...]): Columnas del cursor, en orden.
+
+        Returns:
+            tuple | None: Valores de las columnas, o None si no hay registro.
+        """
+        if obj is None:
+            return None
+        return tuple(getattr(obj, c) for c in cursor_columns)
\ No newline at end of file
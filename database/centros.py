@@ -10,8 +10,17 @@
 #  copies or substantial portions of the Software.
 
 from typing import Optional
+from sqlalchemy import exists, select
 from sqlalchemy.exc import SQLAlchemyError
 from database.models import Centro
+from utilities.uid import generar_uids
+
+# Formato del nombre estándar por tipo de centro
+_NOMBRE_TMPL = {
+    "ZONAL": "CENTRO ZONAL ECU 911 {}",
+    "LOCAL": "CENTRO LOCAL ECU 911 {}",
+    "SALA": "SALA {}",
+}
 
 
 def generar_nombre_centro(tipo: str, ubicacion: str) -> str:
@@ -24,14 +33,7 @@ def generar_nombre_centro(tipo: str, ubicacion: str) -> str:
     Returns:
         str: Nombre formateado (ej. "CENTRO ZONAL ECU 911 QUITO").
     """
-    """Genera el nombre estándar según el tipo y ubicación."""
-    if tipo == "ZONAL":
-        return f"CENTRO ZONAL ECU 911 {ubicacion}"
-    elif tipo == "LOCAL":
-        return f"CENTRO LOCAL ECU 911 {ubicacion}"
-    elif tipo == "SALA":
-        return f"SALA {ubicacion}"
-    return f"CENTRO {ubicacion}"
+    return _NOMBRE_TMPL.get(tipo, "CENTRO {}").format(ubicacion)
 
 
 def insertar_centros(session):
@@ -51,11 +53,14 @@ def insertar_centros(session):
 
     try:
         # Verificación de seguridad extra por si se llama manualmente
-        if session.query(Centro).first():
+        if session.execute(select(exists().select_from(Centro))).scalar():
             print("⚠️ La base de datos ya contiene centros. Abortando población.")
             return
 
-        centros_map = {}
+        # ubicacion -> id (solo cadenas: no se retienen objetos ORM entre niveles)
+        centros_map: dict[str, str] = {}
+        # Filas como diccionarios: un executemany de Core por nivel, sin ORM
+        insert_centros = Centro.__table__.insert()
 
         # 1. ZONALES
         data_zonales = [
@@ -67,17 +72,19 @@ def insertar_centros(session):
         print("   -> Insertando Zonales...")
         centro_padre_id: Optional[str] = None
         # 1. ZONALES
-        for siglas, ubicacion in data_zonales:
-            nuevo_zonal = Centro(
+        # El ID se genera en el cliente: los hijos pueden referenciarlo sin consultar la BD
+        zonales = []
+        for (siglas, ubicacion), uid in zip(data_zonales, generar_uids(len(data_zonales))):
+            zonales.append(dict(
+                id=uid,
                 nombre=generar_nombre_centro("ZONAL", ubicacion),
                 siglas=siglas,
                 ubicacion=ubicacion,
                 tipo="ZONAL",
                 centro_padre_id=centro_padre_id
-            )
-            session.add(nuevo_zonal)
-            session.flush()  # <- esto asegura que nuevo_zonal.id se genere inmediatamente
-            centros_map[ubicacion] = nuevo_zonal
+            ))
+            centros_map[ubicacion] = uid
+        session.execute(insert_centros, zonales)
 
         # 2. LOCALES
         data_locales = [
@@ -89,19 +96,21 @@ def insertar_centros(session):
         ]
 
         print("   -> Insertando Locales...")
-        for siglas, ubicacion, nombre_padre in data_locales:
-            padre = centros_map.get(nombre_padre)
-            if padre:
-                nuevo_local = Centro(
+        locales = []
+        for (siglas, ubicacion, nombre_padre), uid in zip(data_locales, generar_uids(len(data_locales))):
+            padre_id = centros_map.get(nombre_padre)
+            if padre_id:
+                locales.append(dict(
+                    id=uid,
                     nombre=generar_nombre_centro("LOCAL", ubicacion),
                     siglas=siglas,
                     ubicacion=ubicacion,
                     tipo="LOCAL",
-                    centro_padre_id=padre.id
-                )
-                session.add(nuevo_local)
-                centros_map[ubicacion] = nuevo_local
-        session.flush()
+                    centro_padre_id=padre_id
+                ))
+                centros_map[ubicacion] = uid
+        if locales:
+            session.execute(insert_centros, locales)
 
         # 3. SALAS OPERATIVAS
         data_hijos = [
@@ -115,17 +124,20 @@ def insertar_centros(session):
         ]
 
         print("   -> Insertando Salas Operativas...")
-        for siglas, ubicacion, nombre_padre in data_hijos:
-            padre = centros_map.get(nombre_padre)
-            if padre:
-                nueva_sala = Centro(
+        salas = []
+        for (siglas, ubicacion, nombre_padre), uid in zip(data_hijos, generar_uids(len(data_hijos))):
+            padre_id = centros_map.get(nombre_padre)
+            if padre_id:
+                salas.append(dict(
+                    id=uid,
                     nombre=generar_nombre_centro("SALA", ubicacion),
                     siglas=siglas,
                     ubicacion=ubicacion,
                     tipo="SALA",
-                    centro_padre_id=padre.id
-                )
-                session.add(nueva_sala)
+                    centro_padre_id=padre_id
+                ))
+        if salas:
+            session.execute(insert_centros, salas)
 
         session.commit()
         print("✅ Jerarquía de centros poblada exitosamente.")
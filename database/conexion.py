@@ -1,12 +1,57 @@
 #  Copyright (c) 2026 Fleer
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, make_url, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
-from .config import DATABASE_URL  # <--- Importamos desde config
+from sqlalchemy.pool import StaticPool
+from .config import DATABASE_URL, construir_database_url  # <--- Importamos desde config
+
+def crear_engine(url: str) -> Engine:
+    """Crea el Engine con un pool de conexiones ajustado al motor de base de datos.
+
+    - SQLite en archivo: QueuePool (una conexión por hilo activo, reutilizadas).
+      Las vistas consultan desde hilos de QThreadPool, por lo que SQLite debe
+      aceptar conexiones creadas en un hilo distinto al que las usa (el pool
+      nunca entrega la misma conexión a dos hilos a la vez).
+    - SQLite en memoria: StaticPool, para que todos compartan la misma base.
+    - Servidor (PostgreSQL): pool dimensionado, verificación previa de la
+      conexión y reciclado periódico para sobrevivir a cortes de red. Los
+      INSERT masivos se agrupan en páginas de 1000 filas (insertmanyvalues) y,
+      con psycopg2, los UPDATE/DELETE masivos usan ``execute_batch``.
+
+    Args:
+        url (str): URL de conexión de SQLAlchemy.
+
+    Returns:
+        Engine: Motor listo para usarse.
+    """
+    # echo=True solo si quieres ver el SQL en consola
+    if url.startswith("sqlite"):
+        connect_args = {"check_same_thread": False}
+        if ":memory:" in url or url in ("sqlite://", "sqlite:///"):
+            return create_engine(url, echo=False, connect_args=connect_args, poolclass=StaticPool)
+        return create_engine(url, echo=False, connect_args=connect_args, pool_size=5, max_overflow=10)
+
+    opciones_driver = {}
+    if make_url(url).get_driver_name() == "psycopg2":
+        opciones_driver = {
+            "executemany_mode": "values_plus_batch",
+            "executemany_batch_page_size": 500,
+        }
+
+    return create_engine(
+        url,
+        echo=False,
+        pool_size=8,
+        max_overflow=16,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        insertmanyvalues_page_size=1000,
+        **opciones_driver
+    )
+
 
 # Crear Engine
-# echo=True solo si quieres ver el SQL en consola
-engine = create_engine(DATABASE_URL, echo=False)
+engine = crear_engine(DATABASE_URL)
 
 # --- CORRECCIÓN ---
 # Escuchamos el evento en TODOS los motores, pero validamos dentro
@@ -16,7 +61,9 @@ def activar_foreign_keys_sqlite(dbapi_connection, connection_record):
     """Activa el soporte de claves foráneas (Foreign Keys) para conexiones SQLite.
 
     SQLAlchemy no habilita esto por defecto en SQLite. Se ejecuta automáticamente
-    al conectar si el driver es 'sqlite3'.
+    al conectar si el driver es 'sqlite3'. Además activa el modo WAL y ajusta la
+    caché de páginas para que las lecturas repetidas de la UI no paguen el costo
+    del journal/fsync en cada transacción.
 
     Args:
         dbapi_connection: La conexión cruda de la DBAPI.
@@ -27,6 +74,10 @@ def activar_foreign_keys_sqlite(dbapi_connection, connection_record):
         cursor = dbapi_connection.cursor()
         try:
             cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
         except Exception:
             # Si por alguna razón falla o no es SQLite, ignoramos el error
             pass
@@ -34,4 +85,44 @@ def activar_foreign_keys_sqlite(dbapi_connection, connection_record):
             cursor.close()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
\ No newline at end of file
+# Sesiones de solo lectura: los objetos devueltos conservan sus atributos
+# cargados (sin expirar) y pueden leerse sin un nuevo SELECT.
+ReadSession = sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+Base = declarative_base()
+
+
+def rebuild_engine(url: str | None = None) -> Engine:
+    """Reemplaza el Engine (y su pool) por uno nuevo sin reiniciar la aplicación.
+
+    Antes de reemplazarlo verifica el nuevo motor con una conexión real
+    (``SELECT 1``); si falla, el motor actual se conserva intacto. Después
+    cierra las conexiones del pool anterior y vuelve a enlazar ``SessionLocal``
+    y ``ReadSession``, de modo que toda sesión creada a partir de ahora usa la
+    nueva base de datos. Quien necesite el motor debe leer ``conexion.engine``
+    en el momento de usarlo, no una referencia importada al inicio.
+
+    Args:
+        url (str, optional): Nueva URL de conexión. Por defecto se reconstruye
+            desde las variables de entorno actuales.
+
+    Returns:
+        Engine: El nuevo motor.
+
+    Raises:
+        Exception: Si no es posible conectarse con la nueva base de datos.
+    """
+    global engine
+    nuevo = crear_engine(url or construir_database_url())
+    try:
+        with nuevo.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception:
+        nuevo.dispose()
+        raise
+
+    anterior = engine
+    engine = nuevo
+    SessionLocal.configure(bind=engine)
+    ReadSession.configure(bind=engine)
+    anterior.dispose()
+    return engine
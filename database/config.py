@@ -1,7 +1,7 @@
 #  Copyright (c) 2026 Fleer
 import os
 import sys
-from dotenv import load_dotenv, set_key
+from dotenv import load_dotenv, set_key, unset_key
 
 # 1. DETERMINAR RUTAS BASE
 if getattr(sys, 'frozen', False):
@@ -25,18 +25,44 @@ def actualizar_env(clave, valor):
         clave (str): Nombre de la variable de entorno.
         valor (str): Valor a asignar.
     """
+    valor = str(valor)
+    # Sin cambios no se reescribe el archivo
+    if os.path.exists(ENV_PATH) and os.environ.get(clave) == valor:
+        return
     if not os.path.exists(ENV_PATH):
         with open(ENV_PATH, 'w') as f: f.write("")
-    set_key(ENV_PATH, clave, str(valor))
+    set_key(ENV_PATH, clave, valor)
+    # El proceso actual ve el nuevo valor sin releer el .env
+    os.environ[clave] = valor
+
+def restaurar_env(valores: dict):
+    """Devuelve variables del .env a valores tomados previamente.
+
+    Args:
+        valores (dict): {clave: valor previo}; None indica que la variable no
+            existía y se elimina.
+    """
+    for clave, valor in valores.items():
+        if valor is not None:
+            actualizar_env(clave, valor)
+            continue
+        if os.path.exists(ENV_PATH) and clave in os.environ:
+            unset_key(ENV_PATH, clave)
+        os.environ.pop(clave, None)
 
 # 2. CONFIGURACIÓN DE BASE DE DATOS
-DB_TYPE = os.getenv("DB_TYPE", "sqlite")
-DB_NAME = os.getenv("DB_NAME", "academia.db")
+def construir_database_url() -> str:
+    """Construye la URL de conexión a partir de las variables de entorno actuales.
+
+    Returns:
+        str: URL de SQLAlchemy (SQLite local, o PostgreSQL si hay credenciales
+        completas; si faltan, una base SQLite de respaldo).
+    """
+    db_type = os.getenv("DB_TYPE", "sqlite")
+    if db_type == "sqlite":
+        db_path = os.path.join(BASE_DIR, os.getenv("DB_NAME", "academia.db"))
+        return f"sqlite:///{db_path}"
 
-if DB_TYPE == "sqlite":
-    db_path = os.path.join(BASE_DIR, DB_NAME)
-    DATABASE_URL = f"sqlite:///{db_path}"
-else:
     _user = os.getenv("DB_USER")
     _pass = os.getenv("DB_PASS")
     _host = os.getenv("DB_HOST")
@@ -45,9 +71,13 @@ else:
 
     if not all([_user, _pass, _host, _name]):
         fallback_path = os.path.join(BASE_DIR, 'temp_fallback.db')
-        DATABASE_URL = f"sqlite:///{fallback_path}"
-    else:
-        DATABASE_URL = f"postgresql://{_user}:{_pass}@{_host}:{_port}/{_name}"
+        return f"sqlite:///{fallback_path}"
+    return f"postgresql://{_user}:{_pass}@{_host}:{_port}/{_name}"
+
+
+DB_TYPE = os.getenv("DB_TYPE", "sqlite")
+DB_NAME = os.getenv("DB_NAME", "academia.db")
+DATABASE_URL = construir_database_url()
 
 # 3. RUTAS DE ASSETS, ESTILOS Y CARPETA COMPARTIDA
 ASSETS_DIR = os.path.join(BASE_DIR, 'assets')
@@ -11,7 +11,7 @@
 
 from sqlalchemy import (
     Column, String, Float, ForeignKey, Date, JSON,
-    UniqueConstraint, Enum, Integer, Boolean, LargeBinary
+    UniqueConstraint, Enum, Integer, Boolean, LargeBinary, Index
 )
 from sqlalchemy.orm import relationship
 from database.conexion import Base
@@ -33,7 +33,8 @@ class Centro(Base):
     centro_padre_id = Column(
         String(26),
         ForeignKey("centros.id", ondelete="SET NULL"),
-        nullable=True
+        nullable=True,
+        index=True
     )
 
     hijos = relationship(
@@ -86,6 +87,13 @@ class Persona(Base):
 
     centro = relationship("Centro", back_populates="personas")
 
+    __table_args__ = (
+        # Cursor de paginación por (nombre, id) en el listado de estudiantes
+        Index("ix_personas_nombre_id", "nombre", "id"),
+        # Listados filtrados por centro y rol (también cubre los filtros/joins por centro_id)
+        Index("ix_persona_centro_rol", "centro_id", "rol"),
+    )
+
 
 class PlantillaCertificado(Base):
     """
@@ -128,7 +136,8 @@ class Curso(Base):
     plantilla_id = Column(
         String(26),
         ForeignKey("plantillas_certificado.id", ondelete="SET NULL"),
-        nullable=True
+        nullable=True,
+        index=True
     )
 
     plantilla = relationship("PlantillaCertificado", back_populates="cursos")
@@ -136,6 +145,11 @@ class Curso(Base):
     certificados = relationship("Certificado", back_populates="curso", cascade="all, delete-orphan")
     evaluaciones = relationship("EvaluacionCurso", back_populates="curso", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Cursor de paginación por (nombre, id) en el listado de cursos
+        Index("ix_cursos_nombre_id", "nombre", "id"),
+    )
+
 
 class Matricula(Base):
     """Modelo asociativo que vincula a una Persona con un Curso y registra su estado académico."""
@@ -151,12 +165,14 @@ class Matricula(Base):
     curso_id = Column(
         String(26),
         ForeignKey("cursos.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     centro_id = Column(
         String(26),
         ForeignKey("centros.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     nota_final = Column(Float)
@@ -174,6 +190,13 @@ class Matricula(Base):
         cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Índice único (y no UniqueConstraint) para que inicializar_base_de_datos lo
+        # agregue también a bases existentes. Indexa (persona_id, curso_id) y, por
+        # prefijo, persona_id; es el destino del ON CONFLICT de create_if_absent.
+        Index("uq_matricula_persona_curso", "persona_id", "curso_id", unique=True),
+    )
+
 
 class Calificacion(Base):
     """Modelo que almacena la nota de un estudiante en una evaluación específica."""
@@ -190,7 +213,8 @@ class Calificacion(Base):
     evaluacion_curso_id = Column(
         String(26),
         ForeignKey("evaluaciones_curso.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     puntaje = Column(Float, default=0.0, nullable=False)
@@ -198,6 +222,12 @@ class Calificacion(Base):
     matricula = relationship("Matricula", back_populates="calificaciones")
     evaluacion = relationship("EvaluacionCurso")
 
+    __table_args__ = (
+        # Una nota por evaluación y matrícula: destino del UPSERT (ON CONFLICT).
+        # Por prefijo también cubre los filtros por matricula_id.
+        Index("uq_calificacion_matricula_evaluacion", "matricula_id", "evaluacion_curso_id", unique=True),
+    )
+
 
 class CedulaAlias(Base):
     """Modelo para registrar variantes o errores comunes de una cédula para corrección automática."""
@@ -241,12 +271,14 @@ class Certificado(Base):
     curso_id = Column(
         String(26),
         ForeignKey("cursos.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     tipo_certificado_id = Column(
         String(26),
         ForeignKey("tipos_certificado.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     fecha_emision = Column(Date, nullable=False)
@@ -257,6 +289,11 @@ class Certificado(Base):
     tipo_certificado = relationship("TipoCertificado")
     curso = relationship("Curso", back_populates="certificados")
 
+    __table_args__ = (
+        # Búsqueda por (persona, curso); por prefijo también sirve a los filtros por persona_id
+        Index("ix_cert_persona_curso", "persona_id", "curso_id"),
+    )
+
 
 class EvaluacionCurso(Base):
     """Modelo que define una actividad evaluativa (Examen, Tarea) dentro de un curso."""
@@ -266,7 +303,8 @@ class EvaluacionCurso(Base):
     curso_id = Column(
         String(26),
         ForeignKey("cursos.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     nombre = Column(String(255), nullable=False)
@@ -11,10 +11,12 @@
 
 import random
 from datetime import timedelta
+from itertools import islice
 from faker import Faker
 from sqlalchemy.orm import Session
 from database.conexion import engine, Base
 from database.models import Curso  # Asegúrate de importar tu modelo Curso
+from utilities.uid import generar_uids
 
 # Crear tablas si no existen
 Base.metadata.create_all(bind=engine)
@@ -31,12 +33,21 @@ PARTICIPANTES_OBJETIVO = [
     "Ciudadanía en general"
 ]
 
+# Filas por sentencia INSERT multi-fila
+TAMANO_LOTE = 1000
 
-def generar_curso_aleatorio():
-    """Genera una instancia de Curso con datos ficticios para pruebas.
+
+def generar_curso_aleatorio(uid: str):
+    """Genera las columnas de un Curso con datos ficticios para pruebas.
+
+    Devuelve un diccionario plano (con el ID ya generado) en lugar de una
+    instancia ORM, listo para un INSERT masivo de Core.
+
+    Args:
+        uid (str): ID pregenerado del curso (ver ``generar_uids``).
 
     Returns:
-        Curso: Objeto curso con datos aleatorios (nombre, fechas, modalidad, etc).
+        dict: Columnas del curso con datos aleatorios (nombre, fechas, modalidad, etc).
     """
     nombre = f"{faker.word().capitalize()} {faker.word().capitalize()} {faker.random_number(digits=4)}"
     tipo_curso = random.choice(TIPOS_CURSO)
@@ -52,7 +63,8 @@ def generar_curso_aleatorio():
     # Participantes objetivo aleatorios
     participantes = random.sample(PARTICIPANTES_OBJETIVO, k=random.randint(1, len(PARTICIPANTES_OBJETIVO)))
 
-    return Curso(
+    return dict(
+        id=uid,
         nombre=nombre,
         tipo_curso=tipo_curso,
         modalidad=modalidad,
@@ -71,11 +83,14 @@ def crear_cursos(n=500):
     Args:
         n (int, optional): Cantidad de cursos a generar. Defaults to 500.
     """
-    with Session(engine) as session:
-        cursos = [generar_curso_aleatorio() for _ in range(n)]
-        session.add_all(cursos)
-        session.commit()
-        print(f"✅ Se han creado {n} cursos de prueba exitosamente.")
+    cursos = (generar_curso_aleatorio(uid) for uid in generar_uids(n))
+    insert_cursos = Curso.__table__.insert()
+
+    # Una sola transacción; cada lote viaja como un INSERT multi-fila (sin unit of work del ORM)
+    with Session(engine) as session, session.begin():
+        while lote := list(islice(cursos, TAMANO_LOTE)):
+            session.execute(insert_cursos, lote)
+    print(f"✅ Se han creado {n} cursos de prueba exitosamente.")
 
 
 if __name__ == "__main__":
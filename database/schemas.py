@@ -1,15 +1,17 @@
 from dataclasses import dataclass, field
-from typing import List, Any, Optional
+from typing import List, Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class DetalleCalificacion:
     """Estructura ligera para almacenar el puntaje de una evaluación específica."""
     evaluacion_id: str  # UUID de la tabla evaluaciones_curso
     puntaje: float
 
 
-@dataclass
+@dataclass(slots=True)
 class RegistroImportado:
     """
     Representa una fila procesada del Excel durante la importación.
@@ -33,10 +35,38 @@ class RegistroImportado:
     es_valida_algoritmo: bool = False
     es_no_realizo: bool = False
 
-    raw_row: Any = None
+
+@dataclass(slots=True)
+class RegistrosBatch:
+    """
+    Filas del Excel ya limpiadas, guardadas por columnas (una secuencia por campo).
+    Los campos numéricos y las banderas son arreglos NumPy, de modo que estados y
+    máscaras se calculan sobre la columna completa; la posición i de cada campo
+    corresponde a la misma fila. Se convierte a `RegistroImportado` para la revisión.
+    """
+    filas_excel: np.ndarray           # (N,) int: número de fila en la hoja
+    cedula_original: List[str]
+    cedula_limpia: List[str]          # Cédula final (resuelta por alias si aplica)
+    nombre_limpio: List[str]
+    centro_nombre: List[str]
+    correo: List[str]
+    institucion: List[str]
+
+    # Datos calculados
+    notas: np.ndarray                 # (N, K) float: puntaje por evaluación
+    nota_final: np.ndarray            # (N,) float
+    estado_sugerido: np.ndarray       # (N,) str
+
+    # Metadatos de validación (máscaras booleanas)
+    es_alias_conocido: np.ndarray
+    es_valida_algoritmo: np.ndarray
+    es_no_realizo: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.nota_final)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultadoProceso:
     """Resumen final de la operación de guardado tras una importación masiva."""
     nuevos_estudiantes: int = 0      # Personas que no existían en BD
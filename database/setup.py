@@ -9,11 +9,13 @@
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
 
-from sqlalchemy import inspect, event
+from sqlalchemy import inspect, event, text, exists, select, insert, func
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
 
-from database.conexion import engine, Base, SessionLocal
-from database.models import Centro, TipoCertificado
+from database import conexion
+from database.conexion import Base, SessionLocal
+from database.models import Calificacion, Centro, TipoCertificado
 
 # Lista por defecto movida aquí. Solo se usa para la primera inicialización.
 TIPOS_CERTIFICADO_DEFAULT = [
@@ -42,6 +44,129 @@ def activar_foreign_keys_sqlite(dbapi_connection, connection_record):
             pass
 
 
+# -------------------------------------------------
+# Índices de búsqueda parcial (ilike '%texto%')
+# -------------------------------------------------
+_FTS_PERSONAS_COLS = "nombre, cedula, institucion_articulada"
+
+_DDL_FTS_SQLITE = [
+    # Tabla FTS5 de contenido externo: indexa las columnas de 'personas' sin duplicarlas.
+    # Nota: 'personas' no tiene INTEGER PRIMARY KEY, por lo que un VACUUM puede
+    # renumerar los rowid; verificar_indice_fts() lo detecta y reconstruye al iniciar.
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS personas_fts USING fts5(
+        {_FTS_PERSONAS_COLS}, content='personas', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS personas_fts_ai AFTER INSERT ON personas BEGIN
+        INSERT INTO personas_fts(rowid, {_FTS_PERSONAS_COLS})
+        VALUES (new.rowid, new.nombre, new.cedula, new.institucion_articulada);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS personas_fts_ad AFTER DELETE ON personas BEGIN
+        INSERT INTO personas_fts(personas_fts, rowid, {_FTS_PERSONAS_COLS})
+        VALUES ('delete', old.rowid, old.nombre, old.cedula, old.institucion_articulada);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS personas_fts_au AFTER UPDATE ON personas BEGIN
+        INSERT INTO personas_fts(personas_fts, rowid, {_FTS_PERSONAS_COLS})
+        VALUES ('delete', old.rowid, old.nombre, old.cedula, old.institucion_articulada);
+        INSERT INTO personas_fts(rowid, {_FTS_PERSONAS_COLS})
+        VALUES (new.rowid, new.nombre, new.cedula, new.institucion_articulada);
+    END""",
+]
+
+_DDL_TRGM_POSTGRES = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_persona_nombre_trgm ON personas USING gin (nombre gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_persona_cedula_trgm ON personas USING gin (cedula gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_persona_institucion_trgm "
+    "ON personas USING gin (institucion_articulada gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_curso_nombre_trgm ON cursos USING gin (nombre gin_trgm_ops)",
+]
+
+
+def verificar_indice_fts():
+    """
+    Reconstruye ``personas_fts`` si ya no coincide con la tabla ``personas``.
+
+    La tabla FTS5 se enlaza por ``rowid``, que un VACUUM puede renumerar; en ese
+    caso ``MATCH`` devolvería otras personas. El ``integrity-check`` con rango 1
+    compara el índice contra la tabla de contenido y falla si difieren.
+    """
+    engine = conexion.engine
+    try:
+        with engine.begin() as conn:
+            conn.exec_driver_sql("INSERT INTO personas_fts(personas_fts, rank) VALUES ('integrity-check', 1)")
+    except DBAPIError:
+        print("ℹ️ Índice de búsqueda desincronizado; reconstruyendo...")
+        with engine.begin() as conn:
+            conn.exec_driver_sql("INSERT INTO personas_fts(personas_fts) VALUES ('rebuild')")
+
+
+def crear_indices_busqueda():
+    """
+    Crea los índices que permiten resolver las búsquedas parciales sin recorrer
+    toda la tabla.
+
+    - SQLite: tabla FTS5 (tokenizador trigram) sobre personas, sincronizada con
+      triggers; BaseCRUDModel la usa con ``MATCH``. Al crearla por primera vez se
+      indexan las filas existentes; si ya existía se verifica que siga
+      sincronizada (``verificar_indice_fts``).
+    - PostgreSQL: extensión pg_trgm e índices GIN, que el ``ilike`` existente
+      aprovecha directamente.
+
+    Si el motor no lo soporta (SQLite sin trigram, pg_trgm sin permisos) se
+    continúa con la búsqueda ``ilike`` sin índice.
+    """
+    engine = conexion.engine
+    dialecto = engine.dialect.name
+    try:
+        with engine.begin() as conn:
+            if dialecto == "sqlite":
+                existia = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'personas_fts'")
+                ).first() is not None
+                for ddl in _DDL_FTS_SQLITE:
+                    conn.exec_driver_sql(ddl)
+                if not existia:
+                    conn.exec_driver_sql("INSERT INTO personas_fts(personas_fts) VALUES ('rebuild')")
+            elif dialecto == "postgresql":
+                for ddl in _DDL_TRGM_POSTGRES:
+                    conn.exec_driver_sql(ddl)
+        if dialecto == "sqlite" and existia:
+            verificar_indice_fts()
+    except Exception as e:
+        print(f"⚠️ Índices de búsqueda no disponibles ({dialecto}): {e}")
+
+
+def calificaciones_duplicadas() -> list[tuple[str, str, int]]:
+    """
+    Busca parejas (matrícula, evaluación) con más de una calificación.
+
+    Las bases anteriores al índice único ``uq_calificacion_matricula_evaluacion``
+    pueden tenerlas. No se borran automáticamente: la versión anterior editaba
+    la fila que devolviera la consulta (sin orden), así que no hay forma segura
+    de saber cuál es la vigente. Mientras existan, el índice no se crea y
+    ``CalificacionModel.bulk_upsert`` guarda fila por fila.
+
+    Returns:
+        list[tuple[str, str, int]]: (matricula_id, evaluacion_curso_id, cantidad)
+        de cada pareja repetida; vacía si el índice ya existe o no hay duplicados.
+    """
+    engine = conexion.engine
+    inspector = inspect(engine)
+    if not inspector.has_table(Calificacion.__tablename__):
+        return []
+    if any(i["name"] == "uq_calificacion_matricula_evaluacion"
+           for i in inspector.get_indexes(Calificacion.__tablename__)):
+        return []
+
+    stmt = (
+        select(Calificacion.matricula_id, Calificacion.evaluacion_curso_id, func.count())
+        .group_by(Calificacion.matricula_id, Calificacion.evaluacion_curso_id)
+        .having(func.count() > 1)
+    )
+    with engine.connect() as conn:
+        return [tuple(fila) for fila in conn.execute(stmt)]
+
+
 def inicializar_base_de_datos():
     """
     Crea la estructura de la base de datos si no existe
@@ -49,16 +174,43 @@ def inicializar_base_de_datos():
 
     Verifica la existencia de tablas mediante inspección y si están vacías,
     ejecuta rutinas de población inicial.
+
+    Returns:
+        bool: True si la estructura y los datos iniciales quedaron listos; False
+        si falló (el error se imprime en consola).
     """
+    # Se lee en cada llamada: rebuild_engine puede haberlo reemplazado
+    engine = conexion.engine
     print(f"🔄 Inicializando base de datos ({engine.dialect.name})...")
 
     # 1. Crear tablas
     try:
         Base.metadata.create_all(bind=engine)
+
+        omitidos = set()
+        duplicadas = calificaciones_duplicadas()
+        if duplicadas:
+            omitidos.add("uq_calificacion_matricula_evaluacion")
+            print(f"⚠️ {len(duplicadas)} parejas (matrícula, evaluación) tienen calificaciones "
+                  f"repetidas; no se crea uq_calificacion_matricula_evaluacion hasta depurarlas:")
+            for matricula_id, evaluacion_id, cantidad in duplicadas:
+                print(f"   - matrícula {matricula_id}, evaluación {evaluacion_id}: {cantidad} filas")
+
+        # create_all no agrega índices nuevos a tablas que ya existían
+        for tabla in Base.metadata.sorted_tables:
+            for indice in tabla.indexes:
+                if indice.name in omitidos:
+                    continue
+                try:
+                    indice.create(bind=engine, checkfirst=True)
+                except Exception as e:
+                    # p. ej. un índice único sobre datos previos con duplicados
+                    print(f"⚠️ No se pudo crear el índice {indice.name}: {e}")
+        crear_indices_busqueda()
         print("✅ Estructura de tablas verificada/creada.")
     except Exception as e:
         print(f"❌ Error crítico creando tablas: {e}")
-        return
+        return False
 
     # 2. Población inicial
     session = SessionLocal()
@@ -67,7 +219,7 @@ def inicializar_base_de_datos():
 
         # Centros
         if inspector.has_table("centros"):
-            if session.query(Centro).count() == 0:
+            if not session.execute(select(exists().select_from(Centro))).scalar():
                 print("ℹ️ Insertando centros iniciales...")
                 try:
                     from database.centros import insertar_centros
@@ -78,14 +230,18 @@ def inicializar_base_de_datos():
 
         # Tipos de certificado
         if inspector.has_table("tipos_certificado"):
-            if session.query(TipoCertificado).count() == 0:
+            if not session.execute(select(exists().select_from(TipoCertificado))).scalar():
                 print("ℹ️ Insertando tipos de certificado por defecto...")
-                for nombre in TIPOS_CERTIFICADO_DEFAULT:
-                    session.add(TipoCertificado(nombre=nombre))
+                session.execute(
+                    insert(TipoCertificado),
+                    [{"nombre": nombre} for nombre in TIPOS_CERTIFICADO_DEFAULT]
+                )
 
         session.commit()
+        return True
     except Exception as e:
         session.rollback()
         print(f"❌ Error inicializando datos: {e}")
+        return False
     finally:
         session.close()
\ No newline at end of file
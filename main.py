@@ -18,7 +18,6 @@ from qt_material import apply_stylesheet
 from PyQt6.QtCore import QTranslator, QLibraryInfo, QTimer
 from controllers.master import MasterController
 from database.setup import inicializar_base_de_datos
-from models.matricula_model import MatriculaModel
 import database.config as config
 
 # Configuración de rutas para imports
@@ -43,14 +42,14 @@ def main():
 
     Realiza la secuencia de arranque completa:
     1. Inicializa la conexión y estructura de la base de datos.
-    2. Ejecuta tareas de mantenimiento de datos (actualización de estados de matrículas).
-    3. Configura la instancia de QApplication y carga las traducciones al español.
-    4. Aplica el tema visual (qt_material) y las hojas de estilo CSS personalizadas definidas en la configuración.
-    5. Instancia y muestra la ventana principal (MasterController).
+    2. Configura la instancia de QApplication y carga las traducciones al español.
+    3. Aplica el tema visual (qt_material) y las hojas de estilo CSS personalizadas definidas en la configuración.
+    4. Instancia y muestra la ventana principal (MasterController).
+    5. Lanza en segundo plano el mantenimiento de datos (actualización de estados
+       de matrículas), una vez mostrada la ventana.
     6. Inicia el bucle de eventos de la interfaz gráfica.
     """
     inicializar_base_de_datos()
-    MatriculaModel().actualizar_estados_matriculas()
     app = QApplication(sys.argv)
     translator = QTranslator()
     translator.load(
@@ -76,7 +75,12 @@ def main():
     window.setMinimumSize(0, 0)  # Elimina restricciones mínimas
     window.setMaximumSize(16777215, 16777215)  # Valor máximo permitido por Qt
 
-    QTimer.singleShot(100, window.showMaximized)
+    def mostrar_ventana():
+        window.showMaximized()
+        # El mantenimiento de estados corre en el QThreadPool tras el primer pintado
+        QTimer.singleShot(0, window.iniciar_mantenimiento_estados)
+
+    QTimer.singleShot(100, mostrar_ventana)
 
     # Ejecutar loop
     sys.exit(app.exec())
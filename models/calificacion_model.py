@@ -9,9 +9,16 @@
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
 
+from itertools import islice
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
 from database.base_model import BaseCRUDModel
 from database.models import Calificacion
 
+# Filas por sentencia en bulk_upsert
+TAMANO_LOTE_UPSERT = 10_000
+
 class CalificacionModel(BaseCRUDModel):
     """Modelo CRUD para la gestión de calificaciones individuales."""
     model = Calificacion
@@ -41,23 +48,84 @@ class CalificacionModel(BaseCRUDModel):
         calificaciones = self.get_by_matricula(matricula_id)
         return [c.actividad for c in calificaciones]
 
-    def actualizar_calificacion(self, matricula_id: str, actividad: str, puntaje: float):
-        """Actualiza el puntaje de una actividad existente o crea una nueva si no existe.
+    @staticmethod
+    def _stmt_upsert(session):
+        """Construye el ``INSERT ... ON CONFLICT DO UPDATE`` del dialecto activo.
+
+        El conflicto se detecta con el índice único ``(matricula_id,
+        evaluacion_curso_id)`` y solo se reemplaza el puntaje.
+
+        Args:
+            session (Session): Sesión activa (determina el dialecto).
+
+        Returns:
+            Insert | None: Sentencia de UPSERT, o None si el motor no soporta ON CONFLICT.
+        """
+        dialecto = session.get_bind().dialect.name
+        if dialecto == "sqlite":
+            stmt = sqlite.insert(Calificacion)
+        elif dialecto == "postgresql":
+            stmt = postgresql.insert(Calificacion)
+        else:
+            return None
+        return stmt.on_conflict_do_update(
+            index_elements=["matricula_id", "evaluacion_curso_id"],
+            set_={"puntaje": stmt.excluded.puntaje}
+        )
+
+    def actualizar_calificacion(self, matricula_id: str, evaluacion_curso_id: str, puntaje: float):
+        """Actualiza el puntaje de una evaluación existente o crea la calificación si no existe.
 
         Args:
             matricula_id (str): ID de la matrícula.
-            actividad (str): Identificador de la actividad/módulo.
+            evaluacion_curso_id (str): ID de la evaluación (actividad/módulo) del curso.
             puntaje (float): Nota a registrar.
+        """
+        self.bulk_upsert([{
+            "matricula_id": matricula_id,
+            "evaluacion_curso_id": evaluacion_curso_id,
+            "puntaje": puntaje
+        }])
+
+    def bulk_upsert(self, rows: list[dict]) -> int:
+        """Inserta o actualiza calificaciones en lote con un UPSERT nativo.
+
+        Cada lote de hasta ``TAMANO_LOTE_UPSERT`` filas viaja en una sola
+        sentencia ``executemany``, sin consultar antes si cada nota existe. En
+        motores sin ``ON CONFLICT``, o si la base no tiene el índice único
+        ``uq_calificacion_matricula_evaluacion`` (bases previas con notas
+        duplicadas), se resuelve fila por fila dentro de la misma transacción.
+        Si una misma pareja (matrícula, evaluación) se repite, gana la última.
+
+        Args:
+            rows (list[dict]): Filas con 'matricula_id', 'evaluacion_curso_id' y 'puntaje'.
 
         Returns:
-            object: Instancia de Calificacion creada o actualizada.
+            int: Cantidad de filas procesadas.
         """
-        """Actualiza o crea una calificación para un módulo específico."""
-        calificaciones = self.search(filters={"matricula_id": matricula_id, "actividad": actividad}, first=True)
-        if calificaciones:
-            return self.update(calificaciones.id, {"puntaje": puntaje})
-        else:
-            return self.create({"matricula_id": matricula_id, "actividad": actividad, "puntaje": puntaje})
+        if not rows:
+            return 0
+        # Un ON CONFLICT no puede tocar dos veces la misma fila en una sentencia
+        rows = list({(r["matricula_id"], r["evaluacion_curso_id"]): r for r in rows}.values())
+
+        with self._get_session() as session, session.begin():
+            stmt = self._stmt_upsert(session)
+            if stmt is None or not self._indice_disponible("uq_calificacion_matricula_evaluacion"):
+                for row in rows:
+                    existe = session.query(Calificacion).filter_by(
+                        matricula_id=row["matricula_id"],
+                        evaluacion_curso_id=row["evaluacion_curso_id"]
+                    ).first()
+                    if existe:
+                        existe.puntaje = row["puntaje"]
+                    else:
+                        session.add(Calificacion(**row))
+                return len(rows)
+
+            filas = iter(rows)
+            while lote := list(islice(filas, TAMANO_LOTE_UPSERT)):
+                session.execute(stmt, lote)
+        return len(rows)
 
     def calcular_nota_final(self, matricula_id: str):
         """Calcula el promedio aritmético simple de las calificaciones registradas.
@@ -68,9 +136,8 @@ class CalificacionModel(BaseCRUDModel):
         Returns:
             float: Promedio calculado redondeado a 2 decimales, o 0.0 si no hay notas.
         """
-        """Calcula la nota final promedio de una matrícula."""
-        calificaciones = self.get_by_matricula(matricula_id)
-        if not calificaciones:
-            return 0.0
-        total = sum(c.puntaje for c in calificaciones)
-        return round(total / len(calificaciones), 2)
\ No newline at end of file
+        # AVG en la base de datos (índice por matricula_id): sin cargar las filas
+        stmt = select(func.avg(Calificacion.puntaje)).where(Calificacion.matricula_id == matricula_id)
+        with self._get_read_session() as session:
+            promedio = session.execute(stmt).scalar()
+        return round(promedio, 2) if promedio is not None else 0.0
\ No newline at end of file
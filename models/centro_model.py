@@ -9,11 +9,35 @@
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
 
+import re
 import unicodedata
+from functools import lru_cache
+from sqlalchemy import select
 from database.conexion import SessionLocal
 from database.models import Centro
 from database.base_model import BaseCRUDModel
 
+# -------------------------------------------------
+# NORMALIZACIÓN DE NOMBRES DE CENTROS
+# -------------------------------------------------
+# La Ñ se aparta antes de descomponer (NFD) para no perder su tilde
+_PROTEGER_ENIE = str.maketrans({"ñ": "\001", "Ñ": "\002"})
+# Elimina las marcas combinantes (acentos) del plano básico y restaura la Ñ
+# en una sola pasada de str.translate
+_QUITAR_ACENTOS = dict.fromkeys(
+    c for c in range(0x10000) if unicodedata.combining(chr(c))
+)
+_QUITAR_ACENTOS.update({1: "ñ", 2: "Ñ"})
+
+# Prefijo reconocido -> (tipo, texto que se quita para obtener la ubicación)
+_RE_CENTRO = re.compile(r"^(CENTRO ZONAL|CENTRO LOCAL|SALA)")
+_TIPO_POR_PREFIJO = {
+    "CENTRO ZONAL": ("ZONAL", "CENTRO ZONAL ECU 911"),
+    "CENTRO LOCAL": ("LOCAL", "CENTRO LOCAL ECU 911"),
+    "SALA": ("SALA", "SALA"),
+}
+_RENOMBRAR_UBICACION = {"SAN CRISTOBAL": "GALAPAGOS"}
+
 class CentroModel(BaseCRUDModel):
     """Modelo CRUD para la gestión de Centros (Zonales, Locales, Salas)."""
     model = Centro
@@ -34,60 +58,147 @@ class CentroModel(BaseCRUDModel):
         if not texto:
             return {"tipo": "DESCONOCIDO", "ubicacion": "DESCONOCIDO"}
 
-        s = texto.replace("ñ", "\001").replace("Ñ", "\002")
-        s = unicodedata.normalize('NFD', s)
-        s = "".join(c for c in s if unicodedata.category(c) != 'Mn')
-        t = s.replace("\001", "ñ").replace("\002", "Ñ").strip().upper()
+        s = unicodedata.normalize('NFD', texto.translate(_PROTEGER_ENIE))
+        t = s.translate(_QUITAR_ACENTOS).strip().upper()
 
         tipo, ubicacion = "LOCAL", t  # default
 
-        if t.startswith("CENTRO ZONAL"):
-            tipo = "ZONAL"
-            ubicacion = t.replace("CENTRO ZONAL ECU 911", "").strip()
-        elif t.startswith("CENTRO LOCAL"):
-            tipo = "LOCAL"
-            ubicacion = t.replace("CENTRO LOCAL ECU 911", "").strip()
-        elif t.startswith("SALA"):
-            tipo = "SALA"
-            ubicacion = t.replace("SALA", "").strip()
+        coincidencia = _RE_CENTRO.match(t)
+        if coincidencia:
+            tipo, prefijo = _TIPO_POR_PREFIJO[coincidencia.group(1)]
+            ubicacion = t.replace(prefijo, "").strip()
 
         # renombrar casos especiales
-        renombrar_ubicacion = {"SAN CRISTOBAL": "GALAPAGOS"}
-        ubicacion = renombrar_ubicacion.get(ubicacion, ubicacion)
+        ubicacion = _RENOMBRAR_UBICACION.get(ubicacion, ubicacion)
 
         return {"tipo": tipo, "ubicacion": ubicacion}
 
     @staticmethod
-    def texto_desde_id(centro_id: int) -> str:
-        """Obtiene el nombre completo formateado de un centro dado su ID.
+    def _formatear_nombre(tipo: str, ubicacion: str) -> str:
+        """Construye el nombre completo de un centro a partir de su tipo y ubicación.
 
         Args:
-            centro_id (int): ID único del centro.
+            tipo (str): ZONAL, LOCAL o SALA.
+            ubicacion (str): Ubicación registrada del centro.
 
         Returns:
-            str: Nombre completo (ej. "CENTRO ZONAL ECU 911 QUITO") o cadena vacía.
+            str: Nombre completo (ej. "CENTRO ZONAL ECU 911 QUITO").
         """
-        session = SessionLocal()
-        try:
-            centro = session.query(Centro).filter_by(id=centro_id).first()
+        # Normalizamos lo que viene de la BD por si acaso
+        tipo = (tipo or "").upper()
+        ubicacion = (ubicacion or "").upper().strip()
 
-            if not centro:
-                return ""
+        if tipo == "ZONAL":
+            return f"CENTRO ZONAL ECU 911 {ubicacion}"
 
-            # Normalizamos lo que viene de la BD por si acaso
-            tipo = centro.tipo.upper()
-            ubicacion = centro.ubicacion.upper().strip()
+        elif tipo == "LOCAL":
+            return f"CENTRO LOCAL ECU 911 {ubicacion}"
 
-            if tipo == "ZONAL":
-                return f"CENTRO ZONAL ECU 911 {ubicacion}"
+        elif tipo == "SALA":
+            return f"SALA {ubicacion}"
 
-            elif tipo == "LOCAL":
-                return f"CENTRO LOCAL ECU 911 {ubicacion}"
+        return ubicacion
 
-            elif tipo == "SALA":
-                return f"SALA {ubicacion}"
+    @staticmethod
+    def invalidate_cache():
+        """Descarta el catálogo de centros memorizado por ``_cargar_centros``.
+
+        Se llama tras crear, modificar o eliminar centros, y al cambiar de base
+        de datos; la siguiente consulta vuelve a cargar la tabla completa.
+        """
+        _cargar_centros.cache_clear()
+
+    def create(self, data: dict):
+        """Ver ``BaseCRUDModel.create``; además invalida el catálogo de centros."""
+        obj = super().create(data)
+        self.invalidate_cache()
+        return obj
+
+    def update(self, obj_id, data: dict):
+        """Ver ``BaseCRUDModel.update``; además invalida el catálogo de centros."""
+        obj = super().update(obj_id, data)
+        self.invalidate_cache()
+        return obj
+
+    def update_fast(self, obj_id: str, data: dict) -> int:
+        """Ver ``BaseCRUDModel.update_fast``; además invalida el catálogo de centros."""
+        filas = super().update_fast(obj_id, data)
+        self.invalidate_cache()
+        return filas
+
+    def delete(self, obj_id):
+        """Ver ``BaseCRUDModel.delete``; además invalida el catálogo de centros."""
+        eliminado = super().delete(obj_id)
+        self.invalidate_cache()
+        return eliminado
+
+    def delete_fast(self, obj_id: str) -> bool:
+        """Ver ``BaseCRUDModel.delete_fast``; además invalida el catálogo de centros."""
+        eliminado = super().delete_fast(obj_id)
+        self.invalidate_cache()
+        return eliminado
+
+    def bulk_create(self, rows: list[dict]) -> int:
+        """Ver ``BaseCRUDModel.bulk_create``; además invalida el catálogo de centros."""
+        filas = super().bulk_create(rows)
+        self.invalidate_cache()
+        return filas
+
+    def bulk_update(self, rows: list[tuple[str, dict]]) -> int:
+        """Ver ``BaseCRUDModel.bulk_update``; además invalida el catálogo de centros."""
+        filas = super().bulk_update(rows)
+        self.invalidate_cache()
+        return filas
 
-            return ubicacion
+    @staticmethod
+    def texto_desde_id(centro_id: str) -> str:
+        """Obtiene el nombre completo formateado de un centro dado su ID.
+
+        Se resuelve sobre el catálogo memorizado por ``_cargar_centros``: las
+        vistas lo llaman una vez por fila al pintar, y así ninguna llamada abre
+        una sesión después de la primera.
+
+        Args:
+            centro_id (str): ID único del centro.
 
-        finally:
-            session.close()
\ No newline at end of file
+        Returns:
+            str: Nombre completo (ej. "CENTRO ZONAL ECU 911 QUITO") o cadena vacía.
+        """
+        centro = _cargar_centros().get(centro_id)
+        if not centro:
+            return ""
+        return CentroModel._formatear_nombre(*centro)
+
+    @staticmethod
+    def texto_desde_ids(ids: set[str]) -> dict[str, str]:
+        """Resuelve los nombres completos de varios centros.
+
+        Args:
+            ids (set[str]): IDs de los centros a resolver.
+
+        Returns:
+            dict[str, str]: Mapa {id: nombre completo}. Los IDs inexistentes no aparecen.
+        """
+        centros = _cargar_centros()
+        return {
+            centro_id: CentroModel._formatear_nombre(*centros[centro_id])
+            for centro_id in ids if centro_id in centros
+        }
+
+
+@lru_cache(maxsize=1)
+def _cargar_centros() -> dict[str, tuple[str, str]]:
+    """Carga una sola vez la tabla de centros completa (es pequeña y casi estática).
+
+    Returns:
+        dict[str, tuple[str, str]]: Mapa {id: (tipo, ubicacion)} ya normalizado.
+    """
+    stmt = select(Centro.id, Centro.tipo, Centro.ubicacion)
+    session = SessionLocal()
+    try:
+        return {
+            centro_id: ((tipo or "").upper(), (ubicacion or "").upper().strip())
+            for centro_id, tipo, ubicacion in session.execute(stmt)
+        }
+    finally:
+        session.close()
@@ -8,9 +8,9 @@
 #
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
+from sqlalchemy import and_, func, or_, select
 from database.base_model import BaseCRUDModel
-from database.models import Certificado
-
+from database.models import Certificado, Matricula
 
 
 class CertificadoModel(BaseCRUDModel):
@@ -19,4 +19,32 @@ class CertificadoModel(BaseCRUDModel):
     Administra la creación y consulta de registros de certificados, incluyendo
     códigos de validación y rutas de archivos.
     """
-    model = Certificado
\ No newline at end of file
+    model = Certificado
+
+    def count_pendientes_firma(self, session=None) -> int:
+        """Cuenta los certificados emitidos cuya matrícula aún no tiene PDF firmado.
+
+        La única fuente de verdad para "FIRMADO" es `Matricula.ruta_pdf_firmado`; un
+        certificado sin matrícula asociada también se considera pendiente. Se
+        resuelve con un único ``SELECT COUNT(*) ... LEFT JOIN`` en la base de datos.
+
+        Args:
+            session (Session, optional): Sesión a reutilizar; por defecto se abre una.
+
+        Returns:
+            int: Cantidad de certificados pendientes de firma.
+        """
+        stmt = (
+            select(func.count())
+            .select_from(Certificado)
+            .outerjoin(
+                Matricula,
+                and_(
+                    Matricula.persona_id == Certificado.persona_id,
+                    Matricula.curso_id == Certificado.curso_id
+                )
+            )
+            .where(or_(Matricula.ruta_pdf_firmado.is_(None), Matricula.ruta_pdf_firmado == ""))
+        )
+        with self.sesion_lectura(session) as sesion:
+            return sesion.execute(stmt).scalar_one()
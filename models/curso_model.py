@@ -11,6 +11,7 @@
 
 from datetime import date
 
+from sqlalchemy import func, select
 from database.base_model import BaseCRUDModel
 from database.models import Curso, Matricula
 from database.conexion import SessionLocal  # Asumiendo que BaseCRUDModel usa SessionLocal
@@ -19,44 +20,33 @@ class CursoModel(BaseCRUDModel):
     """Modelo CRUD para la gestión de Cursos y capacitaciones."""
     model = Curso
 
-    @staticmethod
-    def cursos_activos_count():
+    def cursos_activos_count(self, session=None):
         """Cuenta el número total de cursos que aún no han finalizado.
 
+        Args:
+            session (Session, optional): Sesión a reutilizar; por defecto se abre una.
+
         Returns:
             int: Cantidad de cursos con fecha_final mayor a la fecha actual.
         """
-        """
-        Retorna la cantidad de cursos cuya fecha final es mayor a hoy.
-        """
-        session = SessionLocal()
-        try:
-            hoy = date.today()
-            count = session.query(Curso).filter(Curso.fecha_final > hoy).count()
-
-            return count
-        finally:
-            session.close()
+        stmt = select(func.count(Curso.id)).where(Curso.fecha_final > date.today())
+        with self.sesion_lectura(session) as sesion:
+            return sesion.execute(stmt).scalar_one()
 
-    @staticmethod
-    def estudiantes_inscritos(curso_id):
+    def estudiantes_inscritos(self, curso_id, session=None):
         """Cuenta el número de estudiantes matriculados en un curso específico.
 
         Args:
             curso_id (int): ID del curso.
+            session (Session, optional): Sesión a reutilizar; útil al contar varios
+                cursos seguidos. Por defecto se abre una.
 
         Returns:
             int: Cantidad de registros en la tabla de matrículas para este curso.
         """
-        """
-        Retorna la cantidad de estudiantes inscritos en un curso.
-        """
-        session = SessionLocal()
-        try:
-            count = session.query(Matricula).filter(Matricula.curso_id == curso_id).count()
-            return count
-        finally:
-            session.close()
+        stmt = select(func.count(Matricula.id)).where(Matricula.curso_id == curso_id)
+        with self.sesion_lectura(session) as sesion:
+            return sesion.execute(stmt).scalar_one()
 
     @staticmethod
     def debug_cursos_activos():
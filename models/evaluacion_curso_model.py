@@ -8,6 +8,7 @@
 #
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
+from sqlalchemy import delete
 from database.models import EvaluacionCurso
 from database.base_model import BaseCRUDModel
 from typing import List, Dict
@@ -31,9 +32,11 @@ class EvaluacionCursoModel(BaseCRUDModel):
         Elimina todas las evaluaciones configuradas para un curso específico.
         Útil para reiniciar la configuración de evaluaciones antes de guardar una nueva.
         """
+        # Un único DELETE ... WHERE curso_id = ?, sin cargar ni sincronizar
+        # las instancias en el identity map
+        stmt = delete(self.model).where(self.model.curso_id == curso_id)
         with self._get_session() as session:
-            # Elimina todos los registros que coincidan con el curso_id
-            session.query(self.model).filter_by(curso_id=curso_id).delete()
+            session.execute(stmt, execution_options={"synchronize_session": False})
             session.commit()
 
     def get_by_curso(self, curso_id: int):
@@ -64,18 +67,16 @@ class EvaluacionCursoModel(BaseCRUDModel):
         Ej: [{'id': 'uuid', 'nombre': 'Examen', 'porcentaje': 40.0}]
         """
         try:
-            # Reutilizamos el método existente que ya ordena y filtra correctamente
-            # Esto es más seguro y consistente con BaseCRUDModel que usar sesiones crudas
-            resultados = self.get_by_curso(curso_id)
-
-            esquema = []
-            for ev in resultados:
-                esquema.append({
-                    'id': ev.id,
-                    'nombre': ev.nombre,
-                    'porcentaje': ev.porcentaje
-                })
-            return esquema
+            # Solo las tres columnas necesarias, sin construir instancias ORM
+            filas = self.search_columns(
+                ("id", "nombre", "porcentaje"),
+                filters={"curso_id": curso_id},
+                order_by=self.model.orden
+            )
+            return [
+                {'id': ev_id, 'nombre': nombre, 'porcentaje': porcentaje}
+                for ev_id, nombre, porcentaje in filas
+            ]
         except Exception as e:
             print(f"Error obteniendo esquema: {e}")
-            return []
\ No newline at end of file
+            return []
@@ -10,7 +10,9 @@
 #  copies or substantial portions of the Software.
 
 from datetime import date, datetime
-from sqlalchemy import or_, cast, String
+import numpy as np
+from sqlalchemy import or_, cast, String, case, func, select, update as sa_update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import joinedload
 from database.base_model import BaseCRUDModel
 from database.models import Matricula, Persona, Curso
@@ -84,7 +86,7 @@ class MatriculaModel(BaseCRUDModel):
         Returns:
             int: Número de registros.
         """
-        session = SessionLocal()
+        session = self._get_read_session()
         try:
             query = self._construir_query_base(session, filters, or_fields)
             return query.count()
@@ -107,7 +109,7 @@ class MatriculaModel(BaseCRUDModel):
         Returns:
             list | Matricula: Lista de resultados o una instancia única.
         """
-        session = SessionLocal()
+        session = self._get_read_session()
         try:
             query = self._construir_query_base(session, filters, or_fields)
 
@@ -127,6 +129,68 @@ class MatriculaModel(BaseCRUDModel):
         finally:
             session.close()
 
+    def create_if_absent(self, datos: dict) -> bool:
+        """Crea la matrícula solo si la persona no está ya inscrita en el curso.
+
+        Ejecuta un único ``INSERT ... ON CONFLICT (persona_id, curso_id) DO NOTHING``
+        (índice ``uq_matricula_persona_curso``) y decide por el número de filas
+        afectadas. Cualquier otro conflicto (p. ej. ``codigo_validacion``) se
+        propaga como IntegrityError. Si la base no tiene ese índice (bases previas
+        con duplicados) se verifica con una búsqueda en la misma transacción.
+
+        Args:
+            datos (dict): Columnas de la matrícula (persona_id, curso_id, centro_id, ...).
+
+        Returns:
+            bool: True si se insertó, False si ya existía una matrícula igual.
+        """
+        session = SessionLocal()
+        try:
+            dialecto = session.get_bind().dialect.name
+            insertar = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(dialecto)
+            if insertar is None or not self._indice_disponible("uq_matricula_persona_curso"):
+                # Sin ON CONFLICT o sin índice único: verificación previa en la misma transacción
+                existe = session.query(Matricula.id).filter_by(
+                    persona_id=datos.get("persona_id"), curso_id=datos.get("curso_id")
+                ).first()
+                if existe:
+                    return False
+                session.add(Matricula(**datos))
+                session.commit()
+                return True
+
+            stmt = insertar(Matricula).values(**datos).on_conflict_do_nothing(
+                index_elements=["persona_id", "curso_id"]
+            )
+            insertado = session.execute(stmt).rowcount > 0
+            session.commit()
+            return insertado
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def group_counts_by_curso_estado(self) -> list[tuple[str, str | None, int]]:
+        """Cuenta las matrículas agrupadas por curso y estado.
+
+        Ejecuta un único ``SELECT curso_id, estado, COUNT(*) ... GROUP BY`` sin
+        cargar objetos ni relaciones: devuelve a lo sumo una fila por estado de
+        cada curso.
+
+        Returns:
+            list[tuple[str, str | None, int]]: Tuplas (curso_id, estado, cantidad).
+        """
+        stmt = (
+            select(Matricula.curso_id, Matricula.estado, func.count())
+            .group_by(Matricula.curso_id, Matricula.estado)
+        )
+        session = SessionLocal()
+        try:
+            return [tuple(fila) for fila in session.execute(stmt)]
+        finally:
+            session.close()
+
     # =========================================================================
     #  LÓGICA DE NEGOCIO CENTRALIZADA
     # =========================================================================
@@ -192,6 +256,38 @@ class MatriculaModel(BaseCRUDModel):
             # Aún tiene tiempo de mejorar su nota
             return "EN CURSO"
 
+    @staticmethod
+    def determinar_estados_vec(notas_finales: np.ndarray, abandonos: np.ndarray, curso_obj) -> np.ndarray:
+        """Versión vectorizada de `determinar_estado` para muchas matrículas de un curso.
+
+        Aplica las mismas reglas con `np.select`; como el curso es común a todas
+        las filas, su cierre se evalúa una sola vez.
+
+        Args:
+            notas_finales (np.ndarray): Calificación final de cada matrícula.
+            abandonos (np.ndarray): Máscara booleana de deserción (NO REALIZO).
+            curso_obj (Curso): Objeto del curso con fechas y nota mínima.
+
+        Returns:
+            np.ndarray: Estado calculado de cada fila.
+        """
+        fecha_fin = curso_obj.fecha_final
+        if isinstance(fecha_fin, datetime):
+            fecha_fin = fecha_fin.date()
+
+        condiciones = [abandonos, notas_finales >= curso_obj.nota_aprobacion]
+        estados = ["NO REALIZO", "APROBADO"]
+
+        if fecha_fin and fecha_fin < date.today():
+            # Curso cerrado: sin nota no realizó, con nota insuficiente reprobó
+            condiciones.append(notas_finales == 0.0)
+            estados.append("NO REALIZO")
+            por_defecto = "REPROBADO"
+        else:
+            por_defecto = "EN CURSO"
+
+        return np.select(condiciones, estados, default=por_defecto)
+
     def calcular_nota_ponderada(self, lista_notas):
         """Calcula el promedio final basado en pesos porcentuales.
 
@@ -272,50 +368,49 @@ class MatriculaModel(BaseCRUDModel):
 
         Busca matrículas 'EN CURSO' asociadas a cursos que ya finalizaron
         y actualiza su estado a 'REPROBADO' o 'NO REALIZO'.
+
+        Returns:
+            int: Cantidad de matrículas cuyo estado cambió.
         """
         """
         FUNCIÓN DE MANTENIMIENTO AL INICIO DEL PROGRAMA.
         Busca cursos que YA CERRARON (fecha <= hoy) y actualiza a
         los estudiantes que se quedaron colgados en 'EN CURSO'.
         """
-        session = SessionLocal()
         hoy = date.today()
+        nota = func.coalesce(Matricula.nota_final, 0.0)
+        nota_aprobacion = (
+            select(Curso.nota_aprobacion)
+            .where(Curso.id == Matricula.curso_id)
+            .scalar_subquery()
+        )
 
-        try:
-            # 1. Buscar matrículas 'EN CURSO' de cursos ya cerrados
-            matriculas_vencidas = (
-                session.query(Matricula)
-                .join(Matricula.curso)
-                .options(joinedload(Matricula.curso))
-                .filter(Curso.fecha_final < hoy)        # Curso cerrado
-                .filter(Matricula.estado == "EN CURSO")  # Estado desactualizado
-                .all()
-            )
-
-            count = 0
-            if matriculas_vencidas:
-                print(f"Detectadas {len(matriculas_vencidas)} matrículas vencidas. Actualizando...")
-
-                for mat in matriculas_vencidas:
-                    # Aplicamos la lógica central.
-                    # Nota: es_abandono=False porque si fuera True, el estado sería NO REALIZO, no EN CURSO.
-                    nuevo_estado = self.determinar_estado(
-                        mat.nota_final or 0.0,
-                        mat.curso,
-                        es_abandono=False
-                    )
-
-                    if mat.estado != nuevo_estado:
-                        mat.estado = nuevo_estado
-                        count += 1
+        # Las mismas reglas de `determinar_estado` para un curso ya cerrado,
+        # resueltas en un único UPDATE ... SET estado = CASE ... en la base de datos
+        stmt = (
+            sa_update(Matricula)
+            .where(Matricula.estado == "EN CURSO")  # Estado desactualizado
+            .where(Matricula.curso_id.in_(select(Curso.id).where(Curso.fecha_final < hoy)))  # Curso cerrado
+            .values(estado=case(
+                (nota >= nota_aprobacion, "APROBADO"),
+                (nota == 0.0, "NO REALIZO"),
+                else_="REPROBADO",
+            ))
+            .execution_options(synchronize_session=False)
+        )
 
-                session.commit()
-                print(f"Mantenimiento completado: {count} registros pasaron a REPROBADO/NO REALIZO.")
+        session = SessionLocal()
+        try:
+            count = session.execute(stmt).rowcount
+            session.commit()
+            if count:
+                print(f"Mantenimiento completado: {count} matrículas vencidas actualizadas.")
             else:
                 print("Todos los estados están al día.")
-
+            return count
         except Exception as e:
             session.rollback()
             print(f"Error en mantenimiento de estados: {e}")
+            return 0
         finally:
             session.close()
\ No newline at end of file
@@ -9,6 +9,7 @@
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
 
+from sqlalchemy import or_, select
 from database.models import Persona
 from database.base_model import BaseCRUDModel
 
@@ -16,4 +17,77 @@ from database.base_model import BaseCRUDModel
 class PersonaModel(BaseCRUDModel):
     """CRUD para la gestión de registros de personas (Estudiantes, Instructores)."""
     """CRUD para la tabla Persona."""
-    model = Persona
\ No newline at end of file
+    model = Persona
+
+    # Cursor de paginación del listado (respaldado por ix_personas_nombre_id)
+    CURSOR_COLUMNS = ("nombre", "id")
+
+    # Búsqueda del listado de estudiantes (ver database.setup.crear_indices_busqueda)
+    fts_table = "personas_fts"
+    fts_columns = frozenset({"nombre", "cedula", "institucion_articulada"})
+
+    def exists_other(self, cedula: str, correo: str | None, exclude_id: str) -> bool:
+        """Indica si otra persona ya usa la cédula o el correo indicados.
+
+        Ejecuta un único ``SELECT 1 ... LIMIT 1`` para detectar duplicados antes de
+        intentar un UPDATE que terminaría en IntegrityError y rollback.
+
+        Args:
+            cedula (str): Cédula a verificar.
+            correo (str | None): Correo a verificar (se ignora si está vacío).
+            exclude_id (str): ID de la persona que se está editando.
+
+        Returns:
+            bool: True si existe otro registro con la misma cédula o correo.
+        """
+        condiciones = [Persona.cedula == cedula]
+        if correo:
+            condiciones.append(Persona.correo == correo)
+
+        stmt = (
+            select(1)
+            .select_from(Persona)
+            .where(or_(*condiciones), Persona.id != exclude_id)
+            .limit(1)
+        )
+        with self._get_session() as session:
+            return session.execute(stmt).first() is not None
+
+    def search(
+        self,
+        filters: dict | None = None,
+        order_by=None,
+        limit: int | None = None,
+        offset: int | None = None,
+        first: bool = False,
+        or_fields: list[tuple[str, str]] | None = None,
+        after: tuple | None = None,
+        cursor_columns: tuple[str, ...] | None = CURSOR_COLUMNS,
+        eager: list[str] | None = None
+    ):
+        """Búsqueda con soporte de paginación por cursor (keyset).
+
+        Sin ``after`` se comporta igual que ``BaseCRUDModel.search``. Con ``after``
+        devuelve los registros posteriores a ``(nombre, id)`` ordenados por esas
+        dos columnas, de modo que cada página es un salto por índice en lugar de
+        descartar ``offset`` filas.
+
+        Args:
+            filters (dict, optional): Filtros exactos (AND).
+            order_by (Column, optional): Ordenamiento (se ignora si se usa ``after``).
+            limit (int, optional): Límite de registros a devolver.
+            offset (int, optional): Registros a saltar (se ignora si se usa ``after``).
+            first (bool, optional): Si True, devuelve solo el primer resultado.
+            or_fields (list[tuple], optional): Filtros parciales (OR).
+            after (tuple[str, str], optional): Último ``(nombre, id)`` de la página anterior.
+            cursor_columns (tuple[str, ...], optional): Columnas del cursor; por
+                defecto ``(nombre, id)``.
+            eager (list[str], optional): Relaciones a cargar anticipadamente.
+
+        Returns:
+            list | object: Lista de resultados o una instancia única si first=True.
+        """
+        return super().search(
+            filters, order_by, limit, offset, first, or_fields,
+            after=after, cursor_columns=cursor_columns, eager=eager
+        )
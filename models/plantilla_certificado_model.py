@@ -8,15 +8,38 @@
 #
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
+
+import json
+from sqlalchemy import select, cast, String
 from database.base_model import BaseCRUDModel
 from database.models import PlantillaCertificado
 
 
-
 class PlantillaCertificadoModel(BaseCRUDModel):
     """Modelo CRUD para gestionar las plantillas de diseño de certificados.
 
     Permite almacenar y recuperar configuraciones JSON o archivos binarios Word
     utilizados para la generación de diplomas.
     """
-    model = PlantillaCertificado
\ No newline at end of file
+    model = PlantillaCertificado
+
+    TIPO_WORD = "TYPE_WORD"
+
+    def list_word_templates(self) -> list[tuple[str, str]]:
+        """Lista las plantillas Word registradas sin cargar sus binarios.
+
+        Filtra en SQL y proyecta solo ``id`` y ``nombre``, de modo que el
+        ``archivo_binario`` de cada plantilla nunca sale de la base de datos.
+
+        Returns:
+            list[tuple[str, str]]: Pares (id, nombre) ordenados por nombre.
+        """
+        # La columna es JSON: se compara su texto serializado para que funcione
+        # igual en SQLite y PostgreSQL (json no tiene operador de igualdad en PG).
+        stmt = (
+            select(PlantillaCertificado.id, PlantillaCertificado.nombre)
+            .where(cast(PlantillaCertificado.configuracion_json, String) == json.dumps(self.TIPO_WORD))
+            .order_by(PlantillaCertificado.nombre)
+        )
+        with self._get_session() as session:
+            return [tuple(fila) for fila in session.execute(stmt)]
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import List, Dict
 from models.persona_model import PersonaModel
 from models.matricula_model import MatriculaModel
@@ -50,8 +51,7 @@ class PersistenceService:
             self.cache_centros[key] = c
 
         # Cache Estudiantes
-        estudiantes = self.model_persona.get_all()
-        self.cache_estudiantes = {str(e.cedula).strip(): e for e in estudiantes}
+        self.cache_estudiantes = {str(e.cedula).strip(): e for e in self.model_persona.iter_all()}
 
         # Cache Matriculas
         mats = self.model_matricula.search(filters={'curso_id': curso_id})
@@ -67,9 +67,9 @@ class PersistenceService:
         """
         mapa = {}
         try:
-            if hasattr(self.model_alias, 'get_all'):
-                aliases = self.model_alias.get_all()
-                id_to_cedula = {p.id: p.cedula for p in self.model_persona.get_all()}
+            if hasattr(self.model_alias, 'iter_all'):
+                aliases = self.model_alias.iter_all()
+                id_to_cedula = {p.id: p.cedula for p in self.model_persona.iter_all()}
                 for a in aliases:
                     if a.persona_id in id_to_cedula:
                         limpio = str(a.alias_valor).strip()
@@ -111,6 +111,14 @@ class PersistenceService:
             resultado.errores.append("Error Crítico: El curso no existe.")
             return resultado
 
+        # Notas detalladas de todo el lote: se guardan con un solo UPSERT al final.
+        # Clave (matricula_id, evaluacion_curso_id): si la misma matrícula aparece en
+        # varias filas (duplicado o alias), gana la última, como al guardar nota por
+        # nota; PostgreSQL rechaza un ON CONFLICT que toque la misma fila dos veces.
+        calificaciones = {}
+        # matricula_id -> descripción de la fila, para informar errores al guardar notas
+        origen_matricula = {}
+
         for reg in registros:
             try:
                 # --- A. Validación de Centro ---
@@ -139,7 +147,7 @@ class PersistenceService:
                 else:
                     # >>> CAMBIO 1: Actualizar centro del Estudiante si es diferente <<<
                     if hasattr(est, 'centro_id') and est.centro_id != centro.id:
-                        self.model_persona.update(est.id, {"centro_id": centro.id})
+                        self.model_persona.update_fast(est.id, {"centro_id": centro.id})
                         # Actualizamos la referencia local para que la matrícula use el ID correcto si fuera necesario
                         est.centro_id = centro.id
 
@@ -182,7 +190,7 @@ class PersistenceService:
                         "estado": estado_final,
                         "centro_id": centro.id  # <-- Forzamos actualización del centro en la matrícula
                     }
-                    self.model_matricula.update(matricula.id, updates)
+                    self.model_matricula.update_fast(matricula.id, updates)
                     resultado.matriculas_actualizadas += 1
 
                 # --- E. Guardado de Notas Detalladas ---
@@ -190,14 +198,49 @@ class PersistenceService:
                 if estado_final == "NO REALIZO":
                     for d in notas_a_guardar: d.puntaje = 0.0
 
-                self._guardar_calificaciones(matricula.id, notas_a_guardar)
+                origen_matricula[matricula.id] = f"Fila {reg.fila_excel} ({reg.nombre_limpio})"
+                for d in notas_a_guardar:
+                    calificaciones[(matricula.id, d.evaluacion_id)] = {
+                        "matricula_id": matricula.id, "evaluacion_curso_id": d.evaluacion_id, "puntaje": d.puntaje
+                    }
 
             except Exception as e:
                 resultado.errores.append(f"Fila {reg.fila_excel} ({reg.nombre_limpio}): Error crítico BD: {str(e)}")
                 resultado.registros_omitidos += 1
 
+        self._guardar_calificaciones_lote(calificaciones, origen_matricula, resultado)
         return resultado
 
+    def _guardar_calificaciones_lote(self, calificaciones: dict, origen_matricula: dict,
+                                     resultado: ResultadoProceso):
+        """
+        Guarda las notas del lote con un solo UPSERT y, si falla, matrícula por matrícula.
+
+        El reintento aísla la fila problemática: las notas de las demás matrículas
+        se guardan y solo las que fallan se informan en ``resultado.errores``.
+
+        Args:
+            calificaciones (dict): {(matricula_id, evaluacion_curso_id): fila}.
+            origen_matricula (dict): {matricula_id: descripción de la fila del Excel}.
+            resultado (ResultadoProceso): Resumen donde se registran los errores.
+        """
+        try:
+            self.model_calificacion.bulk_upsert(list(calificaciones.values()))
+            return
+        except Exception as e:
+            print(f"UPSERT masivo de notas fallido, reintentando por matrícula: {e}")
+
+        por_matricula = defaultdict(list)
+        for (matricula_id, _), fila in calificaciones.items():
+            por_matricula[matricula_id].append(fila)
+
+        for matricula_id, filas in por_matricula.items():
+            try:
+                self.model_calificacion.bulk_upsert(filas)
+            except Exception as e:
+                origen = origen_matricula.get(matricula_id, matricula_id)
+                resultado.errores.append(f"{origen}: No se guardaron las notas detalladas: {e}")
+
     def _registrar_alias(self, persona_id, alias_val):
         """
         Registra un alias para una cédula si este no existe previamente.
@@ -211,28 +254,4 @@ class PersistenceService:
             if not existe:
                 self.model_alias.create({"alias_valor": alias_val, "persona_id": persona_id})
         except Exception:
-            pass
-
-    def _guardar_calificaciones(self, matricula_id, detalles):
-        """
-        Guarda o actualiza las calificaciones detalladas para una matrícula específica.
-
-        Args:
-            matricula_id: ID de la matrícula asociada.
-            detalles: Lista de objetos con detalle de notas y evaluación.
-        """
-        for det in detalles:
-            try:
-                filtros = {"matricula_id": matricula_id, "evaluacion_curso_id": det.evaluacion_id}
-                existe = self.model_calificacion.search(filters=filtros, first=True)
-                datos = {
-                    "matricula_id": matricula_id,
-                    "evaluacion_curso_id": det.evaluacion_id,
-                    "puntaje": det.puntaje
-                }
-                if existe:
-                    self.model_calificacion.update(existe.id, {"puntaje": det.puntaje})
-                else:
-                    self.model_calificacion.create(datos)
-            except Exception as e:
-                print(f"Error guardando nota {det.evaluacion_id}: {e}")
\ No newline at end of file
+            pass
\ No newline at end of file
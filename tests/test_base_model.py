@@ -0,0 +1,53 @@
+#  Copyright (c) 2026 Fleer
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+
+import unittest
+
+from database import conexion
+from database.conexion import Base
+from models.persona_model import PersonaModel
+
+
+class TestFiltrosBaseCRUD(unittest.TestCase):
+    """Filtros exactos de `BaseCRUDModel` sobre una base SQLite en memoria."""
+
+    @classmethod
+    def setUpClass(cls):
+        conexion.rebuild_engine("sqlite://")
+        Base.metadata.create_all(conexion.engine)
+        with conexion.engine.begin() as conn:
+            conn.exec_driver_sql("PRAGMA foreign_keys=OFF")  # sin centros de prueba
+            conn.exec_driver_sql(
+                "INSERT INTO personas (id, nombre, cedula, rol, activo, centro_id) VALUES "
+                "('A', 'JUAN PÉREZ', '1722222222', 'ESTUDIANTE', 1, 'C'), "
+                "('B', 'ANA LÓPEZ', '1711111111', 'ESTUDIANTE', 1, 'C')"
+            )
+        cls.model = PersonaModel()
+
+    @classmethod
+    def tearDownClass(cls):
+        conexion.rebuild_engine()
+
+    def test_search_con_dos_filtros_usa_cada_valor(self):
+        personas = self.model.search(filters={"cedula": "1722222222", "nombre": "JUAN PÉREZ"})
+        self.assertEqual([p.id for p in personas], ["A"])
+
+        # Misma forma de sentencia (SQL cacheado) con otros valores
+        personas = self.model.search(filters={"cedula": "1711111111", "nombre": "ANA LÓPEZ"})
+        self.assertEqual([p.id for p in personas], ["B"])
+
+    def test_count_con_dos_filtros_usa_cada_valor(self):
+        self.assertEqual(self.model.count(filters={"cedula": "1722222222", "nombre": "JUAN PÉREZ"}), 1)
+        self.assertEqual(self.model.count(filters={"cedula": "1722222222", "nombre": "ANA LÓPEZ"}), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
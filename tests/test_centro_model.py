@@ -0,0 +1,45 @@
+#  Copyright (c) 2026 Fleer
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+
+import unittest
+
+from models.centro_model import CentroModel
+
+
+class TestParsearCentro(unittest.TestCase):
+    """`CentroModel.parsear_centro` conserva las reglas de prefijos y tildes."""
+
+    def assertCentro(self, texto, tipo, ubicacion):
+        self.assertEqual(CentroModel.parsear_centro(texto), {"tipo": tipo, "ubicacion": ubicacion})
+
+    def test_prefijos_completos(self):
+        self.assertCentro("Centro Zonal ECU 911 Quito", "ZONAL", "QUITO")
+        self.assertCentro("centro local ecu 911 Ibarra", "LOCAL", "IBARRA")
+        self.assertCentro("Sala Tulcán", "SALA", "TULCAN")
+
+    def test_prefijo_sin_ecu_911_conserva_el_texto(self):
+        self.assertCentro("CENTRO ZONAL QUITO", "ZONAL", "CENTRO ZONAL QUITO")
+        self.assertCentro("CENTRO LOCAL X", "LOCAL", "CENTRO LOCAL X")
+
+    def test_sala_solo_quita_la_palabra_sala(self):
+        self.assertCentro("SALA ECU 911 X", "SALA", "ECU 911 X")
+
+    def test_enie_y_renombres(self):
+        self.assertCentro("Sala Cañar", "SALA", "CAÑAR")
+        self.assertCentro("Sala San Cristóbal", "SALA", "GALAPAGOS")
+        self.assertCentro("Peñaherrera", "LOCAL", "PEÑAHERRERA")
+
+    def test_texto_vacio(self):
+        self.assertCentro("", "DESCONOCIDO", "DESCONOCIDO")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,19 +20,21 @@ class BotonDetalleDelegate(QStyledItemDelegate):
     de QTableWidget y manejar sus eventos de clic.
     """
 
-    def __init__(self, callback, icon_path: str, columna: int = 0, parent=None):
+    def __init__(self, callback, icon_path: str | None = None, columna: int = 0, parent=None,
+                 icon: QIcon | None = None):
         """
         Inicializa el delegado del botón.
 
         Args:
             callback (callable): Función a ejecutar al hacer clic. Recibe el ID del objeto como argumento.
-            icon_path (str): Ruta al archivo de imagen del icono.
+            icon_path (str, optional): Ruta al archivo de imagen del icono (se ignora si se pasa `icon`).
             columna (int, optional): Índice de la columna donde se dibujará el botón. Por defecto es 0.
             parent (QObject, optional): Objeto padre.
+            icon (QIcon, optional): Icono ya decodificado y compartido entre delegados.
         """
         super().__init__(parent)
         self.callback = callback
-        self.icon = QIcon(icon_path)
+        self.icon = icon if icon is not None else QIcon(icon_path)
         self.columna = columna
 
     def paint(self, painter, option, index):
@@ -162,10 +162,9 @@ class DialogoGenerarCertificados(DialogoBase):
 
         self.combo_plantilla.clear()
         found = False
-        for p in self.plantilla_model.get_all():
-            if p.configuracion_json == "TYPE_WORD":
-                self.combo_plantilla.addItem(f"[WORD] {p.nombre}", p.id)
-                found = True
+        for plantilla_id, nombre in self.plantilla_model.list_word_templates():
+            self.combo_plantilla.addItem(f"[WORD] {nombre}", plantilla_id)
+            found = True
 
         if not found:
             self.combo_plantilla.addItem("⚠️ NO HAY PLANTILLAS", None)
@@ -176,8 +175,8 @@ class DialogoGenerarCertificados(DialogoBase):
             self.btn_preview.setEnabled(True)
 
         self.combo_curso.addItem("-- Seleccione --", None)
-        for c in self.curso_model.search(order_by="nombre"):
-            self.combo_curso.addItem(c.nombre, c.id)
+        for curso_id, nombre in self.curso_model.search_columns(("id", "nombre"), order_by="nombre"):
+            self.combo_curso.addItem(nombre, curso_id)
 
     def on_curso_changed(self):
         cursor_set = False
@@ -123,11 +123,11 @@ class DialogoNotas(QDialog):
     def cargar_cursos(self):
         """Obtiene y lista todos los cursos disponibles en el ComboBox."""
         try:
-            cursos = self.curso_model.search(order_by=self.curso_model.model.nombre)
+            cursos = self.curso_model.search_columns(("id", "nombre"), order_by=self.curso_model.model.nombre)
             self.cb_cursos.clear()
             self.cb_cursos.addItem("-- Seleccione un curso --", None)
-            for c in cursos:
-                self.cb_cursos.addItem(f"{c.nombre}", c.id)
+            for curso_id, nombre in cursos:
+                self.cb_cursos.addItem(f"{nombre}", curso_id)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"No se pudieron cargar los cursos: {e}")
 
@@ -276,20 +276,22 @@ class DialogoNotas(QDialog):
             es_abandono = self.chk_no_realizo.isChecked()
 
             if es_abandono:
-                for eval_id, spin in self.widgets_puntaje.items():
-                    self._guardar_calificacion_individual(eval_id, 0.0)
+                puntajes = {eval_id: 0.0 for eval_id in self.widgets_puntaje}
             else:
+                puntajes = {}
                 lista_notas = []
                 for eval_item in self.esquema_actual:
                     spin = self.widgets_puntaje.get(eval_item.id)
                     if spin:
                         valor = spin.value()
-                        self._guardar_calificacion_individual(eval_item.id, valor)
+                        puntajes[eval_item.id] = valor
                         lista_notas.append({'puntaje': valor, 'peso': eval_item.porcentaje})
 
                 # --- USO DE LÓGICA CENTRALIZADA PARA GUARDADO ---
                 nuevo_promedio = self.matricula_model.calcular_nota_ponderada(lista_notas)
 
+            self._guardar_calificaciones(puntajes)
+
             # Obtener objeto curso completo para evaluar fechas
             curso = self.curso_model.get_by_id(self.matricula_actual.curso_id)
 
@@ -301,7 +303,7 @@ class DialogoNotas(QDialog):
             )
 
             # Actualizar Matrícula
-            self.matricula_model.update(self.matricula_actual.id, {
+            self.matricula_model.update_fast(self.matricula_actual.id, {
                 "nota_final": nuevo_promedio,
                 "estado": nuevo_estado
             })
@@ -316,22 +318,22 @@ class DialogoNotas(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error al guardar: {e}")
 
-    def _guardar_calificacion_individual(self, evaluacion_id, puntaje):
-        """Guarda o actualiza una calificación individual en la BD."""
-        filtros = {
-            "matricula_id": self.matricula_actual.id,
-            "evaluacion_curso_id": evaluacion_id
-        }
-        existe = self.calificacion_model.search(filters=filtros, first=True)
+    def _guardar_calificaciones(self, puntajes: dict):
+        """Guarda o actualiza las calificaciones de la matrícula actual en la BD.
 
-        if existe:
-            self.calificacion_model.update(existe.id, {"puntaje": puntaje})
-        else:
-            self.calificacion_model.create({
+        Un único UPSERT en lote: sin consultar antes qué notas ya existen.
+
+        Args:
+            puntajes (dict): {evaluacion_curso_id: puntaje}.
+        """
+        self.calificacion_model.bulk_upsert([
+            {
                 "matricula_id": self.matricula_actual.id,
                 "evaluacion_curso_id": evaluacion_id,
                 "puntaje": puntaje
-            })
+            }
+            for evaluacion_id, puntaje in puntajes.items()
+        ])
 
     def closeEvent(self, event):
         """Cierra sesión DB al cerrar diálogo."""
@@ -11,6 +11,7 @@
 
 from PyQt6.QtWidgets import (
     QTableWidget,
+    QTableView,
     QHeaderView,
     QAbstractItemView,
     QTableWidgetItem,
@@ -31,7 +32,7 @@ class PyQtHelper:
     # -------------------------------------------------
     @staticmethod
     def configurar_tabla(
-            tabla: QTableWidget,
+            tabla: QTableWidget | QTableView,
             headers: list[str],
             anchos: list[int],
             delegado=None,
@@ -41,8 +42,9 @@ class PyQtHelper:
         Configura el estilo visual y comportamiento base de una tabla.
 
         Args:
-            tabla (QTableWidget): La instancia de la tabla a configurar.
-            headers (list[str]): Lista de títulos para las columnas.
+            tabla (QTableWidget | QTableView): La instancia de la tabla a configurar. Si es un
+                QTableView, el modelo debe estar asignado antes de llamar a este método.
+            headers (list[str]): Lista de títulos para las columnas (solo QTableWidget).
             anchos (list[int]): Lista con el ancho inicial en píxeles para cada columna.
             delegado (QStyledItemDelegate, optional): Delegado para la columna 0 (Legacy).
             columnas_boton (list[int], optional): Índices de columnas que contienen botones interactivos.
@@ -59,8 +61,10 @@ class PyQtHelper:
                     cols_activas.append(0)
 
             # 2. Configuración Visual Base
-            tabla.setColumnCount(len(headers))
-            tabla.setHorizontalHeaderLabels(headers)
+            # En un QTableView los encabezados los provee el modelo (headerData)
+            if isinstance(tabla, QTableWidget):
+                tabla.setColumnCount(len(headers))
+                tabla.setHorizontalHeaderLabels(headers)
 
             tabla.verticalHeader().setVisible(False)
             tabla.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -90,7 +94,9 @@ class PyQtHelper:
                 else:
                     header.setSectionResizeMode(col, QHeaderView.ResizeMode.Stretch)
 
+            # Altura de fila fija: evita medir cada fila al poblar la tabla
             tabla.verticalHeader().setDefaultSectionSize(42)
+            tabla.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
         except Exception as e:
             print(f"Error configurando tabla: {e}")
@@ -101,7 +107,7 @@ class PyQtHelper:
     @staticmethod
     def cargar_datos_en_tabla(
             tabla: QTableWidget,
-            filas: list[list],
+            filas: list[list] | list[tuple],
             id_column: int = 0,
             alineacion: Qt.AlignmentFlag = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
     ):
@@ -110,20 +116,27 @@ class PyQtHelper:
 
         Args:
             tabla (QTableWidget): La tabla donde se cargarán los datos.
-            filas (list[list]): Lista de filas, donde cada fila es una lista de valores.
+            filas (list[list] | list[tuple]): Lista de filas, donde cada fila es una secuencia de
+                valores. Los textos ya formateados (str) se insertan tal cual.
             id_column (int, optional): Índice de la columna en 'filas' que contiene el ID único.
                 Este ID se guarda como UserRole en el ítem de esa columna. Por defecto es 0.
             alineacion (Qt.AlignmentFlag, optional): Alineación del texto en las celdas.
         """
+        ordenamiento_previo = tabla.isSortingEnabled()
         try:
             tabla.setUpdatesEnabled(False)
-            tabla.setRowCount(0)
+            tabla.setSortingEnabled(False)
+            tabla.blockSignals(True)
 
-            for row_idx, fila in enumerate(filas):
-                tabla.insertRow(row_idx)
+            # Filas preasignadas de una vez: sin insertRow (y relayout) por fila
+            tabla.clearContents()
+            tabla.setRowCount(len(filas))
 
+            for row_idx, fila in enumerate(filas):
                 for col_idx, valor in enumerate(fila):
-                    item = QTableWidgetItem("" if valor is None else str(valor))
+                    if not isinstance(valor, str):
+                        valor = "" if valor is None else str(valor)
+                    item = QTableWidgetItem(valor)
                     item.setTextAlignment(alineacion)
 
                     # Guardar ID solo en la columna indicada (generalmente la 0, oculta o botón)
@@ -132,19 +145,21 @@ class PyQtHelper:
                         item.setData(Qt.ItemDataRole.UserRole, fila[id_column])
 
                     tabla.setItem(row_idx, col_idx, item)
-
-            tabla.setUpdatesEnabled(True)
         except Exception as e:
             print(e)
+        finally:
+            tabla.blockSignals(False)
+            tabla.setSortingEnabled(ordenamiento_previo)
+            tabla.setUpdatesEnabled(True)
 
     @staticmethod
-    def habilitar_cursor_boton(tabla: QTableWidget, columnas_boton: list[int]):
+    def habilitar_cursor_boton(tabla: QTableView, columnas_boton: list[int]):
         """
         Instala un filtro de eventos para cambiar el cursor a mano (PointingHand)
         cuando el mouse pasa sobre columnas específicas.
 
         Args:
-            tabla (QTableWidget): La tabla objetivo.
+            tabla (QTableView): La tabla objetivo (QTableWidget o QTableView).
             columnas_boton (list[int]): Lista de índices de columnas interactivas.
         """
         tabla.setMouseTracking(True)
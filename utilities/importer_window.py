@@ -64,8 +64,13 @@ class WorkerProcesamiento(QObject):
             self.persistence.cargar_caches(self.curso.id)
             dict_aliases = self.persistence.obtener_diccionario_aliases()
 
+            # Solo se leen las columnas mapeadas (datos personales + actividades)
+            columnas = None
+            if self.mapa_manual:
+                columnas = list(self.mapa_manual.values()) + list(self.mapa_actividades.keys())
+
             engine = ExcelEngine(self.path)
-            if not engine.cargar():
+            if not engine.cargar(columnas=columnas):
                 self.error.emit("No se pudo leer el archivo Excel.")
                 return
 
@@ -167,7 +172,7 @@ class GestorImportacion:
 
         # 3. Pre-validación Columnas
         engine_pre = ExcelEngine(archivo)
-        if not engine_pre.cargar():
+        if not engine_pre.cargar(solo_encabezados=True):
             QMessageBox.critical(self.parent, "Error", "Archivo corrupto.")
             return
 
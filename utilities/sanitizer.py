@@ -8,10 +8,39 @@
 #
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
+import re
 import unicodedata
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from typing import Any
 
+# Marcas diacríticas sin espacio (categoría Unicode "Mn") del plano básico, en una
+# sola clase de caracteres: un único patrón compilado elimina todas las tildes.
+_MARCAS_PATRON = "[" + "".join(
+    chr(c) for c in range(0x10000) if unicodedata.category(chr(c)) == "Mn"
+) + "]"
+_MARCAS_RE = re.compile(_MARCAS_PATRON)
+
+
+@lru_cache(maxsize=4096)
+def _quitar_tildes_mayus(txt: str) -> str:
+    """Elimina tildes conservando la Ñ y convierte a mayúsculas (memorizado).
+
+    Los archivos importados repiten mucho los mismos valores (centros, instituciones,
+    encabezados), por lo que la normalización Unicode se calcula una sola vez por texto.
+    """
+    # Protección de la Ñ
+    txt = txt.replace("ñ", "__ENYE__").replace("Ñ", "__ENYE_MAYUS__")
+
+    # Normalización unicode (eliminar tildes)
+    txt = _MARCAS_RE.sub("", unicodedata.normalize("NFD", txt))
+
+    # Restauración de la Ñ y mayúsculas
+    txt = txt.replace("__ENYE__", "ñ").replace("__ENYE_MAYUS__", "Ñ")
+    return txt.upper()
+
+
 class Sanitizer:
     """Clase utilitaria estática para limpieza y validación de datos."""
 
@@ -30,17 +59,37 @@ class Sanitizer:
         if pd.isna(texto) or str(texto).strip() == "":
             return ""
 
-        txt = str(texto).strip()
-        # Protección de la Ñ
-        txt = txt.replace("ñ", "__ENYE__").replace("Ñ", "__ENYE_MAYUS__")
+        return _quitar_tildes_mayus(str(texto).strip())
+
+    @staticmethod
+    def limpiar_texto_series(serie: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de `limpiar_texto` para una columna completa.
+
+        Aplica las mismas reglas (recortar, quitar tildes conservando la Ñ y pasar a
+        mayúsculas) con los métodos `.str` de pandas y el patrón precompilado de
+        marcas diacríticas. Las celdas vacías quedan como "".
+
+        Args:
+            serie (pd.Series): Columna cruda de textos.
 
-        # Normalización unicode (eliminar tildes)
-        txt = unicodedata.normalize("NFD", txt)
-        txt = "".join(c for c in txt if unicodedata.category(c) != "Mn")
+        Returns:
+            pd.Series: Textos limpios y en mayúsculas (dtype string).
+        """
+        if not isinstance(serie.dtype, pd.StringDtype):
+            serie = serie.astype("string")
+        return (
+            serie.str.strip()
+            .str.replace("ñ", "__ENYE__", regex=False)
+            .str.replace("Ñ", "__ENYE_MAYUS__", regex=False)
+            .str.normalize("NFD")
+            .str.replace(_MARCAS_PATRON, "", regex=True)
+            .str.replace("__ENYE__", "ñ", regex=False)
+            .str.replace("__ENYE_MAYUS__", "Ñ", regex=False)
+            .str.upper()
+            .fillna("")
+        )
 
-        # Restauración de la Ñ y mayúsculas
-        txt = txt.replace("__ENYE__", "ñ").replace("__ENYE_MAYUS__", "Ñ")
-        return txt.upper()
     @staticmethod
     def casi_limpio(texto: Any) -> str:
         """
@@ -56,19 +105,7 @@ class Sanitizer:
         if pd.isna(texto) or str(texto).strip() == "":
             return ""
 
-        txt = str(texto)
-
-        # Proteger la Ñ
-        txt = txt.replace("ñ", "__ENYE__").replace("Ñ", "__ENYE_MAYUS__")
-
-        # Normalización unicode (elimina tildes)
-        txt = unicodedata.normalize("NFD", txt)
-        txt = "".join(c for c in txt if unicodedata.category(c) != "Mn")
-
-        # Restaurar Ñ y forzar mayúsculas
-        txt = txt.replace("__ENYE__", "ñ").replace("__ENYE_MAYUS__", "Ñ")
-
-        return txt.upper()
+        return _quitar_tildes_mayus(str(texto))
     @staticmethod
     def limpiar_cedula(valor: Any) -> str:
         """
@@ -86,6 +123,33 @@ class Sanitizer:
         c = str(valor).strip().replace('.0', '')
         return c.replace('-', '').replace('.', '').replace(',', '')
 
+    @staticmethod
+    def limpiar_cedula_series(serie: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de `limpiar_cedula` para una columna completa.
+
+        Aplica exactamente las mismas reglas (quitar '.0', puntos, guiones y comas)
+        con los métodos `.str` de pandas. Las celdas vacías quedan como "". Si la
+        columna ya es de tipo cadena (p. ej. `string[pyarrow]`) se conserva ese tipo.
+
+        Args:
+            serie (pd.Series): Columna cruda de cédulas.
+
+        Returns:
+            pd.Series: Cédulas limpias (mismo tipo de cadena de entrada, u object).
+        """
+        vacias = serie.isna()
+        if not isinstance(serie.dtype, pd.StringDtype):
+            serie = serie.astype(str)
+        limpias = (
+            serie
+            .str.strip()
+            .str.replace('.0', '', regex=False)
+            .str.replace(r'[-.,]', '', regex=True)
+        )
+        limpias[vacias] = ""
+        return limpias
+
     @staticmethod
     def limpiar_nota(valor: Any) -> float:
         """
@@ -106,6 +170,26 @@ class Sanitizer:
         except ValueError:
             return 0.0
 
+    @staticmethod
+    def limpiar_notas_df(df_notas: pd.DataFrame) -> np.ndarray:
+        """
+        Versión vectorizada de `limpiar_nota` para un bloque de columnas de notas.
+
+        Recorta espacios, acepta coma decimal y trata "-", "", "nan" y "None" como
+        celdas vacías, todo con operaciones `.str` por columna.
+
+        Args:
+            df_notas (pd.DataFrame): Columnas crudas de actividades.
+
+        Returns:
+            np.ndarray: Matriz float64 (N, K); NaN en celdas vacías o no numéricas.
+        """
+        texto = df_notas.astype("string").apply(
+            lambda col: col.str.strip().str.replace(',', '.', regex=False)
+        )
+        texto = texto.replace({"-": pd.NA, "": pd.NA, "nan": pd.NA, "None": pd.NA})
+        return texto.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
     @staticmethod
     def validar_cedula_ecuador(cedula: str) -> bool:
         """
@@ -138,4 +222,42 @@ class Sanitizer:
         residuo = total % 10
         esperado = 0 if residuo == 0 else 10 - residuo
 
-        return digito_verificador == esperado
\ No newline at end of file
+        return digito_verificador == esperado
+
+    # Coeficientes del Módulo 10 para los 9 primeros dígitos
+    _COEFICIENTES_CEDULA = np.array([2, 1, 2, 1, 2, 1, 2, 1, 2], dtype=np.int16)
+
+    @staticmethod
+    def validar_cedula_ecuador_vec(serie: pd.Series) -> np.ndarray:
+        """
+        Versión vectorizada de `validar_cedula_ecuador` para una columna completa.
+
+        Las cédulas con 10 dígitos se convierten a una matriz (N, 10) de enteros y el
+        código de provincia y el dígito verificador se evalúan con NumPy en bloque.
+
+        Args:
+            serie (pd.Series): Cédulas ya limpias (str).
+
+        Returns:
+            np.ndarray: Arreglo booleano, True donde la cédula es válida.
+        """
+        resultado = np.zeros(len(serie), dtype=bool)
+        candidatas = serie.astype(str).str.fullmatch(r"[0-9]{10}").to_numpy(dtype=bool)
+        if not candidatas.any():
+            return resultado
+
+        bytes_ced = serie[candidatas].to_numpy(dtype="S10")
+        d = np.frombuffer(bytes_ced.tobytes(), dtype=np.uint8).reshape(-1, 10).astype(np.int16) - ord("0")
+
+        # Código de provincia (01 al 24, o 30)
+        provincia = d[:, 0] * 10 + d[:, 1]
+        provincia_ok = ((provincia >= 1) & (provincia <= 24)) | (provincia == 30)
+
+        # Algoritmo Módulo 10
+        productos = d[:, :9] * Sanitizer._COEFICIENTES_CEDULA
+        productos = np.where(productos >= 10, productos - 9, productos)
+        residuo = productos.sum(axis=1) % 10
+        esperado = np.where(residuo == 0, 0, 10 - residuo)
+
+        resultado[candidatas] = provincia_ok & (esperado == d[:, 9])
+        return resultado
@@ -9,6 +9,9 @@
 #  The above copyright notice and this permission notice shall be included in all
 #  copies or substantial portions of the Software.
 
+import os
+import time
+
 import ulid
 
 
@@ -19,4 +22,22 @@ def generar_uid() -> str:
     Returns:
         str: Cadena ULID de 26 caracteres.
     """
-    return str(ulid.new())
\ No newline at end of file
+    return str(ulid.new())
+
+
+def generar_uids(n: int) -> list[str]:
+    """
+    Genera ``n`` ULID en una sola pasada para inserciones masivas.
+
+    Toma la marca de tiempo una vez y la aleatoriedad de todos los IDs en una
+    única lectura de ``os.urandom``, en lugar de repetir ambas por cada fila.
+
+    Args:
+        n (int): Cantidad de identificadores a generar.
+
+    Returns:
+        list[str]: Lista de cadenas ULID de 26 caracteres.
+    """
+    marca = int(time.time() * 1000).to_bytes(6, "big")
+    aleatorio = os.urandom(10 * n)
+    return [str(ulid.from_bytes(marca + aleatorio[i:i + 10])) for i in range(0, 10 * n, 10)]